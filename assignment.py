@@ -0,0 +1,261 @@
+import heapq
+from typing import List, Dict, Optional, Tuple
+
+COVERAGE_BONUS = 10 ** 9  # Outweighs any score difference: cover as many missions as possible first
+SEARCH_NODE_LIMIT = 2000  # Branch and bound nodes before optimal_mission_assignment settles for the best found
+
+
+def capacitated_assignment(costs: List[Dict[int, int]], capacities: List[int]) -> List[Optional[int]]:
+    """
+    Minimum-cost assignment of rows to columns, where column j takes up to capacities[j] rows. costs[row] maps
+    the allowed columns to their cost; a row may also stay unassigned at cost 0. Returns the column of each
+    row (None = unassigned).
+
+    This is the Hungarian method on the transportation form of the problem: rows are inserted one at a time
+    along a shortest augmenting path (Dijkstra over reduced costs, with node potentials). A column with
+    capacity k behaves exactly like k copies of it, but is searched as a single node, so one search visits at
+    most the columns and the rows already placed in them.
+    """
+    rows = len(costs)
+    columns = len(capacities)
+    sink = rows + columns  # Node ids: rows, then columns, then the sink
+    infinity = float('inf')
+    edges = [[(rows + column, cost) for column, cost in row_costs.items()] for row_costs in costs]
+
+    # Initial potentials keep every reduced cost non-negative: a column starts at its cheapest row cost
+    potential = [0] * (sink + 1)
+    for row_costs in costs:
+        for column, cost in row_costs.items():
+            potential[rows + column] = min(potential[rows + column], cost)
+    potential[sink] = min(potential[rows:sink], default=0)
+
+    node_of_row = [sink] * rows  # Column node holding each row (the sink = unassigned)
+    members = [set() for _ in range(columns)]  # Rows placed in each column
+
+    for row in range(rows):
+        distance = {row: 0}
+        parent = {}
+        heap = [(0, 1, row)]  # (distance, 0 for the sink so it wins ties, node)
+        while heap:
+            dist, _, node = heapq.heappop(heap)
+            if dist > distance[node]:
+                continue  # Stale entry
+            if node == sink:
+                break
+
+            base = dist + potential[node]
+            if node < rows:
+                # Move this row into another column, or leave it unassigned
+                current = node_of_row[node]
+                for target, cost in edges[node]:
+                    candidate = base + cost - potential[target]
+                    if candidate < distance.get(target, infinity) and target != current:
+                        distance[target] = candidate
+                        parent[target] = node
+                        heapq.heappush(heap, (candidate, 1, target))
+                candidate = base - potential[sink]
+            else:
+                # Push out a row already placed here, or take a free slot
+                column = node - rows
+                for member in members[column]:
+                    candidate = base - costs[member][column] - potential[member]
+                    if candidate < distance.get(member, infinity):
+                        distance[member] = candidate
+                        parent[member] = node
+                        heapq.heappush(heap, (candidate, 1, member))
+                if len(members[column]) >= capacities[column]:
+                    continue
+                candidate = base - potential[sink]
+            if candidate < distance.get(sink, infinity):
+                distance[sink] = candidate
+                parent[sink] = node
+                heapq.heappush(heap, (candidate, 0, sink))
+
+        # Shift potentials by the distances (capped at the sink's) so reduced costs stay non-negative. Only
+        # differences of potentials matter, so the nodes the search did not get closer than the sink keep theirs.
+        reached = distance[sink]
+        for node, dist in distance.items():
+            if dist < reached:
+                potential[node] += dist - reached
+
+        # Augment: walk the path back from the sink
+        node = sink
+        while node != row:
+            previous = parent[node]
+            if previous < rows:  # A row moves into a column (or out of all of them, at the sink)
+                node_of_row[previous] = node
+                if node != sink:
+                    members[node - rows].add(previous)
+            elif node != sink:  # A row is pushed out of a column
+                members[previous - rows].discard(node)
+            node = previous
+
+    column_of_row = [node - rows if node != sink else None for node in node_of_row]
+    return column_of_row
+
+
+def optimal_mission_assignment(missions: List, platoons: List, get_capability,
+                               max_missions_per_platoon: Optional[int] = None,
+                               node_limit: int = SEARCH_NODE_LIMIT) -> Dict:
+    """
+    Assign missions to platoons, first covering as many missions as possible, then maximizing the total score.
+
+    Pairs score like the greedy assignment (soldier count + 2 per authorization holder). A platoon takes
+    missions while their daily personnel fits its soldiers (at most max_missions_per_platoon, if set), which
+    makes the problem a multiple knapsack. It is solved in three steps:
+    - a weighted bipartite matching (capacitated_assignment) with capacities from an upper bound - how many
+      capable missions fit a platoon's soldiers, smallest first. It ignores how the chosen missions add up, so
+      its value bounds every assignment; if it fits every platoon's personnel it is optimal as it stands;
+    - otherwise a repair: overcommitted platoons keep their smallest missions, and left-over missions go,
+      smallest first, to the best capable platoon with enough personnel to spare;
+    - then a branch and bound search over the personnel budgets, starting from the repaired assignment.
+    The search is exact when it finishes within node_limit nodes; otherwise the best assignment found so far
+    is returned, which is never worse than the repaired one. The result has the same format as
+    Company.optimize_weekly_schedule.
+    """
+    result = {
+        'assignments': {},
+        'conflicts': [],
+        'recommendations': []
+    }
+
+    scores = []  # Mission -> {platoon index: score}, capable platoons only
+    for mission in missions:
+        row_scores = {}
+        for index, platoon in enumerate(platoons):
+            capability = get_capability(mission, platoon)
+            if capability['can_fulfill']:
+                row_scores[index] = platoon.get_soldier_count() + 2 * sum(capability['details'].values())
+        scores.append(row_scores)
+    sizes = [mission.daily_personnel for mission in missions]
+    budgets = [platoon.get_soldier_count() for platoon in platoons]
+    limits = [len(missions) if max_missions_per_platoon is None else max_missions_per_platoon
+              for _ in platoons]
+
+    # Capacity: at most as many capable missions as the platoon's soldiers can staff, smallest first
+    capacities = []
+    for index, budget in enumerate(budgets):
+        capable_sizes = sorted(size for size, row_scores in zip(sizes, scores) if index in row_scores)
+        capacities.append(min(_staffable_count(capable_sizes, budget), limits[index]))
+
+    costs = [{index: -COVERAGE_BONUS - score for index, score in row_scores.items()} for row_scores in scores]
+    columns = capacitated_assignment(costs, capacities)
+    bound = _assignment_value(columns, scores)
+    columns = _repair_assignment(columns, sizes, scores, budgets, limits)
+    if _assignment_value(columns, scores) < bound:
+        columns = _search_assignment(columns, sizes, scores, budgets, limits, bound, node_limit)
+
+    for mission, column in zip(missions, columns):
+        if column is not None:
+            result['assignments'][mission.name] = platoons[column].name
+        else:
+            result['conflicts'].append({
+                'mission': mission.name,
+                'issue': 'No capable platoon available'
+            })
+
+    return result
+
+
+def _assignment_value(columns: List[Optional[int]], scores: List[Dict[int, int]]) -> Tuple[int, int]:
+    """(missions covered, total score) - compared as a tuple, coverage first"""
+    covered = [scores[mission][column] for mission, column in enumerate(columns) if column is not None]
+    return len(covered), sum(covered)
+
+
+def _repair_assignment(columns: List[Optional[int]], sizes: List[int], scores: List[Dict[int, int]],
+                       budgets: List[int], limits: List[int]) -> List[Optional[int]]:
+    """Make an assignment fit the personnel budgets: drop the largest missions, then place left-overs"""
+    columns = list(columns)
+    spare = list(budgets)
+    counts = [0] * len(budgets)
+    for mission in sorted(range(len(columns)), key=lambda mission: sizes[mission]):
+        column = columns[mission]
+        if column is None:
+            continue
+        if sizes[mission] > spare[column]:
+            columns[mission] = None
+            continue
+        spare[column] -= sizes[mission]
+        counts[column] += 1
+
+    for mission in sorted(range(len(columns)), key=lambda mission: sizes[mission]):
+        if columns[mission] is not None:
+            continue
+        fitting = [(score, column) for column, score in scores[mission].items()
+                   if sizes[mission] <= spare[column] and counts[column] < limits[column]]
+        if fitting:
+            _, column = max(fitting)
+            columns[mission] = column
+            spare[column] -= sizes[mission]
+            counts[column] += 1
+    return columns
+
+
+def _search_assignment(incumbent: List[Optional[int]], sizes: List[int], scores: List[Dict[int, int]],
+                       budgets: List[int], limits: List[int], bound: Tuple[int, int],
+                       node_limit: int) -> List[Optional[int]]:
+    """
+    Depth-first branch and bound over the missions, largest first: each mission goes to a capable platoon
+    with enough personnel to spare, or stays uncovered. A branch is cut when even covering every remaining
+    mission that still fits somewhere (no more of them than the spare personnel allows, smallest first) at its
+    best score cannot beat the best assignment found, and the search stops once the best reaches the bound of
+    the matching.
+    """
+    order = sorted((mission for mission in range(len(sizes)) if scores[mission]),
+                   key=lambda mission: (-sizes[mission], len(scores[mission])))
+    options = {mission: sorted(scores[mission], key=lambda column: -scores[mission][column]) for mission in order}
+    spare = list(budgets)
+    counts = [0] * len(budgets)
+    columns = [None] * len(sizes)
+    best = [_assignment_value(incumbent, scores), list(incumbent)]
+    nodes = 0
+
+    def upper_bound(position: int, covered: int, score: int) -> Tuple[int, int]:
+        open_columns = [column for column in range(len(spare)) if counts[column] < limits[column]]
+        fitting = []
+        for mission in order[position:]:
+            size = sizes[mission]
+            for column in options[mission]:  # Best score first
+                if size <= spare[column] and counts[column] < limits[column]:
+                    fitting.append(size)
+                    score += scores[mission][column]
+                    break
+        return covered + _staffable_count(sorted(fitting), sum(spare[column] for column in open_columns)), score
+
+    def search(position: int, covered: int, score: int):
+        nonlocal nodes
+        nodes += 1
+        if position == len(order):
+            if (covered, score) > best[0]:
+                best[0], best[1] = (covered, score), list(columns)
+            return
+        if nodes > node_limit or best[0] >= bound or upper_bound(position, covered, score) <= best[0]:
+            return
+
+        mission = order[position]
+        for column in options[mission]:
+            if sizes[mission] > spare[column] or counts[column] >= limits[column]:
+                continue
+            spare[column] -= sizes[mission]
+            counts[column] += 1
+            columns[mission] = column
+            search(position + 1, covered + 1, score + scores[mission][column])
+            columns[mission] = None
+            counts[column] -= 1
+            spare[column] += sizes[mission]
+        search(position + 1, covered, score)
+
+    search(0, 0, 0)
+    return best[1]
+
+
+def _staffable_count(sizes: List[int], soldiers: int) -> int:
+    """How many of the (ascending) mission sizes fit into a number of soldiers, smallest first"""
+    count = 0
+    for size in sizes:
+        soldiers -= size
+        if soldiers < 0:
+            break
+        count += 1
+    return count
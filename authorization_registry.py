@@ -0,0 +1,67 @@
+from typing import List, Dict, Iterable, Optional
+
+
+class AuthorizationRegistry:
+    """
+    Maps authorization names to bit positions so a set of authorizations can be stored as one integer mask
+    """
+
+    def __init__(self, authorizations: Optional[Iterable[str]] = None):
+        self._bits = {}  # Authorization name -> bit position
+        self._names = []  # Bit position -> authorization name
+
+        # System authorizations get the lowest bits, in file order
+        for authorization in authorizations or []:
+            self.register(authorization)
+
+    def register(self, authorization: str) -> int:
+        """Return the bit position of an authorization, registering it if it is new"""
+        bit = self._bits.get(authorization)
+        if bit is None:
+            bit = len(self._names)
+            self._bits[authorization] = bit
+            self._names.append(authorization)
+        return bit
+
+    def get_bit(self, authorization: str) -> Optional[int]:
+        """Get the bit position of a registered authorization (None if unknown)"""
+        return self._bits.get(authorization)
+
+    def get_name(self, bit: int) -> str:
+        """Get the authorization name stored at a bit position"""
+        return self._names[bit]
+
+    def mask_for(self, authorizations: Iterable[str]) -> int:
+        """Build the mask for a list of authorizations, registering unknown ones"""
+        mask = 0
+        for authorization in authorizations:
+            mask |= 1 << self.register(authorization)
+        return mask
+
+    def names_for(self, mask: int) -> List[str]:
+        """Decode a mask back into authorization names (in bit order)"""
+        names = []
+        bit = 0
+        while mask:
+            if mask & 1:
+                names.append(self._names[bit])
+            mask >>= 1
+            bit += 1
+        return names
+
+    def get_authorizations(self) -> List[str]:
+        """Get all registered authorizations in bit order"""
+        return list(self._names)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert registry to a name -> bit dictionary"""
+        return dict(self._bits)
+
+    def __contains__(self, authorization: str) -> bool:
+        return authorization in self._bits
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"AuthorizationRegistry(authorizations={len(self._names)})"
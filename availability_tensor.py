@@ -0,0 +1,75 @@
+from typing import List, Optional
+from soldier import Soldier, WEEK_DAYS
+from roster_columns import RosterColumns
+
+# Soft weight of an available soldier working outside the preferred shift (preferred shift = 1.0)
+OFF_PREFERENCE_WEIGHT = 0.5
+
+
+class AvailabilityTensor:
+    """
+    Compiled availability of a roster as a days x shifts x soldiers boolean tensor.
+
+    Each (day, shift) cell is a row bitset over the RosterColumns rows (bit i set = row i can work), combining
+    soldier home time constraints and platoon home days. A parallel tensor marks the available soldiers who
+    prefer that shift, which gives the soft preference weights. Lookups are AND + popcount over whole cells
+    instead of dict checks per soldier. The tensor is a snapshot: Company rebuilds it after model edits.
+    """
+
+    def __init__(self, columns: RosterColumns, shifts: Optional[List[str]] = None):
+        self.columns = columns
+        self.days = list(WEEK_DAYS)
+        self.shifts = list(shifts or [])
+        for shift in columns.shift_names:
+            if shift not in self.shifts:
+                self.shifts.append(shift)
+
+        shift_bits = [columns.shift_rows(shift) for shift in self.shifts]
+        self.available = []  # Day -> shift -> rows able to work
+        self.preferred = []  # Day -> shift -> available rows preferring the shift
+        for day_index in range(len(self.days)):
+            rows = columns.day_bits[day_index] & columns.live_bits
+            self.available.append([rows] * len(self.shifts))
+            self.preferred.append([rows & bits for bits in shift_bits])
+
+    def _cell(self, tensor: List[List[int]], day: str, shift: str) -> int:
+        if day not in self.days:
+            return 0
+        day_cells = tensor[self.days.index(day)]
+        if shift in self.shifts:
+            return day_cells[self.shifts.index(shift)]
+        # Unknown shift: hard availability does not depend on the shift, nobody prefers it
+        return self.columns.day_bits[self.days.index(day)] & self.columns.live_bits if tensor is self.available else 0
+
+    def get_rows(self, day: str, shift: str, rows: Optional[int] = None) -> int:
+        """Bitset of the rows available on a day and shift (optionally within a row subset)"""
+        cell = self._cell(self.available, day, shift)
+        return cell if rows is None else cell & rows
+
+    def get_preferred_rows(self, day: str, shift: str, rows: Optional[int] = None) -> int:
+        """Bitset of the available rows preferring the shift"""
+        cell = self._cell(self.preferred, day, shift)
+        return cell if rows is None else cell & rows
+
+    def count_available(self, day: str, shift: str, rows: Optional[int] = None) -> int:
+        """Number of soldiers available on a day and shift"""
+        return self.get_rows(day, shift, rows).bit_count()
+
+    def is_available(self, soldier: Soldier, day: str, shift: str) -> bool:
+        """Check a single soldier"""
+        row = self.columns.row_of(soldier)
+        return row is not None and bool(self.get_rows(day, shift) >> row & 1)
+
+    def get_weight(self, soldier: Soldier, day: str, shift: str) -> float:
+        """Soft weight of a soldier for a slot: 0 if unavailable, 1 on the preferred shift, less otherwise"""
+        row = self.columns.row_of(soldier)
+        if row is None or not self.get_rows(day, shift) >> row & 1:
+            return 0.0
+        return 1.0 if self.get_preferred_rows(day, shift) >> row & 1 else OFF_PREFERENCE_WEIGHT
+
+    def get_available_soldiers(self, day: str, shift: str, rows: Optional[int] = None) -> List[Soldier]:
+        """Soldiers available on a day and shift (in row order)"""
+        return self.columns.soldiers_in(self.get_rows(day, shift, rows))
+
+    def __repr__(self):
+        return f"AvailabilityTensor(days={len(self.days)}, shifts={len(self.shifts)}, soldiers={len(self.columns)})"
@@ -0,0 +1,69 @@
+from typing import List, Dict, Optional
+from mission import Mission
+from platoon import Platoon
+
+
+class CapabilityMatrix:
+    """
+    Cached mission x platoon capability results (Platoon.can_fulfill_mission) with dirty tracking.
+
+    Cells are stored row-wise per platoon. A roster change drops the affected row, a mission change drops its
+    column, and an authorization change only drops the cells of missions that require that authorization.
+    Dropped cells are recomputed on the next read.
+    """
+
+    def __init__(self):
+        self._rows = {}  # Platoon -> {Mission: can_fulfill_mission() result}
+        self.recomputed_cells = 0  # Number of cells computed so far (for diagnostics)
+
+    def get(self, mission: Mission, platoon: Platoon) -> Dict:
+        """Get the capability result of a platoon for a mission (cached - treat as read-only)"""
+        row = self._rows.get(platoon)
+        if row is None:
+            row = self._rows[platoon] = {}
+        cell = row.get(mission)
+        if cell is None:
+            cell = row[mission] = platoon.can_fulfill_mission(mission)
+            self.recomputed_cells += 1
+        return cell
+
+    def can_fulfill(self, mission: Mission, platoon: Platoon) -> bool:
+        """Check if a platoon can fulfill a mission"""
+        return self.get(mission, platoon)['can_fulfill']
+
+    def get_capable_platoons(self, mission: Mission, platoons: List[Platoon]) -> List[Platoon]:
+        """Get the platoons (in the given order) able to fulfill a mission"""
+        return [platoon for platoon in platoons if self.get(mission, platoon)['can_fulfill']]
+
+    def get_authorization_counts(self, mission: Mission, platoon: Platoon) -> Dict[str, int]:
+        """Get the number of holders of each required authorization of a mission in a platoon"""
+        return self.get(mission, platoon)['details']
+
+    def invalidate_platoon(self, platoon: Platoon):
+        """Drop a whole row (soldiers joined or left the platoon)"""
+        self._rows.pop(platoon, None)
+
+    def invalidate_mission(self, mission: Mission):
+        """Drop a whole column (the mission's requirements changed)"""
+        for row in self._rows.values():
+            row.pop(mission, None)
+
+    def invalidate_authorization(self, platoon: Optional[Platoon], authorization: str):
+        """Drop the cells of a platoon whose mission requires an authorization that changed"""
+        row = self._rows.get(platoon)
+        if row:
+            for mission in [mission for mission in row if authorization in mission.required_authorizations]:
+                del row[mission]
+
+    def clear(self):
+        """Drop every cell"""
+        self._rows.clear()
+
+    def to_dict(self, missions: List[Mission], platoons: List[Platoon]) -> Dict[str, Dict[str, Dict]]:
+        """Get the full matrix as mission name -> platoon name -> capability result"""
+        return {mission.name: {platoon.name: self.get(mission, platoon) for platoon in platoons}
+                for mission in missions}
+
+    def __repr__(self):
+        cells = sum(len(row) for row in self._rows.values())
+        return f"CapabilityMatrix(cached_cells={cells})"
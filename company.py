@@ -1,7 +1,23 @@
 from typing import List, Dict, Optional
 from platoon import Platoon
 from mission import Mission
-from soldier import Soldier
+from soldier import Soldier, WEEK_DAYS
+from authorization_registry import AuthorizationRegistry
+from roster_columns import RosterColumns
+from availability_tensor import AvailabilityTensor
+from capability_matrix import CapabilityMatrix
+from scheduler import ScheduleProblem, WeeklyRoster, solve_weekly_roster
+from roster_search import AnytimeRosterSearch, parallel_roster_search
+from roster_repair import RosterRepair
+from rotation_planner import RotationPlanner
+from workload_ledger import WorkloadLedger
+from scenario import Scenario
+from schedule_cache import ScheduleCache, schedule_fingerprint
+from assignment import optimal_mission_assignment
+from pooled_staffing import PooledStaffing
+from feasibility import find_capacity_shortfalls
+from infeasibility import explain_infeasibility
+from failure_analysis import find_company_bottlenecks, find_platoon_bottlenecks
 
 
 class Company:
@@ -14,17 +30,58 @@ class Company:
         self.platoons = []  # List of Platoon objects
         self.missions = []  # List of all available Mission objects
         self.weekly_assignments = {}  # Week-based mission assignments
+        self.workload_ledger = WorkloadLedger()  # Cumulative hours / night shifts per soldier across weeks
         self.company_policies = {}  # Company-wide policies and constraints
+        self._soldiers_by_serial = {}  # Serial number -> Soldier index across all platoons
+        self._soldiers_by_authorization = {}  # Authorization -> set of Soldiers across all platoons
+        self.authorization_registry = None  # AuthorizationRegistry once compact masks are enabled
+        self._roster_columns = None  # RosterColumns view, built on first use and then kept in sync
+        self._capability = CapabilityMatrix()  # Cached mission x platoon capability results
+        self._availability = None  # AvailabilityTensor snapshot, rebuilt when _revision moves
+        self._availability_revision = -1
+        self.schedule_cache = None  # ScheduleCache for solver results (opt-in, see enable_schedule_cache)
+        self._fingerprints = {}  # Week -> (revision, schedule fingerprint)
+
+        # Change tracking for cached views (statistics, ...)
+        self._revision = 0  # Bumped on every model change
+        self._dirty_platoons = set()  # Platoons changed since the statistics were last read
+        self._dirty_missions = set()  # Missions changed since the statistics were last read
+        self._statistics = None  # Last get_company_statistics() result (None = rebuild everything)
+        self._statistics_revision = -1
+        self._platoon_statistics = {}  # Platoon -> cached 'platoon_details' entry
+        self._mission_statistics = {}  # Mission -> cached 'mission_coverage' entry
 
     def add_platoon(self, platoon: Platoon):
-        """Add a platoon to the company"""
+        """Add a platoon to the company (raises ValueError if it brings a duplicate serial number)"""
         if platoon not in self.platoons:
+            for soldier in platoon.soldiers:
+                existing = self._soldiers_by_serial.get(soldier.serial_number)
+                if existing is not None and existing is not soldier:
+                    raise ValueError(f"Serial number {soldier.serial_number} is already assigned to {existing.name}")
+
             self.platoons.append(platoon)
+            platoon._company = self
+            for soldier in platoon.soldiers:
+                self._index_soldier(soldier)
+                if self.authorization_registry is not None:
+                    soldier.attach_registry(self.authorization_registry)
+                if self._roster_columns is not None:
+                    self._roster_columns.add_soldier(soldier)
+            self._capability.invalidate_platoon(platoon)
+            self._touch(structure=True)
 
     def remove_platoon(self, platoon: Platoon):
         """Remove a platoon from the company"""
         if platoon in self.platoons:
             self.platoons.remove(platoon)
+            for soldier in platoon.soldiers:
+                self._unindex_soldier(soldier)
+            # Platoon ids in the column view are append-only - rebuild it without the platoon
+            self._roster_columns = None
+            if platoon._company is self:
+                platoon._company = None
+            self._capability.invalidate_platoon(platoon)
+            self._touch(structure=True)
 
     def get_platoon_by_name(self, name: str) -> Optional[Platoon]:
         """Find a platoon by name"""
@@ -37,11 +94,19 @@ class Company:
         """Add a mission to the company's mission list"""
         if mission not in self.missions:
             self.missions.append(mission)
+            mission._company = self
+            if self.authorization_registry is not None:
+                mission.attach_registry(self.authorization_registry)
+            self._touch(structure=True)
 
     def remove_mission(self, mission: Mission):
         """Remove a mission from the company"""
         if mission in self.missions:
             self.missions.remove(mission)
+            if mission._company is self:
+                mission._company = None
+            self._capability.invalidate_mission(mission)
+            self._touch(structure=True)
             # Also remove from all platoon assignments
             for platoon in self.platoons:
                 platoon.unassign_mission(mission)
@@ -62,7 +127,7 @@ class Company:
             return False
 
         # Check if platoon can fulfill the mission
-        capability_check = platoon.can_fulfill_mission(mission)
+        capability_check = self.get_mission_capability(mission, platoon)
         if not capability_check['can_fulfill']:
             return False
 
@@ -81,6 +146,14 @@ class Company:
 
         return True
 
+    def get_mission_capability(self, mission: Mission, platoon: Platoon) -> Dict:
+        """Get platoon.can_fulfill_mission(mission) from the capability matrix (cached - treat as read-only)"""
+        return self._capability.get(mission, platoon)
+
+    def get_capability_matrix(self) -> Dict[str, Dict[str, Dict]]:
+        """Get mission name -> platoon name -> capability result, including per-authorization holder counts"""
+        return self._capability.to_dict(self.missions, self.platoons)
+
     def get_all_soldiers(self) -> List[Soldier]:
         """Get all soldiers from all platoons"""
         all_soldiers = []
@@ -90,54 +163,249 @@ class Company:
 
     def get_soldier_by_serial(self, serial_number: str) -> Optional[Soldier]:
         """Find a soldier by serial number across all platoons"""
+        return self._soldiers_by_serial.get(serial_number)
+
+    def remove_soldier(self, soldier: Soldier) -> bool:
+        """Remove a soldier from whichever company platoon holds it"""
+        platoon = soldier._platoon
+        if platoon is None or platoon._company is not self:
+            return False
+        platoon.remove_soldier(soldier)
+        return True
+
+    def enable_authorization_masks(self, system_authorizations: Optional[List[str]] = None) -> AuthorizationRegistry:
+        """Switch to compact mode: every soldier and mission carries an authorization bitmask"""
+        if self.authorization_registry is None:
+            self.authorization_registry = AuthorizationRegistry(system_authorizations)
+        else:
+            for authorization in system_authorizations or []:
+                self.authorization_registry.register(authorization)
+
+        for soldier in self.get_all_soldiers():
+            soldier.attach_registry(self.authorization_registry)
+        for mission in self.missions:
+            mission.attach_registry(self.authorization_registry)
         for platoon in self.platoons:
-            soldier = platoon.get_soldier_by_serial(serial_number)
-            if soldier:
-                return soldier
-        return None
+            for mission in platoon.weekly_missions:
+                mission.attach_registry(self.authorization_registry)
+
+        return self.authorization_registry
+
+    def get_roster_columns(self) -> RosterColumns:
+        """Get the column view of the roster (built on first use, then maintained incrementally)"""
+        columns = self._roster_columns
+        if columns is None or columns.removed_rows > len(columns):
+            # Build (or compact away removed rows) in one linear pass
+            columns = self._roster_columns = RosterColumns(self)
+        return columns
+
+    def get_availability_tensor(self) -> AvailabilityTensor:
+        """Get the compiled days x shifts x soldiers availability (cached until the next model change)"""
+        columns = self.get_roster_columns()
+        tensor = self._availability
+        if tensor is None or self._availability_revision != self._revision or tensor.columns is not columns:
+            shifts = []
+            for mission in self.missions:
+                shifts.extend(shift for shift in mission.shift_hours if shift not in shifts)
+            tensor = self._availability = AvailabilityTensor(columns, shifts)
+            self._availability_revision = self._revision
+        return tensor
+
+    def get_soldiers_covering_mission(self, mission: Mission) -> List[Soldier]:
+        """Get all soldiers holding every authorization the mission requires"""
+        columns = self.get_roster_columns()
+        return columns.soldiers_in(columns.rows_for_mission(mission))
+
+    def count_qualified_soldiers(self, mission: Mission, platoon: Optional[Platoon] = None,
+                                 day: Optional[str] = None) -> int:
+        """Count soldiers holding every authorization of a mission, optionally within a platoon / not home on a day"""
+        columns = self.get_roster_columns()
+        rows = columns.platoon_rows(platoon) if platoon is not None else columns.live_bits
+        if day is not None:
+            rows &= columns.available_rows(day)
+        return columns.rows_for_mission(mission, rows).bit_count()
+
+    def get_soldiers_by_authorization(self, authorization: str) -> List[Soldier]:
+        """Get all soldiers in the company with a specific authorization"""
+        return list(self._soldiers_by_authorization.get(authorization, ()))
+
+    def count_soldiers_by_authorization(self, authorization: str) -> int:
+        """Count soldiers in the company holding a specific authorization"""
+        return len(self._soldiers_by_authorization.get(authorization, ()))
+
+    def _index_soldier(self, soldier: Soldier):
+        """Add a soldier to the company-wide indexes"""
+        self._soldiers_by_serial[soldier.serial_number] = soldier
+        for auth in soldier.authorizations:
+            self._soldiers_by_authorization.setdefault(auth, set()).add(soldier)
+
+    def _unindex_soldier(self, soldier: Soldier):
+        """Remove a soldier from the company-wide indexes"""
+        if self._soldiers_by_serial.get(soldier.serial_number) is soldier:
+            del self._soldiers_by_serial[soldier.serial_number]
+        for auth in soldier.authorizations:
+            self._unindex_authorization(soldier, auth)
+
+    def _unindex_authorization(self, soldier: Soldier, authorization: str):
+        """Drop a soldier from the company authorization index, removing empty entries"""
+        holders = self._soldiers_by_authorization.get(authorization)
+        if holders is not None:
+            holders.discard(soldier)
+            if not holders:
+                del self._soldiers_by_authorization[authorization]
+
+    def _touch(self, platoon: Optional[Platoon] = None, mission: Optional[Mission] = None, structure: bool = False):
+        """Record a model change so cached views recompute only what it affects"""
+        self._revision += 1
+        if structure:
+            self._statistics = None
+            self._platoon_statistics.clear()
+            self._mission_statistics.clear()
+            self._dirty_platoons.clear()
+            self._dirty_missions.clear()
+        elif self._statistics is not None:
+            if platoon is not None:
+                self._dirty_platoons.add(platoon)
+            if mission is not None:
+                self._dirty_missions.add(mission)
+
+    def _on_platoon_changed(self, platoon: Platoon):
+        """Called by a member platoon after its name or mission assignments changed"""
+        self._touch(platoon=platoon)
+
+    def _on_mission_changed(self, mission: Mission):
+        """Called by a company mission after its requirements changed"""
+        self._capability.invalidate_mission(mission)
+        self._touch(mission=mission)
+
+    def _adopt_soldier(self, platoon: Platoon, soldier: Soldier) -> Soldier:
+        """Called by a member platoon before it adds a soldier; returns the object to add (the soldier itself)"""
+        return soldier
+
+    def _on_soldier_added(self, platoon: Platoon, soldier: Soldier):
+        """Called by a member platoon after it gained a soldier"""
+        self._capability.invalidate_platoon(platoon)
+        self._touch(platoon=platoon)
+        self._index_soldier(soldier)
+        if self.authorization_registry is not None and soldier._registry is not self.authorization_registry:
+            soldier.attach_registry(self.authorization_registry)
+        if self._roster_columns is not None:
+            self._roster_columns.add_soldier(soldier)
+
+    def _on_soldiers_added(self, platoon: Platoon, soldiers: List[Soldier]):
+        """Called by a member platoon after a bulk add_soldiers"""
+        self._capability.invalidate_platoon(platoon)
+        self._touch(platoon=platoon)
+        for soldier in soldiers:
+            self._index_soldier(soldier)
+            if self.authorization_registry is not None and soldier._registry is not self.authorization_registry:
+                soldier.attach_registry(self.authorization_registry)
+        # Growing every bitset row by row would be quadratic - let the column view rebuild once instead
+        self._roster_columns = None
+
+    def _on_soldier_removed(self, platoon: Platoon, soldier: Soldier):
+        """Called by a member platoon after it lost a soldier"""
+        self._capability.invalidate_platoon(platoon)
+        self._touch(platoon=platoon)
+        self._unindex_soldier(soldier)
+        if self._roster_columns is not None:
+            self._roster_columns.remove_soldier(soldier)
+
+    def _on_soldier_changed(self, soldier: Soldier):
+        """Called by a member platoon after a soldier's preferred shift or home time constraints changed"""
+        self._touch()
+        if self._roster_columns is not None:
+            self._roster_columns.update_soldier(soldier)
+
+    def _on_platoon_schedule_changed(self, platoon: Platoon):
+        """Called by a member platoon after its home time schedule changed"""
+        self._touch()
+        if self._roster_columns is not None:
+            self._roster_columns.update_platoon(platoon)
+
+    def _on_soldier_authorization_changed(self, soldier: Soldier, authorization: str, added: bool):
+        """Called by a member platoon when one of its soldiers gained or lost an authorization"""
+        self._capability.invalidate_authorization(soldier._platoon, authorization)
+        self._touch(platoon=soldier._platoon)
+        if added:
+            self._soldiers_by_authorization.setdefault(authorization, set()).add(soldier)
+        else:
+            self._unindex_authorization(soldier, authorization)
+        if self._roster_columns is not None:
+            self._roster_columns.update_authorization(soldier, authorization, added)
+
+    def _on_soldier_serial_changed(self, soldier: Soldier, old_serial: str, new_serial: str):
+        """Called by a member platoon when one of its soldiers changes serial number"""
+        self._touch()
+        if self._soldiers_by_serial.get(old_serial) is soldier:
+            del self._soldiers_by_serial[old_serial]
+        self._soldiers_by_serial[new_serial] = soldier
+        self.workload_ledger.rename_soldier(old_serial, new_serial)
 
     def get_company_statistics(self) -> Dict:
-        """Get comprehensive company statistics"""
-        stats = {
-            'total_platoons': len(self.platoons),
-            'total_soldiers': len(self.get_all_soldiers()),
-            'total_missions': len(self.missions),
-            'platoon_details': {},
-            'mission_coverage': {},
-            'authorization_distribution': {}
-        }
+        """Get comprehensive company statistics (cached - treat the result as read-only)"""
+        if self._statistics is not None and self._statistics_revision == self._revision:
+            return self._statistics
 
-        # Platoon details
+        # Recompute only the entries touched since the last call
+        roster_changed = bool(self._dirty_platoons) or self._statistics is None
         for platoon in self.platoons:
-            stats['platoon_details'][platoon.name] = {
-                'soldier_count': platoon.get_soldier_count(),
-                'assigned_missions': len(platoon.weekly_missions),
-                'authorizations': platoon.get_authorization_summary()
-            }
+            if platoon in self._dirty_platoons or platoon not in self._platoon_statistics:
+                self._platoon_statistics[platoon] = {
+                    'soldier_count': platoon.get_soldier_count(),
+                    'assigned_missions': len(platoon.weekly_missions),
+                    'authorizations': platoon.get_authorization_summary()
+                }
 
-        # Mission coverage analysis
         for mission in self.missions:
-            capable_platoons = []
-            for platoon in self.platoons:
-                if platoon.can_fulfill_mission(mission)['can_fulfill']:
-                    capable_platoons.append(platoon.name)
-            stats['mission_coverage'][mission.name] = {
-                'capable_platoons': capable_platoons,
-                'personnel_required': mission.daily_personnel,
-                'required_authorizations': mission.required_authorizations
-            }
-
-        # Authorization distribution across company
-        auth_dist = {}
-        for soldier in self.get_all_soldiers():
-            for auth in soldier.authorizations:
-                auth_dist[auth] = auth_dist.get(auth, 0) + 1
-        stats['authorization_distribution'] = auth_dist
-
-        return stats
+            coverage = self._mission_statistics.get(mission)
+            if coverage is None or mission in self._dirty_missions:
+                coverage = self._mission_statistics[mission] = {
+                    'capable_platoons': [],
+                    'personnel_required': mission.daily_personnel,
+                    'required_authorizations': mission.required_authorizations,
+                    'qualified_soldiers': 0
+                }
+            elif not roster_changed:
+                continue
+
+            # Mission coverage analysis
+            coverage['capable_platoons'] = [platoon.name for platoon in
+                                            self._capability.get_capable_platoons(mission, self.platoons)]
+            coverage['qualified_soldiers'] = self.count_qualified_soldiers(mission)
+
+        self._dirty_platoons.clear()
+        self._dirty_missions.clear()
+
+        self._statistics = {
+            'total_platoons': len(self.platoons),
+            'total_soldiers': len(self._soldiers_by_serial),
+            'total_missions': len(self.missions),
+            'platoon_details': {platoon.name: self._platoon_statistics[platoon] for platoon in self.platoons},
+            'mission_coverage': {mission.name: self._mission_statistics[mission] for mission in self.missions},
+            # Authorization distribution across company
+            'authorization_distribution': {auth: len(holders)
+                                           for auth, holders in self._soldiers_by_authorization.items()}
+        }
+        self._statistics_revision = self._revision
+
+        return self._statistics
+
+    def optimize_weekly_schedule(self, week: str = "current", method: str = "greedy",
+                                 max_missions_per_platoon: Optional[int] = None) -> Dict:
+        """
+        Basic optimization for weekly mission assignments.
+        method="greedy" gives each mission, in list order, to the best still-free platoon. method="hungarian"
+        lets a platoon take several missions as its personnel allows (at most max_missions_per_platoon, if set)
+        and covers as many missions as possible, then maximizes the score: a matching, repaired and improved by
+        branch and bound, which is exact unless the search runs out of nodes - see assignment.py.
+        """
+        if method == "hungarian":
+            return optimal_mission_assignment(self.missions, self.platoons, self.get_mission_capability,
+                                              max_missions_per_platoon)
+        if method != "greedy":
+            raise ValueError(f"Unknown assignment method: {method}")
 
-    def optimize_weekly_schedule(self, week: str = "current") -> Dict:
-        """Basic optimization for weekly mission assignments"""
         optimization_result = {
             'assignments': {},
             'conflicts': [],
@@ -152,14 +420,13 @@ class Company:
             best_score = -1
 
             for platoon in available_platoons:
-                capability = platoon.can_fulfill_mission(mission)
+                capability = self.get_mission_capability(mission, platoon)
                 if capability['can_fulfill']:
                     # Score based on available personnel and authorization coverage
                     score = platoon.get_soldier_count()
                     # Bonus for having required authorizations
-                    for auth in mission.required_authorizations:
-                        soldiers_with_auth = platoon.get_soldiers_by_authorization(auth)
-                        score += len(soldiers_with_auth) * 2
+                    for count in capability['details'].values():
+                        score += count * 2
 
                     if score > best_score:
                         best_score = score
@@ -178,6 +445,124 @@ class Company:
 
         return optimization_result
 
+    def plan_pooled_staffing(self, week: str = "current") -> Dict:
+        """
+        Staff every mission from the company's pooled platoons, splitting a mission over several platoons when
+        no single one can staff it (see pooled_staffing.py). Works on headcounts like can_fulfill_mission.
+        """
+        result = PooledStaffing(self.get_roster_columns(), self.platoons).plan(self.missions)
+        result['week'] = week
+        return result
+
+    def check_week_feasibility(self, week: str = "current") -> Dict:
+        """
+        Quick capacity check before scheduling: (day, shift, authorization) buckets whose demand exceeds the
+        qualified soldiers not at home (see feasibility.py). Any shortfall means no roster can fill every slot.
+        """
+        shortfalls = find_capacity_shortfalls(self.get_roster_columns(), self.missions)
+        return {'week': week, 'feasible': not shortfalls, 'shortfalls': shortfalls}
+
+    def explain_staffing_failure(self, week: str = "current") -> Dict:
+        """
+        Explain why missions cannot be staffed: per failing day, the smallest set of missions that are short
+        together, with the personnel counts, home time entries and missing authorizations behind it (minimum cut
+        of the staffing network, see infeasibility.py)
+        """
+        explanations = explain_infeasibility(self.get_roster_columns(), self.missions)
+        return {'week': week, 'feasible': not explanations, 'explanations': explanations}
+
+    def find_single_points_of_failure(self, week: str = "current") -> Dict:
+        """
+        Soldiers and authorizations whose loss would make a mission unstaffable (see failure_analysis.py):
+        company-wide from one staffing max flow per day, and per platoon from its authorization counts
+        """
+        return {
+            'week': week,
+            'company': find_company_bottlenecks(self.get_roster_columns(), self.missions),
+            'platoons': {platoon.name: find_platoon_bottlenecks(platoon, self.missions, self.get_mission_capability)
+                         for platoon in self.platoons}
+        }
+
+    def build_weekly_roster(self, week: str = "current") -> Dict:
+        """Assign soldiers to every mission shift of the week (min-cost flow per day, see scheduler.py)"""
+        return self._cached_solve('min_cost_flow', week,
+                                  lambda: solve_weekly_roster(ScheduleProblem.from_company(self, week)).to_dict())
+
+    def optimize_weekly_roster(self, week: str = "current", time_budget: float = 5.0,
+                               seed: Optional[int] = None, workers: int = 1, restarts: Optional[int] = None) -> Dict:
+        """
+        Improve the greedy weekly roster by local search for up to time_budget seconds (see roster_search.py).
+        The result includes the search progress (seconds, best objective) next to the roster.
+        With workers > 1 (or several restarts), independently seeded searches share the time budget and run in a
+        process pool, so the call returns sooner the more workers there are; the best roster is kept.
+        """
+        def solve() -> Dict:
+            problem = ScheduleProblem.from_company(self, week)
+            if workers > 1 or (restarts or 1) > 1:
+                return parallel_roster_search(problem, time_budget, restarts, workers, seed or 0)
+            search = AnytimeRosterSearch(problem, seed=seed)
+            search.run(time_budget)
+            return search.to_dict()
+
+        return self._cached_solve('annealing', week, solve, time_budget=time_budget, seed=seed,
+                                  workers=workers, restarts=restarts)
+
+    def enable_schedule_cache(self, directory: str, max_entries: int = 64,
+                              max_bytes: Optional[int] = None) -> ScheduleCache:
+        """Keep solver results in an on-disk LRU cache keyed by the schedule fingerprint"""
+        self.schedule_cache = ScheduleCache(directory, max_entries, max_bytes)
+        return self.schedule_cache
+
+    def get_schedule_fingerprint(self, week: str = "current") -> str:
+        """Content hash of the schedule-relevant data (cached until the next model change)"""
+        cached = self._fingerprints.get(week)
+        if cached is None or cached[0] != self._revision:
+            cached = self._fingerprints[week] = (self._revision, schedule_fingerprint(self, week))
+        return cached[1]
+
+    def _cached_solve(self, solver: str, week: str, solve, **parameters) -> Dict:
+        """Run a solver, or return its earlier result for identical inputs when the schedule cache is enabled"""
+        if self.schedule_cache is None:
+            return solve()
+        key = ScheduleCache.make_key(self.get_schedule_fingerprint(week), solver, **parameters)
+        result = self.schedule_cache.get(key)
+        if result is None:
+            result = solve()
+            self.schedule_cache.put(key, result)
+        return result
+
+    def record_weekly_roster(self, roster: Dict, week: Optional[str] = None):
+        """Add a roster's hours and night shifts to the workload ledger (recording a week again replaces it)"""
+        problem = ScheduleProblem.from_company(self, week or roster.get('week', 'current'))
+        self.workload_ledger.record_roster(WeeklyRoster.from_dict(problem, roster))
+        self._touch()
+
+    def fork_scenario(self, name: str = "Scenario") -> Scenario:
+        """Start a copy-on-write what-if scenario that never modifies this company (see scenario.py)"""
+        return Scenario(self, name)
+
+    def check_weekly_roster(self, roster: Dict, week: str = "current", min_rest_hours: float = 8.0) -> Dict:
+        """Find double-booked soldiers and rest gaps shorter than min_rest_hours in a roster dictionary"""
+        problem = ScheduleProblem.from_company(self, week)
+        return WeeklyRoster.from_dict(problem, roster, keep_double_bookings=True).find_conflicts(min_rest_hours)
+
+    def repair_weekly_roster(self, roster: Dict, change: Dict, week: str = "current") -> Dict:
+        """
+        Fix only the slots of an existing roster (build/optimize_weekly_roster output) affected by a change,
+        see RosterRepair.apply for the change format. Returns the repaired roster and a repair report.
+        """
+        problem = ScheduleProblem.from_company(self, week)
+        repair = RosterRepair(problem, WeeklyRoster.from_dict(problem, roster))
+        report = repair.apply(change)
+        return {'roster': repair.roster.to_dict(), 'repair': report}
+
+    def plan_home_rotation(self, weeks: int = 4, max_home_days_per_week: Optional[int] = None) -> Dict:
+        """
+        Plan a fair multi-week home leave calendar that keeps every mission manned (see rotation_planner.py).
+        max_home_days_per_week caps each soldier's home days, existing home time included.
+        """
+        return RotationPlanner(ScheduleProblem.from_company(self), weeks, max_home_days_per_week).plan()
+
     def export_home_time_options(self, platoon_name: str, week: str = "current") -> Dict:
         """Generate home time options for a specific platoon based on mission requirements"""
         platoon = self.get_platoon_by_name(platoon_name)
@@ -192,7 +577,34 @@ class Company:
             'recommendations': []
         }
 
-        # Analyze each soldier's constraints and mission requirements
+        # Spare holders per (mission, authorization, day): soldiers of the platoon holding the authorization and
+        # not at home that day, minus the mission's shift personnel. At zero or below every holder is critical.
+        columns = self.get_roster_columns()
+        platoon_rows = columns.platoon_rows(platoon)
+        slack = {}
+        critical = [set() for _ in WEEK_DAYS]  # Day index -> authorizations whose holders cannot go home
+        for mission in platoon.weekly_missions:
+            mission_slack = slack.setdefault(mission.name, {})
+            daily_need = mission.get_shift_personnel_total()
+            for authorization in mission.required_authorizations:
+                holders = columns.authorization_rows(authorization) & platoon_rows
+                day_slack = {}
+                for day_index, day in enumerate(WEEK_DAYS):
+                    spare = (holders & columns.day_bits[day_index]).bit_count() - daily_need
+                    day_slack[day] = spare
+                    if spare <= 0:
+                        critical[day_index].add(authorization)
+                    if spare < 0:
+                        home_time_options['conflicts'].append({
+                            'mission': mission.name,
+                            'authorization': authorization,
+                            'day': day,
+                            'shortage': -spare
+                        })
+                mission_slack[authorization] = day_slack
+        home_time_options['authorization_slack'] = slack
+
+        # One pass over the roster: a soldier is blocked on a day when holding any critical authorization
         for soldier in platoon.soldiers:
             soldier_options = {
                 'name': soldier.name,
@@ -201,27 +613,11 @@ class Company:
                 'blocked_days': [],
                 'constraints': soldier.home_time_constraints
             }
-
-            # Check each day of the week
-            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            for day in days:
-                # Check if soldier is needed for missions this day
-                needed_for_missions = False
-                for mission in platoon.weekly_missions:
-                    # Simplified check - in real implementation, this would be more complex
-                    if soldier.has_authorization(
-                            mission.required_authorizations[0] if mission.required_authorizations else ""):
-                        # Check if this soldier is critical for the mission
-                        available_soldiers = platoon.get_soldiers_by_authorization(
-                            mission.required_authorizations[0] if mission.required_authorizations else "")
-                        if len(available_soldiers) <= mission.daily_personnel:
-                            needed_for_missions = True
-                            break
-
-                if not needed_for_missions:
-                    soldier_options['possible_home_days'].append(day)
-                else:
+            for day_index, day in enumerate(WEEK_DAYS):
+                if critical[day_index] and not critical[day_index].isdisjoint(soldier.authorizations):
                     soldier_options['blocked_days'].append(day)
+                else:
+                    soldier_options['possible_home_days'].append(day)
 
             home_time_options['soldier_options'][soldier.serial_number] = soldier_options
 
@@ -234,12 +630,13 @@ class Company:
             'platoons': [platoon.to_dict() for platoon in self.platoons],
             'missions': [mission.to_dict() for mission in self.missions],
             'weekly_assignments': self.weekly_assignments,
+            'workload_ledger': self.workload_ledger.to_dict(),
             'company_policies': self.company_policies
         }
 
     @classmethod
-    def from_dict(cls, data: Dict):
-        """Create company object from dictionary"""
+    def from_dict(cls, data: Dict, compact_authorizations: bool = False):
+        """Create company object from dictionary (optionally with authorization bitmasks enabled)"""
         company = cls(data.get('name', 'Default Company'))
 
         # Add platoons
@@ -253,8 +650,13 @@ class Company:
             company.add_mission(mission)
 
         company.weekly_assignments = data.get('weekly_assignments', {})
+        company.workload_ledger = WorkloadLedger.from_dict(data.get('workload_ledger', {}))
         company.company_policies = data.get('company_policies', {})
 
+        if compact_authorizations:
+            # The file's system authorizations get the lowest, stable bit positions
+            company.enable_authorization_masks(data.get('system_authorizations', []))
+
         return company
 
     def __str__(self):
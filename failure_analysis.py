@@ -0,0 +1,110 @@
+from typing import List, Dict
+from soldier import WEEK_DAYS
+from roster_columns import RosterColumns
+from staffing_network import StaffingNetwork
+
+
+def find_company_bottlenecks(columns: RosterColumns, missions: List) -> Dict:
+    """
+    Soldiers whose absence alone would leave a company mission short on some day, from one max flow per day.
+
+    After a maximum flow on the day's staffing network (see staffing_network.py), losing one member of a soldier
+    class lowers the flow exactly when the class's sink edge is saturated and the class cannot reach the sink over
+    residual edges - its unit of work cannot be moved to anyone else. One reverse search from the sink therefore
+    settles every class, instead of re-solving the week once per soldier. Days that are short already are listed
+    separately and not analysed further.
+    """
+    staffing = StaffingNetwork(columns, missions)
+    registry = columns.registry
+    critical = {}  # Class position -> {day index: names of the missions drawing on the class}
+    unstaffable_days = []
+    for day_index, day in enumerate(WEEK_DAYS):
+        network, assignment_edges, class_edges = staffing.build(staffing.present(day_index))
+        if network.max_flow(staffing.SOURCE, staffing.SINK) < staffing.demand:
+            unstaffable_days.append(day)
+            continue
+
+        reaching_sink = network.reaching(staffing.SINK)
+        for position, edge in enumerate(class_edges):
+            if network.get_flow(edge) and staffing.class_node(position) not in reaching_sink:
+                critical.setdefault(position, {})[day_index] = set()
+        if not critical:
+            continue
+        for mission_position, edges in enumerate(assignment_edges):
+            for class_position, edge in edges:
+                if day_index in critical.get(class_position, ()) and network.get_flow(edge):
+                    critical[class_position][day_index].add(staffing.missions[mission_position][0].name)
+
+    position_of = {key: position for position, key in enumerate(staffing.classes)}
+    soldiers = []
+    authorizations = {}  # Authorization -> (critical serial numbers, missions at risk)
+    for row, soldier in enumerate(columns.soldiers):
+        position = position_of.get((columns.platoon_ids[row], columns.authorization_masks[row]))
+        if soldier is None or position not in critical:
+            continue
+        days = [day_index for day_index in critical[position] if columns.availability[row] >> day_index & 1]
+        if not days:
+            continue
+        at_risk = set().union(*(critical[position][day_index] for day_index in days))
+        soldiers.append({
+            'serial_number': soldier.serial_number,
+            'name': soldier.name,
+            'platoon': columns.platoons[columns.platoon_ids[row]].name,
+            'days': [WEEK_DAYS[day_index] for day_index in days],
+            'missions': sorted(at_risk)
+        })
+
+        # The authorizations that make the soldier hard to replace: those the missions at risk require
+        for mission, required in staffing.missions:
+            if mission.name not in at_risk:
+                continue
+            for authorization in registry.names_for(required):
+                entry = authorizations.setdefault(authorization, (set(), set()))
+                entry[0].add(soldier.serial_number)
+                entry[1].add(mission.name)
+
+    return {
+        'critical_soldiers': soldiers,
+        'bottleneck_authorizations': [{'authorization': authorization, 'critical_soldiers': len(serials),
+                                       'missions': sorted(names)}
+                                      for authorization, (serials, names) in authorizations.items()],
+        'unstaffable_days': unstaffable_days
+    }
+
+
+def find_platoon_bottlenecks(platoon, missions: List, get_capability) -> Dict:
+    """
+    Single points of failure inside one platoon, by the same counts as can_fulfill_mission: for every mission
+    the platoon can fulfill, a required authorization with a single holder makes that soldier indispensable,
+    and a headcount equal to the daily personnel makes every soldier indispensable.
+    """
+    soldiers = {}
+    authorizations = {}
+    understrength = []
+    for mission in missions:
+        if not get_capability(mission, platoon)['can_fulfill']:
+            continue
+        if platoon.get_soldier_count() == mission.daily_personnel:
+            understrength.append(mission.name)
+        for authorization in mission.required_authorizations:
+            holders = platoon.get_soldier_set_by_authorization(authorization)
+            if len(holders) != 1:
+                continue
+            holder = next(iter(holders))
+            entry = soldiers.setdefault(holder.serial_number, {
+                'serial_number': holder.serial_number,
+                'name': holder.name,
+                'authorizations': [],
+                'missions': []
+            })
+            if authorization not in entry['authorizations']:
+                entry['authorizations'].append(authorization)
+            if mission.name not in entry['missions']:
+                entry['missions'].append(mission.name)
+            authorizations.setdefault(authorization, []).append(mission.name)
+
+    return {
+        'critical_soldiers': list(soldiers.values()),
+        'bottleneck_authorizations': authorizations,
+        'understrength_missions': understrength
+    }
@@ -0,0 +1,76 @@
+from typing import List, Dict
+from soldier import WEEK_DAYS
+from roster_columns import RosterColumns
+
+
+def assigned_platoon_rows(columns: RosterColumns) -> Dict[str, int]:
+    """Mission name -> bitset of the rows in the platoons it is assigned to (absent = any platoon)"""
+    platoon_rows = {}
+    for platoon in columns.platoons:
+        for mission in platoon.weekly_missions:
+            platoon_rows[mission.name] = platoon_rows.get(mission.name, 0) | columns.platoon_rows(platoon)
+    return platoon_rows
+
+
+def find_capacity_shortfalls(columns: RosterColumns, missions: List) -> List[Dict]:
+    """
+    Hall-style counting bounds on a week's staffing, without running a solver.
+
+    A set of shift slots can only be filled if at least as many distinct soldiers qualify for some slot in it.
+    The sets checked are, for each authorization and each mission's full requirement R: the slots of every
+    mission requiring all of R. They are checked per (day, shift), and per day over all shifts, since a soldier
+    works one shift a day. Supply is the soldiers holding R who are not at home that day, restricted to the
+    assigned platoons when every mission in the set is assigned. Shift and day demand come from
+    Mission.personnel_per_shift, like every staffing analysis. An empty requirement (any soldier) bounds the total.
+
+    Every bound is necessary, not sufficient: a shortfall proves the week infeasible, and no shortfall does not
+    prove it feasible. Returns the short buckets; a day-level bucket is listed only when none of its shifts is
+    short on its own.
+    """
+    registry = columns.registry
+    platoon_rows = assigned_platoon_rows(columns)
+
+    staffed = [(mission, registry.mask_for(mission.required_authorizations)) for mission in missions
+               if mission.get_shift_personnel_total() > 0]
+    requirements = {0}
+    for mission, mask in staffed:
+        requirements.add(mask)
+        requirements.update(registry.mask_for([authorization]) for authorization in mission.required_authorizations)
+
+    shortfalls = []
+    for required in sorted(requirements):
+        group = [mission for mission, mask in staffed if mask & required == required]
+        if not group:
+            continue
+        shift_demand = {}
+        for mission in group:
+            for shift, count in mission.personnel_per_shift.items():
+                shift_demand[shift] = shift_demand.get(shift, 0) + count
+        day_demand = sum(shift_demand.values())
+
+        scope = 0
+        for mission in group:
+            rows = platoon_rows.get(mission.name)
+            if rows is None:
+                scope = columns.live_bits
+                break
+            scope |= rows
+        qualified = columns.rows_covering(required, scope)
+        authorizations = registry.names_for(required)
+
+        for day_index, day in enumerate(WEEK_DAYS):
+            supply = (qualified & columns.day_bits[day_index]).bit_count()
+            if day_demand <= supply:
+                continue
+            short_shifts = [(shift, demand) for shift, demand in shift_demand.items() if demand > supply]
+            for shift, demand in short_shifts or [(None, day_demand)]:
+                shortfalls.append({
+                    'day': day,
+                    'shift': shift,
+                    'authorizations': authorizations,
+                    'demand': demand,
+                    'supply': supply,
+                    'shortage': demand - supply
+                })
+
+    return shortfalls
@@ -0,0 +1,236 @@
+import heapq
+from collections import deque
+from typing import List, Set, Tuple, Optional
+
+
+class FlowNetwork:
+    """
+    Directed network with integer capacities and costs supporting max-flow, min-cost flow and min-cut queries.
+
+    Nodes are integers. Every edge is stored together with its residual reverse edge (edge index ^ 1), so the
+    flow on an edge is its capacity minus its remaining residual capacity.
+    """
+
+    INFINITE_CAPACITY = 1 << 60
+
+    def __init__(self, node_count: int = 0):
+        self.graph = [[] for _ in range(node_count)]  # Node -> outgoing edge indexes
+        self.edge_to = []  # Edge -> head node
+        self.edge_residual = []  # Edge -> remaining capacity
+        self.edge_capacity = []  # Edge -> original capacity
+        self.edge_cost = []  # Edge -> cost per unit of flow
+
+    def add_node(self) -> int:
+        """Add a node and return its index"""
+        self.graph.append([])
+        return len(self.graph) - 1
+
+    def add_edge(self, source: int, target: int, capacity: int, cost: int = 0) -> int:
+        """Add an edge (and its residual reverse edge) and return the forward edge index"""
+        edge = len(self.edge_to)
+        self.edge_to.extend((target, source))
+        self.edge_residual.extend((capacity, 0))
+        self.edge_capacity.extend((capacity, 0))
+        self.edge_cost.extend((cost, -cost))
+        self.graph[source].append(edge)
+        self.graph[target].append(edge + 1)
+        return edge
+
+    def get_flow(self, edge: int) -> int:
+        """Get the flow currently sent along a forward edge"""
+        return self.edge_capacity[edge] - self.edge_residual[edge]
+
+    def max_flow(self, source: int, sink: int) -> int:
+        """Push the maximum flow from source to sink (Dinic's algorithm) and return its value"""
+        total = 0
+        node_count = len(self.graph)
+        while True:
+            # Level graph by BFS over residual edges
+            level = [-1] * node_count
+            level[source] = 0
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for edge in self.graph[node]:
+                    target = self.edge_to[edge]
+                    if self.edge_residual[edge] > 0 and level[target] < 0:
+                        level[target] = level[node] + 1
+                        queue.append(target)
+            if level[sink] < 0:
+                return total
+
+            # Blocking flow by iterative DFS with per-node edge pointers
+            pointer = [0] * node_count
+            while True:
+                pushed = self._push_blocking_path(source, sink, level, pointer)
+                if not pushed:
+                    break
+                total += pushed
+
+    def _push_blocking_path(self, source: int, sink: int, level: List[int], pointer: List[int]) -> int:
+        """Find one source-sink path in the level graph and push its bottleneck"""
+        path = []  # Edges from source to the current node
+        node = source
+        while node != sink:
+            edges = self.graph[node]
+            advanced = False
+            while pointer[node] < len(edges):
+                edge = edges[pointer[node]]
+                target = self.edge_to[edge]
+                if self.edge_residual[edge] > 0 and level[target] == level[node] + 1:
+                    path.append(edge)
+                    node = target
+                    advanced = True
+                    break
+                pointer[node] += 1
+            if not advanced:
+                if not path:
+                    return 0
+                # Dead end - retreat and skip the edge that led here
+                level[node] = -1
+                edge = path.pop()
+                node = self.edge_to[edge ^ 1]
+                pointer[node] += 1
+
+        pushed = min(self.edge_residual[edge] for edge in path)
+        for edge in path:
+            self.edge_residual[edge] -= pushed
+            self.edge_residual[edge ^ 1] += pushed
+        return pushed
+
+    def min_cost_flow(self, source: int, sink: int, flow_limit: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Send as much flow as possible (up to flow_limit) at minimum total cost.
+        Uses successive shortest paths with Dijkstra and node potentials; edge costs must be non-negative.
+        Returns (flow, cost).
+        """
+        node_count = len(self.graph)
+        potential = [0] * node_count
+        flow = cost = 0
+        limit = self.INFINITE_CAPACITY if flow_limit is None else flow_limit
+
+        while flow < limit:
+            distance = [None] * node_count
+            parent_edge = [-1] * node_count
+            distance[source] = 0
+            heap = [(0, source)]
+            while heap:
+                dist, node = heapq.heappop(heap)
+                if dist != distance[node]:
+                    continue
+                for edge in self.graph[node]:
+                    if self.edge_residual[edge] <= 0:
+                        continue
+                    target = self.edge_to[edge]
+                    new_dist = dist + self.edge_cost[edge] + potential[node] - potential[target]
+                    if distance[target] is None or new_dist < distance[target]:
+                        distance[target] = new_dist
+                        parent_edge[target] = edge
+                        heapq.heappush(heap, (new_dist, target))
+
+            if distance[sink] is None:
+                break
+            for node in range(node_count):
+                if distance[node] is not None:
+                    potential[node] += distance[node]
+
+            # Bottleneck along the shortest path
+            pushed = limit - flow
+            node = sink
+            while node != source:
+                edge = parent_edge[node]
+                pushed = min(pushed, self.edge_residual[edge])
+                node = self.edge_to[edge ^ 1]
+
+            node = sink
+            while node != source:
+                edge = parent_edge[node]
+                self.edge_residual[edge] -= pushed
+                self.edge_residual[edge ^ 1] += pushed
+                cost += pushed * self.edge_cost[edge]
+                node = self.edge_to[edge ^ 1]
+            flow += pushed
+
+        return flow, cost
+
+    def reachable_from(self, node: int) -> Set[int]:
+        """Nodes reachable from a node over residual edges (after max_flow: the source side of a minimum cut)"""
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for edge in self.graph[current]:
+                target = self.edge_to[edge]
+                if self.edge_residual[edge] > 0 and target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def reaching(self, node: int) -> Set[int]:
+        """Nodes that can reach a node over residual edges (the reverse search of reachable_from)"""
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for edge in self.graph[current]:
+                # edge ^ 1 runs from edge_to[edge] into current
+                origin = self.edge_to[edge]
+                if self.edge_residual[edge ^ 1] > 0 and origin not in seen:
+                    seen.add(origin)
+                    queue.append(origin)
+        return seen
+
+    def lower_capacity(self, edge: int) -> bool:
+        """
+        Lower a forward edge's capacity by one unit without lowering the total flow. A saturated edge first
+        hands one unit to a residual path between its endpoints. Returns False, leaving the network unchanged,
+        if there is no such path (for an edge into the sink after max_flow: the maximum flow would drop).
+        """
+        if self.edge_capacity[edge] <= 0:
+            return False
+        if self.edge_residual[edge] > 0:
+            self.edge_residual[edge] -= 1
+        else:
+            path = self._residual_path(self.edge_to[edge ^ 1], self.edge_to[edge])
+            if path is None:
+                return False
+            for step in path:
+                self.edge_residual[step] -= 1
+                self.edge_residual[step ^ 1] += 1
+            self.edge_residual[edge ^ 1] -= 1
+        self.edge_capacity[edge] -= 1
+        return True
+
+    def _residual_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Edges of a shortest residual path from source to target (None if there is none)"""
+        parent_edge = {source: -1}
+        queue = deque([source])
+        while target not in parent_edge:
+            if not queue:
+                return None
+            node = queue.popleft()
+            for edge in self.graph[node]:
+                head = self.edge_to[edge]
+                if self.edge_residual[edge] > 0 and head not in parent_edge:
+                    parent_edge[head] = edge
+                    if head == target:
+                        break
+                    queue.append(head)
+
+        path = []
+        node = target
+        while node != source:
+            edge = parent_edge[node]
+            path.append(edge)
+            node = self.edge_to[edge ^ 1]
+        return path
+
+    def min_cut_edges(self, source: int) -> List[int]:
+        """Forward edges crossing the minimum cut (call after max_flow)"""
+        source_side = self.reachable_from(source)
+        return [edge for edge in range(0, len(self.edge_to), 2)
+                if self.edge_to[edge ^ 1] in source_side and self.edge_to[edge] not in source_side
+                and self.edge_capacity[edge] > 0]
+
+    def __repr__(self):
+        return f"FlowNetwork(nodes={len(self.graph)}, edges={len(self.edge_to) // 2})"
@@ -0,0 +1,92 @@
+from typing import List, Dict
+from soldier import WEEK_DAYS
+from roster_columns import RosterColumns
+from staffing_network import StaffingNetwork
+from feasibility import assigned_platoon_rows
+
+
+def explain_infeasibility(columns: RosterColumns, missions: List) -> List[Dict]:
+    """
+    Explain why a week cannot be fully staffed, one explanation per failing day.
+
+    Each day is a staffing network (see staffing_network.py) from missions to the soldier classes qualified for
+    them. If the maximum flow falls short of the demand, the source side of the minimum cut is the smallest set
+    of missions whose demand exceeds everyone qualified for them. The explanation lists only the constraints
+    behind that set:
+    - personnel counts: the cut missions and their daily personnel, and the qualified soldiers present;
+    - home time: the home time entries (soldier or whole platoon) that keep qualified soldiers away;
+    - missing authorizations: per cut mission, soldiers present who lack just one required authorization.
+    """
+    staffing = StaffingNetwork(columns, missions)
+    staffed = staffing.missions
+    classes = staffing.classes
+
+    explanations = []
+    for day_index, day in enumerate(WEEK_DAYS):
+        present = staffing.present(day_index)
+        network, _, _ = staffing.build(present)
+        staffable = network.max_flow(staffing.SOURCE, staffing.SINK)
+        if staffable >= staffing.demand:
+            continue
+
+        source_side = network.reachable_from(staffing.SOURCE)
+        cut_missions = [position for position in range(len(staffed)) if staffing.mission_node(position) in source_side]
+        cut_classes = {classes[position] for position in range(len(classes))
+                       if staffing.class_node(position) in source_side}
+        explanations.append({
+            'day': day,
+            'shortage': staffing.demand - staffable,
+            'missions': [{'mission': staffed[position][0].name,
+                          'daily_personnel': staffed[position][0].get_shift_personnel_total()} for position in cut_missions],
+            'qualified_present': sum(present[key] for key in cut_classes),
+            'home_time': _home_time_entries(columns, cut_classes, day_index),
+            'missing_authorizations': _missing_authorizations(columns, [staffed[position] for position in cut_missions],
+                                                              day_index)
+        })
+
+    return explanations
+
+
+def _home_time_entries(columns: RosterColumns, cut_classes, day_index: int) -> List[Dict]:
+    """Home time entries keeping members of the cut classes away on a day (a platoon home day counts once)"""
+    day = WEEK_DAYS[day_index]
+    platoon_ids = {platoon_id for platoon_id, _ in cut_classes}
+    candidates = 0
+    for platoon_id in platoon_ids:
+        candidates |= columns.platoon_bits[platoon_id]
+    candidates &= columns.live_bits & ~columns.day_bits[day_index]
+
+    entries = []
+    platoon_days = set()
+    for soldier in columns.soldiers_in(candidates):
+        row = columns.row_of(soldier)
+        platoon_id = columns.platoon_ids[row]
+        if (platoon_id, columns.authorization_masks[row]) not in cut_classes:
+            continue
+        platoon = columns.platoons[platoon_id]
+        if platoon.home_time_schedule.get(day) == "home":
+            if platoon_id not in platoon_days:
+                platoon_days.add(platoon_id)
+                entries.append({'platoon': platoon.name, 'day': day})
+        else:
+            entries.append({'serial_number': soldier.serial_number, 'name': soldier.name, 'day': day})
+    return entries
+
+
+def _missing_authorizations(columns: RosterColumns, cut_missions, day_index: int) -> List[Dict]:
+    """Per cut mission and required authorization: soldiers present who hold every other requirement"""
+    registry = columns.registry
+    platoon_rows = assigned_platoon_rows(columns)
+    missing = []
+    for mission, required in cut_missions:
+        scope = columns.day_bits[day_index] & platoon_rows.get(mission.name, columns.live_bits)
+        for authorization in mission.required_authorizations:
+            bit = registry.mask_for([authorization])
+            lacking = columns.rows_covering(required & ~bit, scope) & ~columns.authorization_rows(authorization)
+            if lacking:
+                missing.append({
+                    'mission': mission.name,
+                    'authorization': authorization,
+                    'soldiers': lacking.bit_count()
+                })
+    return missing
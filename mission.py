@@ -1,4 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from soldier import intern_string, intern_dict
+from shift_intervals import parse_shift_hours
 
 
 class Mission:
@@ -6,8 +8,15 @@ class Mission:
     Represents a mission with shift schedules, authorization requirements, and personnel needs
     """
 
+    __slots__ = ('_company', '_registry', 'required_mask', '_name', '_shift_hours', '_shift_intervals',
+                 '_required_authorizations', '_daily_personnel', 'personnel_per_shift')
+
     def __init__(self, name: str, shift_hours: Dict[str, str], required_authorizations: List[str],
                  daily_personnel: int):
+        self._company = None  # Company object listing this mission (kept by Company)
+        self._registry = None  # AuthorizationRegistry when compact authorization masks are enabled
+        self.required_mask = 0  # Bitmask of required authorizations (only maintained with a registry)
+        self._shift_intervals = {}  # Shift -> parsed (start, end) minutes, filled on first use
         self.name = name
         self.shift_hours = shift_hours  # {"Morning": "06:00-14:00", "Noon": "14:00-22:00", "Night": "22:00-06:00"}
         self.required_authorizations = required_authorizations  # Required authorizations for this mission
@@ -27,48 +36,122 @@ class Mission:
             shift_names = list(self.shift_hours.keys())
             for i, shift in enumerate(shift_names):
                 self.personnel_per_shift[shift] = base_per_shift + (1 if i < remainder else 0)
+            self._changed()
 
     def set_shift_personnel(self, shift: str, count: int):
         """Manually set personnel count for a specific shift"""
         if shift in self.shift_hours:
             self.personnel_per_shift[shift] = count
-            # Update total daily personnel
+            # Update total daily personnel (notifies the company)
             self.daily_personnel = sum(self.personnel_per_shift.values())
 
+    def _changed(self):
+        """Tell the owning company that this mission changed"""
+        if self._company is not None:
+            self._company._on_mission_changed(self)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._changed()
+
+    @property
+    def shift_hours(self) -> Dict[str, str]:
+        return self._shift_hours
+
+    @shift_hours.setter
+    def shift_hours(self, value: Dict[str, str]):
+        self._shift_hours = intern_dict(value)
+        self._shift_intervals = {}
+        self._changed()
+
+    @property
+    def daily_personnel(self) -> int:
+        return self._daily_personnel
+
+    @daily_personnel.setter
+    def daily_personnel(self, value: int):
+        self._daily_personnel = value
+        self._changed()
+
+    @property
+    def required_authorizations(self) -> List[str]:
+        return self._required_authorizations
+
+    @required_authorizations.setter
+    def required_authorizations(self, value: List[str]):
+        """Replace the required authorizations, keeping required_mask in sync"""
+        value = [intern_string(auth) for auth in value]
+        self._required_authorizations = value
+        if self._registry is not None:
+            self.required_mask = self._registry.mask_for(value)
+        self._changed()
+
     def add_required_authorization(self, authorization: str):
         """Add a required authorization for this mission"""
         if authorization not in self.required_authorizations:
+            authorization = intern_string(authorization)
             self.required_authorizations.append(authorization)
+            if self._registry is not None:
+                self.required_mask |= 1 << self._registry.register(authorization)
+            self._changed()
 
     def remove_required_authorization(self, authorization: str):
         """Remove a required authorization from this mission"""
         if authorization in self.required_authorizations:
             self.required_authorizations.remove(authorization)
+            if self._registry is not None and authorization not in self.required_authorizations:
+                self.required_mask &= ~(1 << self._registry.register(authorization))
+            self._changed()
+
+    def attach_registry(self, registry):
+        """Enable compact mode: keep required_mask in sync against an AuthorizationRegistry"""
+        self._registry = registry
+        self.required_mask = registry.mask_for(self.required_authorizations) if registry is not None else 0
 
     def update_shift_hours(self, shift: str, hours: str):
         """Update the hours for a specific shift"""
-        self.shift_hours[shift] = hours
+        self.shift_hours[intern_string(shift)] = hours
+        self._shift_intervals.pop(shift, None)
+        self._changed()
+
+    def get_shift_personnel_total(self) -> int:
+        """Personnel a day's roster staffs: the per-shift counts summed (daily_personnel is not redistributed)"""
+        return sum(self.personnel_per_shift.values())
 
     def get_shift_duration(self, shift: str) -> float:
         """Calculate shift duration in hours"""
-        if shift not in self.shift_hours:
-            return 0.0
-
-        try:
-            start_time, end_time = self.shift_hours[shift].split('-')
-            start_hour, start_min = map(int, start_time.split(':'))
-            end_hour, end_min = map(int, end_time.split(':'))
-
-            start_total = start_hour + start_min / 60
-            end_total = end_hour + end_min / 60
-
-            # Handle overnight shifts
-            if end_total < start_total:
-                end_total += 24
-
-            return end_total - start_total
-        except (ValueError, IndexError):
+        interval = self.get_shift_interval(shift)
+        if interval is None:
             return 0.0
+        return (interval[1] - interval[0]) / 60
+
+    def get_shift_interval(self, shift: str) -> Optional[Tuple[int, int]]:
+        """Get a shift as (start, end) minutes from midnight, overnight shifts wrapping past 1440 (None if invalid)"""
+        if shift not in self._shift_intervals:
+            if shift not in self.shift_hours:
+                return None
+            # Parsed once per shift; changing the hours drops the cached interval
+            self._shift_intervals[shift] = parse_shift_hours(self.shift_hours[shift])
+        return self._shift_intervals[shift]
+
+    def clone(self):
+        """Detached copy (no company or registry) with its own shift and authorization containers"""
+        mission = Mission.__new__(Mission)
+        mission._company = None
+        mission._registry = None
+        mission.required_mask = 0
+        mission._name = self._name
+        mission._shift_hours = dict(self._shift_hours)
+        mission._shift_intervals = dict(self._shift_intervals)
+        mission._required_authorizations = list(self._required_authorizations)
+        mission._daily_personnel = self._daily_personnel
+        mission.personnel_per_shift = dict(self.personnel_per_shift)
+        return mission
 
     def to_dict(self) -> Dict:
         """Convert mission object to dictionary for serialization"""
@@ -89,7 +172,8 @@ class Mission:
             data['required_authorizations'],
             data['daily_personnel']
         )
-        mission.personnel_per_shift = data.get('personnel_per_shift', {})
+        mission.personnel_per_shift = {intern_string(shift): count
+                                       for shift, count in data.get('personnel_per_shift', {}).items()}
         return mission
 
     def __str__(self):
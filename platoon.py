@@ -1,5 +1,5 @@
-from typing import List, Dict
-from soldier import Soldier
+from typing import List, Dict, Optional, Set
+from soldier import Soldier, WEEK_DAYS, intern_string, intern_dict
 from mission import Mission
 
 
@@ -8,35 +8,164 @@ class Platoon:
     Represents a platoon containing soldiers and assigned missions
     """
 
+    __slots__ = ('_name', '_members', '_soldier_list', 'weekly_missions', 'home_time_schedule', 'platoon_constraints',
+                 '_soldiers_by_serial', '_soldiers_by_authorization', '_company')
+
     def __init__(self, name: str):
+        self._company = None  # Company object holding this platoon (kept by Company)
         self.name = name
-        self.soldiers = []  # List of Soldier objects
+        self._members = {}  # Soldier -> None, an insertion-ordered identity set of members
+        self._soldier_list = []  # Cached ordered list behind the soldiers property (None = rebuild)
         self.weekly_missions = []  # List of assigned Mission objects for the week
         self.home_time_schedule = {}  # Weekly home time planning
         self.platoon_constraints = {}  # Platoon-level constraints and preferences
+        self._soldiers_by_serial = {}  # Serial number -> Soldier index for O(1) lookups
+        self._soldiers_by_authorization = {}  # Authorization -> set of Soldiers holding it
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = intern_string(value)
+        if self._company is not None:
+            self._company._on_platoon_changed(self)
+
+    @property
+    def soldiers(self) -> List[Soldier]:
+        """Ordered list of Soldier objects (read-only - use add_soldier/remove_soldier)"""
+        if self._soldier_list is None:
+            self._soldier_list = list(self._members)
+        return self._soldier_list
+
+    def has_soldier(self, soldier: Soldier) -> bool:
+        """Check if a soldier is a member of the platoon"""
+        return soldier in self._members
 
     def add_soldier(self, soldier: Soldier):
-        """Add a soldier to the platoon"""
-        if soldier not in self.soldiers:
-            self.soldiers.append(soldier)
-            # Update soldier's platoon assignment
-            soldier.platoon = self.name
+        """Add a soldier to the platoon (raises ValueError on a duplicate serial number)"""
+        if self._company is not None:
+            soldier = self._company._adopt_soldier(self, soldier)
+        if soldier not in self._members:
+            self._check_serial_available(soldier, soldier.serial_number)
+            self._attach(soldier)
+
+            if self._company is not None:
+                self._company._on_soldier_added(self, soldier)
+
+    def add_soldiers(self, soldiers: List[Soldier]):
+        """Add many soldiers at once (raises ValueError before adding anything if a serial number is duplicated)"""
+        if self._company is not None:
+            soldiers = [self._company._adopt_soldier(self, soldier) for soldier in soldiers]
+        new_soldiers = []
+        batch_serials = {}
+        for soldier in soldiers:
+            if soldier in self._members or batch_serials.get(soldier.serial_number) is soldier:
+                continue
+            if soldier.serial_number in batch_serials:
+                raise ValueError(f"Serial number {soldier.serial_number} is already assigned to "
+                                 f"{batch_serials[soldier.serial_number].name}")
+            self._check_serial_available(soldier, soldier.serial_number)
+            batch_serials[soldier.serial_number] = soldier
+            new_soldiers.append(soldier)
+
+        for soldier in new_soldiers:
+            self._attach(soldier)
+
+        if new_soldiers and self._company is not None:
+            self._company._on_soldiers_added(self, new_soldiers)
+
+    def _attach(self, soldier: Soldier):
+        """Make a soldier a member and index it (no company notification)"""
+        # A soldier belongs to a single platoon - moving detaches from the old one
+        if soldier._platoon is not None and soldier._platoon is not self:
+            soldier._platoon.remove_soldier(soldier)
+
+        self._members[soldier] = None
+        if self._soldier_list is not None:
+            self._soldier_list.append(soldier)
+        self._soldiers_by_serial[soldier.serial_number] = soldier
+        for auth in soldier.authorizations:
+            self._soldiers_by_authorization.setdefault(auth, set()).add(soldier)
+        soldier._platoon = self
+        # Update soldier's platoon assignment
+        soldier.platoon = self.name
 
     def remove_soldier(self, soldier: Soldier):
         """Remove a soldier from the platoon"""
-        if soldier in self.soldiers:
-            self.soldiers.remove(soldier)
+        if soldier in self._members:
+            del self._members[soldier]
+            self._soldier_list = None
+            if self._soldiers_by_serial.get(soldier.serial_number) is soldier:
+                del self._soldiers_by_serial[soldier.serial_number]
+            for auth in soldier.authorizations:
+                self._unindex_authorization(soldier, auth)
+            if soldier._platoon is self:
+                soldier._platoon = None
 
-    def get_soldier_by_serial(self, serial_number: str) -> Soldier:
+            if self._company is not None:
+                self._company._on_soldier_removed(self, soldier)
+
+    def get_soldier_by_serial(self, serial_number: str) -> Optional[Soldier]:
         """Find a soldier by their serial number"""
-        for soldier in self.soldiers:
-            if soldier.serial_number == serial_number:
-                return soldier
-        return None
+        return self._soldiers_by_serial.get(serial_number)
+
+    def _check_serial_available(self, soldier: Soldier, serial_number: str):
+        """Raise ValueError if another soldier already uses this serial number"""
+        if self._company is not None:
+            existing = self._company.get_soldier_by_serial(serial_number)
+        else:
+            existing = self._soldiers_by_serial.get(serial_number)
+
+        if existing is not None and existing is not soldier:
+            raise ValueError(f"Serial number {serial_number} is already assigned to {existing.name}")
+
+    def _on_soldier_serial_changed(self, soldier: Soldier, old_serial: str, new_serial: str):
+        """Re-key a member soldier in the serial indexes before its serial number changes"""
+        self._check_serial_available(soldier, new_serial)
+
+        if self._soldiers_by_serial.get(old_serial) is soldier:
+            del self._soldiers_by_serial[old_serial]
+        self._soldiers_by_serial[new_serial] = soldier
+
+        if self._company is not None:
+            self._company._on_soldier_serial_changed(soldier, old_serial, new_serial)
+
+    def _unindex_authorization(self, soldier: Soldier, authorization: str):
+        """Drop a soldier from the authorization index, removing empty entries"""
+        holders = self._soldiers_by_authorization.get(authorization)
+        if holders is not None:
+            holders.discard(soldier)
+            if not holders:
+                del self._soldiers_by_authorization[authorization]
+
+    def _on_soldier_authorization_changed(self, soldier: Soldier, authorization: str, added: bool):
+        """Called by a member soldier after it gained or lost an authorization"""
+        if added:
+            self._soldiers_by_authorization.setdefault(authorization, set()).add(soldier)
+        else:
+            self._unindex_authorization(soldier, authorization)
+
+        if self._company is not None:
+            self._company._on_soldier_authorization_changed(soldier, authorization, added)
+
+    def _on_soldier_changed(self, soldier: Soldier):
+        """Called by a member soldier after its preferred shift or home time constraints changed"""
+        if self._company is not None:
+            self._company._on_soldier_changed(soldier)
 
     def get_soldiers_by_authorization(self, authorization: str) -> List[Soldier]:
         """Get all soldiers with a specific authorization"""
-        return [soldier for soldier in self.soldiers if soldier.has_authorization(authorization)]
+        return list(self._soldiers_by_authorization.get(authorization, ()))
+
+    def get_soldier_set_by_authorization(self, authorization: str) -> Set[Soldier]:
+        """Get the indexed set of soldiers holding an authorization (read-only, do not modify)"""
+        return self._soldiers_by_authorization.get(authorization, set())
+
+    def count_soldiers_by_authorization(self, authorization: str) -> int:
+        """Count soldiers holding a specific authorization"""
+        return len(self._soldiers_by_authorization.get(authorization, ()))
 
     def get_soldiers_by_preferred_shift(self, shift: str) -> List[Soldier]:
         """Get all soldiers who prefer a specific shift"""
@@ -46,11 +175,15 @@ class Platoon:
         """Assign a mission to the platoon for the week"""
         if mission not in self.weekly_missions:
             self.weekly_missions.append(mission)
+            if self._company is not None:
+                self._company._on_platoon_changed(self)
 
     def unassign_mission(self, mission: Mission):
         """Remove a mission assignment from the platoon"""
         if mission in self.weekly_missions:
             self.weekly_missions.remove(mission)
+            if self._company is not None:
+                self._company._on_platoon_changed(self)
 
     def can_fulfill_mission(self, mission: Mission) -> Dict[str, bool]:
         """Check if platoon can fulfill mission requirements"""
@@ -68,20 +201,27 @@ class Platoon:
 
         # Check if we have soldiers with required authorizations
         for auth in mission.required_authorizations:
-            soldiers_with_auth = self.get_soldiers_by_authorization(auth)
-            if not soldiers_with_auth:
+            holders_count = self.count_soldiers_by_authorization(auth)
+            if not holders_count:
                 result['can_fulfill'] = False
                 result['missing_authorizations'].append(auth)
-            result['details'][auth] = len(soldiers_with_auth)
+            result['details'][auth] = holders_count
 
         return result
 
     def set_home_time_schedule(self, week_day: str, schedule: str):
         """Set home time schedule for a specific day of the week"""
-        self.home_time_schedule[week_day] = schedule
+        self.home_time_schedule[intern_string(week_day)] = intern_string(schedule)
+        if self._company is not None:
+            self._company._on_platoon_schedule_changed(self)
 
     def get_available_soldiers(self, day: str, shift: str) -> List[Soldier]:
         """Get soldiers available for a specific day and shift (considering home time)"""
+        if self._company is not None and day in WEEK_DAYS:
+            # Vectorized lookup in the company's compiled availability tensor
+            tensor = self._company.get_availability_tensor()
+            return tensor.get_available_soldiers(day, shift, tensor.columns.platoon_rows(self))
+
         available = []
         for soldier in self.soldiers:
             # Check if soldier has home time constraint for this day
@@ -100,15 +240,44 @@ class Platoon:
 
     def get_soldier_count(self) -> int:
         """Get total number of soldiers in platoon"""
-        return len(self.soldiers)
+        return len(self._members)
 
     def get_authorization_summary(self) -> Dict[str, int]:
         """Get summary of authorizations available in the platoon"""
-        auth_count = {}
-        for soldier in self.soldiers:
-            for auth in soldier.authorizations:
-                auth_count[auth] = auth_count.get(auth, 0) + 1
-        return auth_count
+        return {auth: len(holders) for auth, holders in self._soldiers_by_authorization.items()}
+
+    def clone(self):
+        """
+        Detached copy (no company) with its own membership, indexes and schedules.
+        Soldier and Mission objects are shared, not re-parented - use _replace_member to swap in a soldier copy.
+        """
+        platoon = Platoon.__new__(Platoon)
+        platoon._company = None
+        platoon._name = self._name
+        platoon._members = dict(self._members)
+        platoon._soldier_list = None
+        platoon.weekly_missions = list(self.weekly_missions)
+        platoon.home_time_schedule = dict(self.home_time_schedule)
+        platoon.platoon_constraints = dict(self.platoon_constraints)
+        platoon._soldiers_by_serial = dict(self._soldiers_by_serial)
+        platoon._soldiers_by_authorization = {auth: set(holders)
+                                              for auth, holders in self._soldiers_by_authorization.items()}
+        return platoon
+
+    def _replace_member(self, old: Soldier, new: Soldier):
+        """Swap a member for another Soldier object in place (same position, indexes updated, no notification)"""
+        if old not in self._members:
+            return
+        self._members = {new if member is old else member: None for member in self._members}
+        self._soldier_list = None
+        if self._soldiers_by_serial.get(old.serial_number) is old:
+            del self._soldiers_by_serial[old.serial_number]
+        self._soldiers_by_serial[new.serial_number] = new
+        for auth in old.authorizations:
+            self._unindex_authorization(old, auth)
+        for auth in new.authorizations:
+            self._soldiers_by_authorization.setdefault(auth, set()).add(new)
+        new._platoon = self
 
     def to_dict(self) -> Dict:
         """Convert platoon object to dictionary for serialization"""
@@ -126,16 +295,14 @@ class Platoon:
         platoon = cls(data['name'])
 
         # Add soldiers
-        for soldier_data in data.get('soldiers', []):
-            soldier = Soldier.from_dict(soldier_data)
-            platoon.add_soldier(soldier)
+        platoon.add_soldiers([Soldier.from_dict(soldier_data) for soldier_data in data.get('soldiers', [])])
 
         # Add missions
         for mission_data in data.get('weekly_missions', []):
             mission = Mission.from_dict(mission_data)
             platoon.assign_mission(mission)
 
-        platoon.home_time_schedule = data.get('home_time_schedule', {})
+        platoon.home_time_schedule = intern_dict(data.get('home_time_schedule', {}))
         platoon.platoon_constraints = data.get('platoon_constraints', {})
 
         return platoon
@@ -0,0 +1,99 @@
+from collections import Counter
+from typing import List, Dict
+from roster_columns import RosterColumns
+
+
+class PooledStaffing:
+    """
+    Company-level staffing that may fill a mission from several platoons.
+
+    Works on aggregated counts, never on single soldiers: every platoon's roster is reduced to how many soldiers
+    hold each exact combination of authorizations (one pass over the roster columns). A mission can draw from
+    any combination that includes its required authorizations.
+
+    Missions are filled most constrained first (highest demand relative to the qualified people). Cohesion is
+    a soft preference: a mission stays in one platoon when any can staff it alone (the tightest fit, keeping
+    larger pools for larger missions), and is otherwise split over the fewest platoons - largest pools first.
+    Platoons the mission is already assigned to come first either way. Within a platoon, the least qualified
+    soldiers are drawn first, keeping holders of rare extra authorizations for the missions that need them.
+    """
+
+    def __init__(self, columns: RosterColumns, platoons: List):
+        self.columns = columns
+        self.platoons = platoons
+        self.pools = [{} for _ in platoons]  # Platoon index -> {authorization mask: soldiers left}
+
+        index_of = {id(platoon): index for index, platoon in enumerate(platoons)}
+        for (platoon_id, mask), count in Counter(zip(columns.platoon_ids, columns.authorization_masks)).items():
+            if platoon_id < 0:
+                continue  # Removed row
+            index = index_of.get(id(columns.platoons[platoon_id]))
+            if index is not None:
+                self.pools[index][mask] = count
+
+    def _available(self, index: int, required: int) -> int:
+        """Soldiers left in a platoon who hold every required authorization"""
+        return sum(count for mask, count in self.pools[index].items() if mask & required == required)
+
+    def _draw(self, index: int, required: int, count: int):
+        """Take soldiers from a platoon's pools, least qualified first"""
+        pool = self.pools[index]
+        for mask in sorted((mask for mask in pool if mask & required == required), key=int.bit_count):
+            taken = min(count, pool[mask])
+            pool[mask] -= taken
+            count -= taken
+            if not count:
+                break
+
+    def plan(self, missions: List) -> Dict:
+        """Staff missions from the pooled platoons"""
+        registry = self.columns.registry
+        required = [registry.mask_for(mission.required_authorizations) for mission in missions]
+
+        def scarcity(position: int) -> float:
+            qualified = sum(self._available(index, required[position]) for index in range(len(self.platoons)))
+            return missions[position].daily_personnel / qualified if qualified else float('inf')
+
+        staffing = {}
+        for position in sorted(range(len(missions)), key=scarcity, reverse=True):
+            mission = missions[position]
+            need = mission.daily_personnel
+            available = [(index, self._available(index, required[position])) for index in range(len(self.platoons))]
+            available = [(index, count) for index, count in available if count]
+
+            # One platoon if any can do it alone (preferring the assigned ones), otherwise the largest pools
+            # first - the fewest platoons that cover the demand
+            assigned = {index for index, platoon in enumerate(self.platoons)
+                        if any(other.name == mission.name for other in platoon.weekly_missions)}
+            whole = [(index, count) for index, count in available if count >= need]
+            if whole:
+                order = sorted(whole, key=lambda item: (item[0] not in assigned, item[1]))[:1]
+            else:
+                order = sorted(available, key=lambda item: (item[0] not in assigned, -item[1]))
+
+            contributions = {}
+            remaining = need
+            for index, count in order:
+                if not remaining:
+                    break
+                taken = min(count, remaining)
+                self._draw(index, required[position], taken)
+                contributions[self.platoons[index].name] = taken
+                remaining -= taken
+
+            staffing[mission.name] = {
+                'daily_personnel': need,
+                'platoons': contributions,
+                'staffed': need - remaining,
+                'shortage': remaining
+            }
+
+        return {
+            'missions': {mission.name: staffing[mission.name] for mission in missions},
+            'pooled_missions': [mission.name for mission in missions if len(staffing[mission.name]['platoons']) > 1],
+            'unstaffed_missions': [mission.name for mission in missions if staffing[mission.name]['shortage']],
+            'remaining': {platoon.name: sum(self.pools[index].values()) for index, platoon in enumerate(self.platoons)}
+        }
+
+    def __repr__(self):
+        return f"PooledStaffing(platoons={len(self.platoons)})"
@@ -0,0 +1,289 @@
+from array import array
+from itertools import compress
+from typing import List, Dict, Optional
+from soldier import Soldier, WEEK_DAYS
+from mission import Mission
+from authorization_registry import AuthorizationRegistry
+
+_DIGIT_VALUES = bytes.maketrans(b'01', b'\x00\x01')  # ASCII binary digits -> byte values
+
+
+class RosterColumns:
+    """
+    Column (struct-of-arrays) view of a company roster.
+
+    Every soldier gets a row index. Per-row data is kept in flat columns (platoon id, preferred-shift code,
+    authorization mask, weekday availability bitmap). Each attribute value also gets a bitset - a Python int
+    whose bit i is set when row i has that value - so counting queries become AND + popcount over whole
+    machine words instead of Python loops over Soldier objects.
+    """
+
+    def __init__(self, company, registry: Optional[AuthorizationRegistry] = None):
+        if registry is None:
+            registry = company.authorization_registry
+        self.registry = registry if registry is not None else AuthorizationRegistry()
+        self.shift_names = []  # Shift code -> shift name
+        self.platoons = []  # Platoon id -> Platoon object
+
+        # Row columns
+        self.soldiers = []  # Row -> Soldier (None for removed rows)
+        self.platoon_ids = array('i')  # Row -> platoon id (-1 for removed rows)
+        self.shift_codes = array('b')  # Row -> preferred shift code (-1 if unknown)
+        self.authorization_masks = []  # Row -> authorization bitmask (Python ints, unbounded width)
+        self.availability = array('B')  # Row -> weekday bitmap, bit d set = available on WEEK_DAYS[d]
+
+        # Bitsets over rows
+        self.live_bits = 0
+        self.authorization_bits = {}  # Authorization bit -> rows holding it
+        self.platoon_bits = []  # Platoon id -> rows in the platoon
+        self.shift_bits = []  # Shift code -> rows preferring it
+        self.day_bits = [0] * len(WEEK_DAYS)  # Day index -> rows available that day
+
+        self._row_of = {}  # id(Soldier) -> row
+        self._platoon_id_of = {}  # id(Platoon) -> platoon id
+        self.removed_rows = 0
+
+        self._build(company)
+
+    def _build(self, company):
+        """Fill all columns in one linear pass, then turn the collected row lists into bitsets"""
+        rows_by_platoon = []
+        rows_by_authorization = {}
+        rows_by_shift = []
+        rows_by_day = [[] for _ in WEEK_DAYS]
+
+        for platoon in company.platoons:
+            platoon_id = self._platoon_id(platoon)
+            rows_by_platoon.append([])
+            for soldier in platoon.soldiers:
+                row = len(self.soldiers)
+                self._row_of[id(soldier)] = row
+                self.soldiers.append(soldier)
+                self.platoon_ids.append(platoon_id)
+                rows_by_platoon[platoon_id].append(row)
+
+                mask = self.registry.mask_for(soldier.authorizations)
+                self.authorization_masks.append(mask)
+                for bit in self._bits_of(mask):
+                    rows_by_authorization.setdefault(bit, []).append(row)
+
+                code = self._shift_code(soldier.preferred_shift)
+                self.shift_codes.append(code)
+                if code >= 0:
+                    while len(rows_by_shift) <= code:
+                        rows_by_shift.append([])
+                    rows_by_shift[code].append(row)
+
+                bitmap = self._availability_bitmap(soldier, platoon)
+                self.availability.append(bitmap)
+                for day_index in range(len(WEEK_DAYS)):
+                    if bitmap >> day_index & 1:
+                        rows_by_day[day_index].append(row)
+
+        size = len(self.soldiers)
+        self.live_bits = (1 << size) - 1
+        self.platoon_bits = [self._bitset(rows, size) for rows in rows_by_platoon]
+        self.authorization_bits = {bit: self._bitset(rows, size) for bit, rows in rows_by_authorization.items()}
+        self.shift_bits = [self._bitset(rows, size) for rows in rows_by_shift]
+        self.shift_bits.extend([0] * (len(self.shift_names) - len(self.shift_bits)))
+        self.day_bits = [self._bitset(rows, size) for rows in rows_by_day]
+
+    @staticmethod
+    def _bitset(rows: List[int], size: int) -> int:
+        """Build a bitset from row indexes in linear time"""
+        buffer = bytearray((size + 7) // 8)
+        for row in rows:
+            buffer[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(buffer, 'little')
+
+    # Maintenance (called by Company as the model changes)
+
+    def _platoon_id(self, platoon) -> int:
+        """Get the id of a platoon, registering it if it is new"""
+        platoon_id = self._platoon_id_of.get(id(platoon))
+        if platoon_id is None:
+            platoon_id = len(self.platoons)
+            self._platoon_id_of[id(platoon)] = platoon_id
+            self.platoons.append(platoon)
+            self.platoon_bits.append(0)
+        return platoon_id
+
+    def _shift_code(self, shift: str) -> int:
+        """Get the code of a shift name, registering it if it is new"""
+        if not shift:
+            return -1
+        try:
+            return self.shift_names.index(shift)
+        except ValueError:
+            self.shift_names.append(shift)
+            self.shift_bits.append(0)
+            return len(self.shift_names) - 1
+
+    @staticmethod
+    def _availability_bitmap(soldier: Soldier, platoon) -> int:
+        """Weekday bitmap of the days a soldier is not at home"""
+        bitmap = 0
+        for day_index, day in enumerate(WEEK_DAYS):
+            if soldier.home_time_constraints.get(day) == "home":
+                continue
+            if platoon is not None and platoon.home_time_schedule.get(day) == "home":
+                continue
+            bitmap |= 1 << day_index
+        return bitmap
+
+    def add_soldier(self, soldier: Soldier):
+        """Append a row for a soldier"""
+        if id(soldier) in self._row_of:
+            return
+        row = len(self.soldiers)
+        row_bit = 1 << row
+        self._row_of[id(soldier)] = row
+        self.soldiers.append(soldier)
+        self.live_bits |= row_bit
+
+        platoon_id = self._platoon_id(soldier._platoon) if soldier._platoon is not None else -1
+        self.platoon_ids.append(platoon_id)
+        if platoon_id >= 0:
+            self.platoon_bits[platoon_id] |= row_bit
+
+        mask = self.registry.mask_for(soldier.authorizations)
+        self.authorization_masks.append(mask)
+        for bit in self._bits_of(mask):
+            self.authorization_bits[bit] = self.authorization_bits.get(bit, 0) | row_bit
+
+        self.shift_codes.append(-1)
+        self.availability.append(0)
+        self._write_preferences(row, soldier)
+
+    def remove_soldier(self, soldier: Soldier):
+        """Clear a soldier's row (rows are not reused until the columns are rebuilt)"""
+        row = self._row_of.pop(id(soldier), None)
+        if row is None:
+            return
+        keep = ~(1 << row)
+        self.live_bits &= keep
+        if self.platoon_ids[row] >= 0:
+            self.platoon_bits[self.platoon_ids[row]] &= keep
+        for bit in self._bits_of(self.authorization_masks[row]):
+            self.authorization_bits[bit] &= keep
+        if self.shift_codes[row] >= 0:
+            self.shift_bits[self.shift_codes[row]] &= keep
+        for day_index in range(len(WEEK_DAYS)):
+            self.day_bits[day_index] &= keep
+
+        self.soldiers[row] = None
+        self.platoon_ids[row] = -1
+        self.shift_codes[row] = -1
+        self.authorization_masks[row] = 0
+        self.availability[row] = 0
+        self.removed_rows += 1
+
+    def update_authorization(self, soldier: Soldier, authorization: str, added: bool):
+        """Flip one authorization bit of a soldier's row"""
+        row = self._row_of.get(id(soldier))
+        if row is None:
+            return
+        bit = self.registry.register(authorization)
+        if added:
+            self.authorization_masks[row] |= 1 << bit
+            self.authorization_bits[bit] = self.authorization_bits.get(bit, 0) | (1 << row)
+        else:
+            self.authorization_masks[row] &= ~(1 << bit)
+            self.authorization_bits[bit] = self.authorization_bits.get(bit, 0) & ~(1 << row)
+
+    def update_soldier(self, soldier: Soldier):
+        """Refresh the preferred shift and availability of a soldier's row"""
+        row = self._row_of.get(id(soldier))
+        if row is not None:
+            self._write_preferences(row, soldier)
+
+    def update_platoon(self, platoon):
+        """Refresh availability of every row in a platoon (after a home time schedule change)"""
+        for soldier in platoon.soldiers:
+            self.update_soldier(soldier)
+
+    def _write_preferences(self, row: int, soldier: Soldier):
+        """Write the shift code and availability columns of a row, keeping their bitsets in sync"""
+        row_bit = 1 << row
+        old_code = self.shift_codes[row]
+        if old_code >= 0:
+            self.shift_bits[old_code] &= ~row_bit
+        code = self._shift_code(soldier.preferred_shift)
+        self.shift_codes[row] = code
+        if code >= 0:
+            self.shift_bits[code] |= row_bit
+
+        bitmap = self._availability_bitmap(soldier, soldier._platoon)
+        self.availability[row] = bitmap
+        for day_index in range(len(WEEK_DAYS)):
+            if bitmap >> day_index & 1:
+                self.day_bits[day_index] |= row_bit
+            else:
+                self.day_bits[day_index] &= ~row_bit
+
+    @staticmethod
+    def _bits_of(mask: int) -> List[int]:
+        """List the set bit positions of a mask"""
+        digits = RosterColumns._digits(mask)
+        return list(compress(range(len(digits)), digits))
+
+    @staticmethod
+    def _digits(mask: int) -> bytes:
+        """Binary digits of a mask as 0/1 bytes, least significant first (lets itertools.compress select in C)"""
+        return bin(mask)[:1:-1].encode().translate(_DIGIT_VALUES)
+
+    # Vectorized queries
+
+    def platoon_rows(self, platoon) -> int:
+        """Bitset of the rows in a platoon (0 for an unknown platoon)"""
+        platoon_id = self._platoon_id_of.get(id(platoon))
+        return self.platoon_bits[platoon_id] if platoon_id is not None else 0
+
+    def authorization_rows(self, authorization: str) -> int:
+        """Bitset of the rows holding an authorization"""
+        bit = self.registry.get_bit(authorization)
+        return self.authorization_bits.get(bit, 0) if bit is not None else 0
+
+    def rows_covering(self, required_mask: int, rows: Optional[int] = None) -> int:
+        """Bitset of the rows holding every authorization in a mask (optionally within a row subset)"""
+        result = self.live_bits if rows is None else rows
+        for bit in self._bits_of(required_mask):
+            result &= self.authorization_bits.get(bit, 0)
+            if not result:
+                break
+        return result
+
+    def rows_for_mission(self, mission: Mission, rows: Optional[int] = None) -> int:
+        """Bitset of the rows qualified for a mission"""
+        return self.rows_covering(self.registry.mask_for(mission.required_authorizations), rows)
+
+    def available_rows(self, day: str) -> int:
+        """Bitset of the rows not at home on a day"""
+        return self.day_bits[WEEK_DAYS.index(day)] if day in WEEK_DAYS else self.live_bits
+
+    def shift_rows(self, shift: str) -> int:
+        """Bitset of the rows preferring a shift"""
+        return self.shift_bits[self.shift_names.index(shift)] if shift in self.shift_names else 0
+
+    def authorization_counts(self, rows: Optional[int] = None) -> Dict[str, int]:
+        """Count holders of every authorization (optionally within a row subset)"""
+        counts = {}
+        for bit, holders in self.authorization_bits.items():
+            count = (holders & rows).bit_count() if rows is not None else holders.bit_count()
+            if count:
+                counts[self.registry.get_name(bit)] = count
+        return counts
+
+    def soldiers_in(self, rows: int) -> List[Soldier]:
+        """Decode a row bitset into Soldier objects (in row order)"""
+        return list(compress(self.soldiers, self._digits(rows)))
+
+    def row_of(self, soldier: Soldier) -> Optional[int]:
+        """Get the row index of a soldier"""
+        return self._row_of.get(id(soldier))
+
+    def __len__(self):
+        return self.live_bits.bit_count()
+
+    def __repr__(self):
+        return f"RosterColumns(soldiers={len(self)}, platoons={len(self.platoons)})"
@@ -0,0 +1,182 @@
+import time
+from typing import List, Dict, Optional, Iterable
+from scheduler import ScheduleProblem, WeeklyRoster
+
+MAX_CHAIN_ATTEMPTS = 25  # Working soldiers tried per missing person before a slot is left short
+
+
+class RosterRepair:
+    """
+    Local repair of an existing weekly roster after a small change.
+
+    A change is applied to the problem snapshot and only the slots it touches are fixed: a removed soldier is
+    replaced by a free eligible soldier (least loaded, preferred shift first), or - if nobody is free - by a
+    soldier pulled from another slot that day which a free soldier can take over. Every other assignment is
+    left unchanged. The roster is modified in place.
+    """
+
+    def __init__(self, problem: ScheduleProblem, roster: WeeklyRoster):
+        self.problem = problem
+        self.roster = roster
+        self.counts = roster.get_assignment_counts()
+        self._eligible = {}  # Mission -> eligible soldiers, built on first use
+        self._soldier_index = {serial: index for index, serial in enumerate(problem.serials)}
+
+    def apply(self, change: Dict) -> Dict:
+        """
+        Apply a change given as a dictionary and repair the roster:
+        {'type': 'soldier_unavailable', 'serial_number': ..., 'days': [...] (optional, default whole week)}
+        {'type': 'mission_personnel', 'mission': ..., 'personnel_per_shift': {shift: count}}
+        {'type': 'authorization_revoked', 'serial_number': ..., 'authorization': ...}
+        """
+        change_type = change.get('type')
+        if change_type == 'soldier_unavailable':
+            return self.soldier_unavailable(change['serial_number'], change.get('days'))
+        if change_type == 'mission_personnel':
+            return self.mission_personnel_changed(change['mission'], change['personnel_per_shift'])
+        if change_type == 'authorization_revoked':
+            return self.authorization_revoked(change['serial_number'], change['authorization'])
+        raise ValueError(f"Unknown roster change type: {change_type}")
+
+    # Changes
+
+    def soldier_unavailable(self, serial_number: str, days: Optional[Iterable[str]] = None) -> Dict:
+        """A soldier can no longer work on some days (emergency leave, ...)"""
+        report = self._new_report('soldier_unavailable')
+        soldier = self._get_soldier(serial_number)
+        for day in self._day_indexes(days):
+            self.problem.availability[soldier] &= ~(1 << day)
+            current = self.roster.working[day].get(soldier)
+            if current is not None:
+                shift, mission = current
+                self._remove(day, shift, mission, soldier, report)
+                self._fill(day, shift, mission, report)
+        return self._finish(report)
+
+    def mission_personnel_changed(self, mission_name: str, personnel_per_shift: Dict[str, int]) -> Dict:
+        """A mission needs a different number of people on some shifts"""
+        report = self._new_report('mission_personnel')
+        mission = self._get_mission(mission_name)
+        for shift_name, count in personnel_per_shift.items():
+            shift = self.problem.shift_code(shift_name)
+            self.problem.mission_demand[mission][shift] = count
+            for day in range(len(self.problem.days)):
+                members = self.roster.get_assigned(day, shift, mission)
+                excess = len(members) - count
+                if excess > 0:
+                    # Release the most loaded, off-preference soldiers first
+                    released = sorted(members, key=lambda soldier: (self.problem.preferred_shifts[soldier] == shift,
+                                                                    -self.counts[soldier]))[:excess]
+                    for soldier in released:
+                        self._remove(day, shift, mission, soldier, report)
+                else:
+                    self._fill(day, shift, mission, report)
+        return self._finish(report)
+
+    def authorization_revoked(self, serial_number: str, authorization: str) -> Dict:
+        """A soldier lost an authorization; slots that required it are re-staffed"""
+        report = self._new_report('authorization_revoked')
+        soldier = self._get_soldier(serial_number)
+        if authorization not in self.problem.authorizations:
+            return self._finish(report)
+        bit = 1 << self.problem.authorizations.index(authorization)
+        self.problem.soldier_masks[soldier] &= ~bit
+
+        for mission, eligible in self._eligible.items():
+            if self.problem.mission_masks[mission] & bit and soldier in eligible:
+                eligible.remove(soldier)
+        for day in range(len(self.problem.days)):
+            current = self.roster.working[day].get(soldier)
+            if current is not None and not self.problem.is_eligible(soldier, current[1]):
+                shift, mission = current
+                self._remove(day, shift, mission, soldier, report)
+                self._fill(day, shift, mission, report)
+        return self._finish(report)
+
+    # Local search
+
+    def _fill(self, day: int, shift: int, mission: int, report: Dict):
+        """Bring a slot back to its demand with free soldiers, then with one-step replacement chains"""
+        needed = self.problem.get_demand(mission, shift) - len(self.roster.get_assigned(day, shift, mission))
+        if needed <= 0:
+            return
+
+        for soldier in self._free_candidates(day, shift, mission)[:needed]:
+            self._add(day, shift, mission, soldier, report)
+            needed -= 1
+
+        attempts = 0
+        for soldier in self._eligible_soldiers(mission):
+            if needed <= 0 or attempts >= MAX_CHAIN_ATTEMPTS:
+                break
+            current = self.roster.working[day].get(soldier)
+            if current is None or current == (shift, mission) or not self.problem.availability[soldier] >> day & 1:
+                continue
+            attempts += 1
+            other_shift, other_mission = current
+            replacements = self._free_candidates(day, other_shift, other_mission)
+            if replacements:
+                self._remove(day, other_shift, other_mission, soldier, report)
+                self._add(day, other_shift, other_mission, replacements[0], report)
+                self._add(day, shift, mission, soldier, report)
+                needed -= 1
+
+        if needed > 0:
+            report['unfilled'].append({'day': self.problem.days[day], 'shift': self.problem.shifts[shift],
+                                       'mission': self.problem.mission_names[mission], 'missing': needed})
+
+    def _free_candidates(self, day: int, shift: int, mission: int) -> List[int]:
+        """Free, available, eligible soldiers for a slot - least loaded and preferring the shift first"""
+        candidates = [soldier for soldier in self._eligible_soldiers(mission)
+                      if self.problem.availability[soldier] >> day & 1 and soldier not in self.roster.working[day]]
+        candidates.sort(key=lambda soldier: (self.counts[soldier], self.problem.preferred_shifts[soldier] != shift))
+        return candidates
+
+    def _eligible_soldiers(self, mission: int) -> List[int]:
+        eligible = self._eligible.get(mission)
+        if eligible is None:
+            eligible = self._eligible[mission] = self.problem.eligible_soldiers(mission)
+        return eligible
+
+    # Bookkeeping
+
+    def _add(self, day: int, shift: int, mission: int, soldier: int, report: Dict):
+        self.roster.assign(day, shift, mission, soldier)
+        self.counts[soldier] += 1
+        report['added'].append(self._describe(day, shift, mission, soldier))
+
+    def _remove(self, day: int, shift: int, mission: int, soldier: int, report: Dict):
+        self.roster.unassign(day, shift, mission, soldier)
+        self.counts[soldier] -= 1
+        report['removed'].append(self._describe(day, shift, mission, soldier))
+
+    def _describe(self, day: int, shift: int, mission: int, soldier: int) -> Dict:
+        problem = self.problem
+        return {'day': problem.days[day], 'shift': problem.shifts[shift],
+                'mission': problem.mission_names[mission], 'serial_number': problem.serials[soldier]}
+
+    def _new_report(self, change_type: str) -> Dict:
+        return {'change': change_type, 'removed': [], 'added': [], 'unfilled': [], '_started': time.perf_counter()}
+
+    def _finish(self, report: Dict) -> Dict:
+        report['elapsed_ms'] = round((time.perf_counter() - report.pop('_started')) * 1000, 3)
+        return report
+
+    def _get_soldier(self, serial_number: str) -> int:
+        soldier = self._soldier_index.get(serial_number)
+        if soldier is None:
+            raise ValueError(f"Soldier {serial_number} is not part of the roster")
+        return soldier
+
+    def _get_mission(self, mission_name: str) -> int:
+        if mission_name not in self.problem.mission_names:
+            raise ValueError(f"Mission {mission_name} is not part of the roster")
+        return self.problem.mission_names.index(mission_name)
+
+    def _day_indexes(self, days: Optional[Iterable[str]]) -> List[int]:
+        if days is None:
+            return list(range(len(self.problem.days)))
+        return [self.problem.days.index(day) for day in days if day in self.problem.days]
+
+    def __repr__(self):
+        return f"RosterRepair(week='{self.problem.week}')"
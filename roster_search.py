@@ -0,0 +1,314 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Callable
+from scheduler import (ScheduleProblem, WeeklyRoster, greedy_weekly_roster,
+                       UNFILLED_WEIGHT, PREFERENCE_WEIGHT, FAIRNESS_WEIGHT)
+
+# Annealing temperature range, in objective units
+START_TEMPERATURE = 0.2 * PREFERENCE_WEIGHT
+END_TEMPERATURE = 0.05
+CANDIDATE_SAMPLES = 8  # Random candidates tried per move before giving up
+
+
+class AnytimeRosterSearch:
+    """
+    Simulated annealing over a weekly roster under a wall-clock budget.
+
+    The search starts from the greedy roster (or a given one) and keeps the best roster seen so far, so it can be
+    stopped and queried at any time. Moves work on one day at a time and never break the hard rules
+    (eligibility, availability, one slot per soldier per day):
+
+    - fill: put a free soldier, or one pulled from another slot, on an understaffed slot
+    - replace: swap a working soldier for a free one
+    - swap: exchange the slots of two soldiers working the same day
+
+    The objective terms (see scheduler.evaluate_roster) are updated incrementally per move.
+    """
+
+    def __init__(self, problem: ScheduleProblem, roster: Optional[WeeklyRoster] = None, seed: Optional[int] = None):
+        self.problem = problem
+        self.random = random.Random(seed)
+        self.roster = roster.copy() if roster is not None else greedy_weekly_roster(problem, self.random)
+
+        self.groups = problem.slot_groups()  # Group index -> (mission, shift, personnel)
+        self._group_of = {(mission, shift): index for index, (mission, shift, _) in enumerate(self.groups)}
+        eligible = {}
+        for mission, _, _ in self.groups:
+            if mission not in eligible:
+                eligible[mission] = problem.eligible_soldiers(mission)
+        self.eligible = [eligible[mission] for mission, _, _ in self.groups]  # Group index -> eligible soldiers
+
+        # Incremental objective terms
+        self.counts = self.roster.get_assignment_counts()
+        self.shortfall = {}  # (day, group index) -> missing personnel
+        for day in range(len(problem.days)):
+            for index, (mission, shift, count) in enumerate(self.groups):
+                missing = count - len(self.roster.get_assigned(day, shift, mission))
+                if missing > 0:
+                    self.shortfall[(day, index)] = missing
+        self.off_preference = sum(1 for day_working in self.roster.working
+                                  for soldier, (shift, _) in day_working.items()
+                                  if problem.preferred_shifts[soldier] != shift)
+        self.missing_total = sum(self.shortfall.values())
+        self.load_squares = sum(count * count for count in self.counts)
+
+        # The best roster is copied lazily: while _best_saved is False the current roster is the best one
+        self.best_roster = self.roster.copy()
+        self.best_objective = self.objective
+        self._best_saved = True
+        self.start_objective = self.objective
+        self.iterations = 0
+        self.elapsed = 0.0
+        self.progress = [(0.0, self.objective)]  # (seconds searched, best objective) at every improvement
+
+    @property
+    def objective(self) -> int:
+        """Objective of the current roster (see scheduler.evaluate_roster)"""
+        return (UNFILLED_WEIGHT * self.missing_total + PREFERENCE_WEIGHT * self.off_preference
+                + FAIRNESS_WEIGHT * self.load_squares)
+
+    def _preference_cost(self, soldier: int, shift: int) -> int:
+        return PREFERENCE_WEIGHT if self.problem.preferred_shifts[soldier] != shift else 0
+
+    def _can_work(self, soldier: int, day: int, group_index: int) -> bool:
+        """Check if a soldier may staff a group on a day (ignoring whether they already work)"""
+        return (self.problem.availability[soldier] >> day & 1) == 1 and \
+            self.problem.is_eligible(soldier, self.groups[group_index][0])
+
+    # Bookkeeping
+
+    def _add(self, day: int, group_index: int, soldier: int):
+        mission, shift, _ = self.groups[group_index]
+        self.roster.assign(day, shift, mission, soldier)
+        self.load_squares += 2 * self.counts[soldier] + 1
+        self.counts[soldier] += 1
+        if self.problem.preferred_shifts[soldier] != shift:
+            self.off_preference += 1
+        self._update_shortfall(day, group_index)
+
+    def _remove(self, day: int, group_index: int, soldier: int):
+        mission, shift, _ = self.groups[group_index]
+        self.roster.unassign(day, shift, mission, soldier)
+        self.load_squares -= 2 * self.counts[soldier] - 1
+        self.counts[soldier] -= 1
+        if self.problem.preferred_shifts[soldier] != shift:
+            self.off_preference -= 1
+        self._update_shortfall(day, group_index)
+
+    def _update_shortfall(self, day: int, group_index: int):
+        mission, shift, count = self.groups[group_index]
+        missing = max(0, count - len(self.roster.get_assigned(day, shift, mission)))
+        self.missing_total += missing - self.shortfall.get((day, group_index), 0)
+        if missing:
+            self.shortfall[(day, group_index)] = missing
+        else:
+            self.shortfall.pop((day, group_index), None)
+
+    def _accept(self, delta: int, temperature: float) -> bool:
+        if delta <= 0:
+            return True
+        if self.random.random() >= math.exp(-delta / temperature):
+            return False
+        # Leaving the best state for a worse one - snapshot it first
+        self._save_best()
+        return True
+
+    def _save_best(self):
+        if not self._best_saved:
+            self.best_roster = self.roster.copy()
+            self._best_saved = True
+
+    # Moves
+
+    def _sample_candidates(self, group_index: int) -> List[int]:
+        candidates = self.eligible[group_index]
+        if len(candidates) <= CANDIDATE_SAMPLES:
+            return candidates
+        return [self.random.choice(candidates) for _ in range(CANDIDATE_SAMPLES)]
+
+    def _fill_move(self, temperature: float) -> bool:
+        """Staff an understaffed slot with a free soldier, or pull one from another slot of the same day"""
+        day, group_index = self.random.choice(list(self.shortfall))
+        shift = self.groups[group_index][1]
+        for soldier in self._sample_candidates(group_index):
+            if not self.problem.availability[soldier] >> day & 1:
+                continue
+            current = self.roster.working[day].get(soldier)
+            if current is None:
+                self._add(day, group_index, soldier)
+                return True
+            other_index = self._group_of[(current[1], current[0])]
+            if other_index == group_index:
+                continue
+            # Moving the soldier keeps the shortfall total, only preferences change
+            delta = self._preference_cost(soldier, shift) - self._preference_cost(soldier, current[0])
+            if self._accept(delta, temperature):
+                self._remove(day, other_index, soldier)
+                self._add(day, group_index, soldier)
+                return True
+        return False
+
+    def _random_assignment(self):
+        """Pick a random working (day, group index, soldier) or None"""
+        day = self.random.randrange(len(self.problem.days))
+        group_index = self.random.randrange(len(self.groups))
+        mission, shift, _ = self.groups[group_index]
+        members = self.roster.get_assigned(day, shift, mission)
+        if not members:
+            return None
+        return day, group_index, self.random.choice(members)
+
+    def _replace_move(self, temperature: float) -> bool:
+        """Hand a working soldier's slot to a free soldier"""
+        picked = self._random_assignment()
+        if picked is None:
+            return False
+        day, group_index, soldier = picked
+        shift = self.groups[group_index][1]
+        for candidate in self._sample_candidates(group_index):
+            if candidate == soldier or not self.roster.is_free(day, candidate) or \
+                    not self.problem.availability[candidate] >> day & 1:
+                continue
+            delta = (self._preference_cost(candidate, shift) - self._preference_cost(soldier, shift)
+                     + FAIRNESS_WEIGHT * 2 * (self.counts[candidate] - self.counts[soldier] + 1))
+            if self._accept(delta, temperature):
+                self._remove(day, group_index, soldier)
+                self._add(day, group_index, candidate)
+                return True
+            return False
+        return False
+
+    def _swap_move(self, temperature: float) -> bool:
+        """Exchange the slots of two soldiers working the same day"""
+        first = self._random_assignment()
+        if first is None:
+            return False
+        day, first_index, first_soldier = first
+        second_index = self.random.randrange(len(self.groups))
+        mission, second_shift, _ = self.groups[second_index]
+        members = self.roster.get_assigned(day, second_shift, mission)
+        if second_index == first_index or not members:
+            return False
+        second_soldier = self.random.choice(members)
+        if not self._can_work(first_soldier, day, second_index) or not self._can_work(second_soldier, day, first_index):
+            return False
+
+        first_shift = self.groups[first_index][1]
+        delta = (self._preference_cost(first_soldier, second_shift) + self._preference_cost(second_soldier, first_shift)
+                 - self._preference_cost(first_soldier, first_shift)
+                 - self._preference_cost(second_soldier, second_shift))
+        if not self._accept(delta, temperature):
+            return False
+        self._remove(day, first_index, first_soldier)
+        self._remove(day, second_index, second_soldier)
+        self._add(day, first_index, second_soldier)
+        self._add(day, second_index, first_soldier)
+        return True
+
+    # Driver
+
+    def run(self, time_budget: float, callback: Optional[Callable[[float, int], None]] = None) -> WeeklyRoster:
+        """
+        Search for up to time_budget seconds and return the best roster found so far.
+        Can be called again to continue searching; callback(elapsed, best_objective) runs on every improvement.
+        """
+        if not self.groups:
+            return self.best_roster
+
+        start = time.perf_counter()
+        deadline = start + max(0.0, time_budget)
+        ratio = END_TEMPERATURE / START_TEMPERATURE
+        now = start
+        while now < deadline:
+            # Check the clock in small batches so the deadline is never overrun by much
+            temperature = START_TEMPERATURE * ratio ** ((now - start) / time_budget)
+            for _ in range(64):
+                self.iterations += 1
+                if self.shortfall and self.random.random() < 0.5:
+                    self._fill_move(temperature)
+                elif self.random.random() < 0.5:
+                    self._replace_move(temperature)
+                else:
+                    self._swap_move(temperature)
+
+                if self.objective < self.best_objective:
+                    self.best_objective = self.objective
+                    self._best_saved = False
+                    elapsed = self.elapsed + time.perf_counter() - start
+                    self.progress.append((round(elapsed, 4), self.best_objective))
+                    if callback is not None:
+                        callback(elapsed, self.best_objective)
+            now = time.perf_counter()
+
+        self.elapsed += now - start
+        self._save_best()
+        return self.best_roster
+
+    def to_dict(self) -> Dict:
+        """Best roster (WeeklyRoster.to_dict) plus a report of the search"""
+        result = self.best_roster.to_dict()
+        result['search'] = {
+            'iterations': self.iterations,
+            'elapsed_seconds': round(self.elapsed, 4),
+            'start_objective': self.start_objective,
+            'best_objective': self.best_objective,
+            'progress': [list(point) for point in self.progress]
+        }
+        return result
+
+    def __repr__(self):
+        return f"AnytimeRosterSearch(best_objective={self.best_objective}, iterations={self.iterations})"
+
+
+def _run_restart(problem_data: Dict, seed: int, time_budget: float) -> Dict:
+    """Worker: rebuild the problem from its plain snapshot, search, and send back compact results"""
+    search = AnytimeRosterSearch(ScheduleProblem.from_dict(problem_data), seed=seed)
+    search.run(time_budget)
+    return {
+        'seed': seed,
+        'slots': search.best_roster.slots,
+        'start_objective': search.start_objective,
+        'best_objective': search.best_objective,
+        'iterations': search.iterations
+    }
+
+
+def parallel_roster_search(problem: ScheduleProblem, time_budget: float, restarts: Optional[int] = None,
+                           workers: Optional[int] = None, seed: int = 0) -> Dict:
+    """
+    Run independent, differently seeded searches in a process pool and keep the best roster.
+
+    Workers receive the problem's plain to_dict() snapshot (lists of ints and strings, no model objects) and
+    return only slot indexes. time_budget is the total search time over all restarts (what one core would spend),
+    split evenly between them, so the call returns after about time_budget * ceil(restarts / workers) / restarts
+    seconds: with the default one restart per worker, wall-clock time drops linearly with the core count.
+    Returns the best roster's to_dict() plus a per-restart report.
+    """
+    workers = workers or os.cpu_count() or 1
+    restarts = restarts or workers
+    restart_budget = time_budget / restarts
+    problem_data = problem.to_dict()
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_run_restart(problem_data, seed + index, restart_budget) for index in range(restarts)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, restarts)) as pool:
+            futures = [pool.submit(_run_restart, problem_data, seed + index, restart_budget)
+                       for index in range(restarts)]
+            results = [future.result() for future in futures]
+
+    best = min(results, key=lambda result: result['best_objective'])
+    output = WeeklyRoster.from_slots(problem, best['slots']).to_dict()
+    output['search'] = {
+        'workers': workers,
+        'elapsed_seconds': round(time.perf_counter() - started, 4),
+        'best_seed': best['seed'],
+        'best_objective': best['best_objective'],
+        'restarts': [{key: result[key] for key in ('seed', 'start_objective', 'best_objective', 'iterations')}
+                     for result in results]
+    }
+    return output
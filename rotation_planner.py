@@ -0,0 +1,174 @@
+import heapq
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+from scheduler import ScheduleProblem
+from flow_network import FlowNetwork
+
+
+class RotationPlanner:
+    """
+    Multi-week home leave calendar that keeps minimum manning every day.
+
+    Manning is each day's real staffing: a max flow from the missions (capacity: daily personnel) to the soldier
+    classes eligible for them (a class is an authorization mask and platoon) to the sink (capacity: members not
+    at home). Existing home time (soldier constraints, platoon home days) repeats every week and is fixed.
+    Leave never lowers a day's maximum flow, so a roster built with the calendar fills as many slots as before.
+
+    Leave is handed out by water-filling: a heap always serves the soldier with the fewest home days so far,
+    who gets the open day with the least leave already granted. Granting a day lowers the soldier's class
+    capacity by one; if the class is fully used, one unit of its work first moves to another class over a
+    residual path. If it cannot move, the class and every class the search reached stay closed on that day
+    (granting leave only removes flows, never adds them). Home days grow as far as manning allows and stay
+    within one of each other wherever the soldiers' qualifications allow it.
+    """
+
+    SOURCE = 0
+    SINK = 1
+
+    def __init__(self, problem: ScheduleProblem, weeks: int = 4, max_home_days_per_week: Optional[int] = None):
+        if weeks < 1:
+            raise ValueError("A rotation needs at least one week")
+        self.problem = problem
+        self.weeks = weeks
+        self.max_home_days_per_week = max_home_days_per_week
+        self.day_count = len(problem.days) * weeks
+
+    def _staffing_classes(self) -> Tuple[List[int], List[List[int]], List[int]]:
+        """Return (class per soldier, -1 = no mission; eligible missions per class; daily personnel per mission)"""
+        problem = self.problem
+        needs = [sum(demand) for demand in problem.mission_demand]
+
+        position_of = {}  # (mask, platoon) -> class position (-1 if eligible for no mission)
+        classes = []
+        soldier_classes = []
+        for soldier in range(problem.soldier_count):
+            key = (problem.soldier_masks[soldier], problem.soldier_platoons[soldier])
+            position = position_of.get(key)
+            if position is None:
+                missions = [mission for mission in range(problem.mission_count)
+                            if needs[mission] > 0 and problem.is_eligible(soldier, mission)]
+                position = len(classes) if missions else -1
+                if missions:
+                    classes.append(missions)
+                position_of[key] = position
+            soldier_classes.append(position)
+        return soldier_classes, classes, needs
+
+    def _day_network(self, classes: List[List[int]], needs: List[int], present: Counter):
+        """Staffing network of one day; returns (network, sink edge per class, maximum flow)"""
+        network = FlowNetwork(2 + len(needs) + len(classes))
+        for mission, need in enumerate(needs):
+            network.add_edge(self.SOURCE, 2 + mission, need)
+        sink_edges = []
+        for position, missions in enumerate(classes):
+            node = 2 + len(needs) + position  # Missions, then classes
+            for mission in missions:
+                network.add_edge(2 + mission, node, FlowNetwork.INFINITE_CAPACITY)
+            sink_edges.append(network.add_edge(node, self.SINK, present[position]))
+        return network, sink_edges, network.max_flow(self.SOURCE, self.SINK)
+
+    def _week_bitmap(self, weekly: int) -> int:
+        """Repeat a 7-day bitmap over every week of the rotation"""
+        bitmap = 0
+        for week in range(self.weeks):
+            bitmap |= weekly << (week * len(self.problem.days))
+        return bitmap
+
+    def plan(self) -> Dict:
+        """Build the leave calendar"""
+        problem = self.problem
+        days_per_week = len(problem.days)
+        week_mask = (1 << days_per_week) - 1
+        soldier_classes, classes, needs = self._staffing_classes()
+        class_nodes = 2 + len(needs)  # Node of the first class
+
+        present = [self._week_bitmap(bitmap & week_mask) for bitmap in problem.availability]
+        days = []  # Day -> (network, sink edge per class, maximum flow)
+        for day in range(self.day_count):
+            counts = Counter(position for soldier, position in enumerate(soldier_classes)
+                             if position >= 0 and present[soldier] >> day & 1)
+            days.append(self._day_network(classes, needs, counts))
+
+        leave = [0] * problem.soldier_count  # Planned leave bitmap per soldier
+        fixed = [days_per_week - bin(bitmap & week_mask).count('1') for bitmap in problem.availability]
+        weekly_home = [[count] * self.weeks for count in fixed]  # Home days per soldier and week
+        home_days = [count * self.weeks for count in fixed]
+        closed = [0] * len(classes)  # Class -> days on which none of its members can be released
+        granted = [0] * self.day_count  # Leave granted per day (to spread it over the calendar)
+
+        heap = [(home_days[soldier], soldier) for soldier in range(problem.soldier_count)]
+        heapq.heapify(heap)
+        while heap:
+            total, soldier = heapq.heappop(heap)
+            position = soldier_classes[soldier]
+            feasible = present[soldier] & ~leave[soldier]
+            if position >= 0:
+                feasible &= ~closed[position]
+            if self.max_home_days_per_week is not None:
+                for week, count in enumerate(weekly_home[soldier]):
+                    if count >= self.max_home_days_per_week:
+                        feasible &= ~(week_mask << week * days_per_week)
+
+            # The least granted open day whose staffing can spare a member of the soldier's class
+            while feasible:
+                day = min(self._days_of(feasible), key=lambda candidate: granted[candidate])
+                network, sink_edges, _ = days[day]
+                if position < 0 or network.lower_capacity(sink_edges[position]):
+                    break
+                # Every class the search got to is just as stuck (it cannot reach the sink either)
+                stuck = network.reachable_from(class_nodes + position)
+                for other in range(len(classes)):
+                    if class_nodes + other in stuck:
+                        closed[other] |= 1 << day
+                feasible &= ~(1 << day)
+            if not feasible:
+                continue  # Open days only shrink, so this soldier cannot get more leave
+
+            leave[soldier] |= 1 << day
+            granted[day] += 1
+            weekly_home[soldier][day // days_per_week] += 1
+            home_days[soldier] = total + 1
+            heapq.heappush(heap, (total + 1, soldier))
+
+        return self._to_dict(leave, home_days, days, needs)
+
+    def _days_of(self, bitmap: int) -> List[int]:
+        return [day for day in range(self.day_count) if bitmap >> day & 1]
+
+    def _to_dict(self, leave: List[int], home_days: List[int], days: List, needs: List[int]) -> Dict:
+        problem = self.problem
+        days_per_week = len(problem.days)
+
+        calendar = {}
+        for soldier, bitmap in enumerate(leave):
+            weeks = {}
+            for day in self._days_of(bitmap):
+                weeks.setdefault(f"Week {day // days_per_week + 1}", []).append(problem.days[day % days_per_week])
+            calendar[problem.serials[soldier]] = weeks
+
+        # Days that are short from fixed home time already (planned leave keeps their maximum flow)
+        understaffed = []
+        for day, (network, _, staffed) in enumerate(days):
+            if staffed < sum(needs):
+                source_side = network.reachable_from(self.SOURCE)
+                understaffed.append({'week': day // days_per_week + 1, 'day': problem.days[day % days_per_week],
+                                     'missing': sum(needs) - staffed,
+                                     'missions': [problem.mission_names[mission] for mission in range(len(needs))
+                                                  if needs[mission] > 0 and 2 + mission in source_side]})
+
+        totals = list(home_days)
+        return {
+            'weeks': self.weeks,
+            'calendar': calendar,
+            'home_days': {problem.serials[soldier]: total for soldier, total in enumerate(totals)},
+            'planned_leave_days': sum(bin(bitmap).count('1') for bitmap in leave),
+            'balance': {
+                'min_home_days': min(totals, default=0),
+                'max_home_days': max(totals, default=0),
+                'mean_home_days': round(sum(totals) / len(totals), 2) if totals else 0.0
+            },
+            'understaffed': understaffed
+        }
+
+    def __repr__(self):
+        return f"RotationPlanner(weeks={self.weeks}, soldiers={self.problem.soldier_count})"
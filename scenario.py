@@ -0,0 +1,233 @@
+from typing import List, Dict, Optional
+from soldier import Soldier
+from mission import Mission
+from platoon import Platoon
+from authorization_registry import AuthorizationRegistry
+from roster_columns import RosterColumns
+from availability_tensor import AvailabilityTensor
+from scheduler import ScheduleProblem, solve_weekly_roster
+
+
+class Scenario:
+    """
+    Copy-on-write what-if view of a Company.
+
+    A new scenario only holds references to the live company's platoons and missions, so forking copies no
+    soldier. The first edit of a platoon, soldier or mission through the scenario clones just that object. A
+    soldier edit also clones the platoon around it, and that clone shares every other soldier. Memory grows
+    with what changed, and the live company is never touched. Scenarios can be forked further the same way.
+
+    Objects returned by get_platoon / get_soldier / get_mission are the scenario's own copies and may be
+    edited freely. A platoon copy reports to the scenario like a platoon to its company: a soldier added to it
+    that the scenario does not own is swapped for the scenario's copy first, so the move never reaches the
+    live platoon. Everything reachable through platoons and missions otherwise is shared - treat it as
+    read-only.
+    """
+
+    def __init__(self, company, name: str = "Scenario"):
+        self.base = company
+        self.name = name
+        self.platoons = list(company.platoons)
+        self.missions = list(company.missions)
+        self.workload_ledger = company.workload_ledger  # Shared, read-only history for scheduling
+        self.authorization_registry = None  # Scenarios build their column views on a private registry
+        self.changes = []  # Human-readable log of the edits made through this scenario
+        self._owned = set()  # Objects cloned by this scenario (safe to edit in place)
+
+    def fork(self, name: Optional[str] = None):
+        """Branch off a new scenario; both share every object until one of them edits it"""
+        child = Scenario(self, name or f"{self.name} (fork)")
+        child.base = self.base
+        child.changes = list(self.changes)
+        self._owned = set()  # Now shared with the child: the next edit on either side copies again
+        return child
+
+    # Copy-on-write access
+
+    def get_platoon(self, name: str) -> Optional[Platoon]:
+        """Get an editable copy of a platoon"""
+        for index, platoon in enumerate(self.platoons):
+            if platoon.name == name:
+                if platoon not in self._owned:
+                    platoon = self.platoons[index] = platoon.clone()
+                    platoon._company = self
+                    self._owned.add(platoon)
+                return platoon
+        return None
+
+    def get_soldier(self, serial_number: str) -> Optional[Soldier]:
+        """Get an editable copy of a soldier (its platoon is copied as well)"""
+        for platoon in self.platoons:
+            soldier = platoon.get_soldier_by_serial(serial_number)
+            if soldier is None:
+                continue
+            if soldier in self._owned:
+                return soldier
+            platoon = self.get_platoon(platoon.name)
+            clone = soldier.clone()
+            platoon._replace_member(soldier, clone)
+            self._owned.add(clone)
+            return clone
+        return None
+
+    def get_mission(self, name: str) -> Optional[Mission]:
+        """Get an editable copy of a mission"""
+        for index, mission in enumerate(self.missions):
+            if mission.name == name:
+                if mission not in self._owned:
+                    mission = self.missions[index] = mission.clone()
+                    self._owned.add(mission)
+                return mission
+        return None
+
+    def get_soldier_by_serial(self, serial_number: str) -> Optional[Soldier]:
+        """Find a soldier of the scenario by serial number (shared or copied - read-only unless owned)"""
+        for platoon in self.platoons:
+            soldier = platoon.get_soldier_by_serial(serial_number)
+            if soldier is not None:
+                return soldier
+        return None
+
+    def _adopt_soldier(self, platoon: Platoon, soldier: Soldier) -> Soldier:
+        """
+        Called by the scenario's platoons before they add a soldier: a shared soldier (or the live one it
+        copies) is replaced by the scenario's own copy, and a soldier from outside the scenario is copied
+        """
+        if soldier in self._owned:
+            return soldier
+        if any(member.has_soldier(soldier) for member in self.platoons) or \
+                self.base.get_soldier_by_serial(soldier.serial_number) is soldier:
+            own = self.get_soldier(soldier.serial_number)
+            if own is not None:
+                return own
+        if soldier._platoon is not None:
+            soldier = soldier.clone()
+        self._owned.add(soldier)
+        return soldier
+
+    # Notifications from the scenario's own platoons - views are built on demand, so there is nothing to update
+
+    def _on_model_changed(self, *args):
+        pass
+
+    _on_platoon_changed = _on_platoon_schedule_changed = _on_model_changed
+    _on_soldier_added = _on_soldiers_added = _on_soldier_removed = _on_model_changed
+    _on_soldier_changed = _on_soldier_authorization_changed = _on_soldier_serial_changed = _on_model_changed
+
+    def _find_mission(self, name: str) -> Optional[Mission]:
+        for mission in self.missions:
+            if mission.name == name:
+                return mission
+        return None
+
+    # Common edits
+
+    def assign_mission(self, mission_name: str, platoon_name: str) -> bool:
+        """Assign a mission to a platoon in this scenario"""
+        mission = self._find_mission(mission_name)
+        if mission is None or not any(platoon.name == platoon_name for platoon in self.platoons):
+            return False
+        self.get_platoon(platoon_name).assign_mission(mission)
+        self.changes.append(f"Assign {mission_name} to {platoon_name}")
+        return True
+
+    def unassign_mission(self, mission_name: str, platoon_name: str) -> bool:
+        """Remove a mission from a platoon in this scenario"""
+        platoon = self.get_platoon(platoon_name)
+        if platoon is None:
+            return False
+        for mission in list(platoon.weekly_missions):
+            if mission.name == mission_name:
+                platoon.unassign_mission(mission)
+                self.changes.append(f"Unassign {mission_name} from {platoon_name}")
+                return True
+        return False
+
+    def move_soldier(self, serial_number: str, platoon_name: str) -> bool:
+        """Move a soldier to another platoon in this scenario"""
+        if not any(platoon.name == platoon_name for platoon in self.platoons):
+            return False
+        soldier = self.get_soldier(serial_number)
+        if soldier is None:
+            return False
+        target = self.get_platoon(platoon_name)
+        target.add_soldier(soldier)  # Detaches from the (copied) old platoon
+        self.changes.append(f"Move {serial_number} to {platoon_name}")
+        return True
+
+    def set_home_time(self, serial_number: str, day: str, constraint: str = "home") -> bool:
+        """Set a soldier's home time constraint for a day in this scenario"""
+        soldier = self.get_soldier(serial_number)
+        if soldier is None:
+            return False
+        soldier.add_home_time_constraint(day, constraint)
+        self.changes.append(f"{serial_number}: {day} {constraint}")
+        return True
+
+    # Scoring
+
+    def get_roster_columns(self) -> RosterColumns:
+        """Column view of the scenario roster (built on demand, with its own authorization registry)"""
+        return RosterColumns(self, AuthorizationRegistry())
+
+    def get_availability_tensor(self) -> AvailabilityTensor:
+        """Compiled availability of the scenario roster (built on demand, see Company.get_availability_tensor)"""
+        shifts = []
+        for mission in self.missions:
+            shifts.extend(shift for shift in mission.shift_hours if shift not in shifts)
+        return AvailabilityTensor(self.get_roster_columns(), shifts)
+
+    def get_all_soldiers(self) -> List[Soldier]:
+        """Get all soldiers of the scenario"""
+        soldiers = []
+        for platoon in self.platoons:
+            soldiers.extend(platoon.soldiers)
+        return soldiers
+
+    def score(self) -> Dict:
+        """
+        Quick staffing score from the platoon indexes (no scheduling):
+        per mission, the platoons that can fulfill it and the spare qualified soldiers.
+        """
+        missions = {}
+        uncovered = []
+        total_slack = 0
+        for mission in self.missions:
+            assigned = [platoon for platoon in self.platoons
+                        if any(assigned.name == mission.name for assigned in platoon.weekly_missions)]
+            candidates = assigned or self.platoons
+
+            qualified = 0
+            capable = []
+            for platoon in candidates:
+                holders = [platoon.get_soldier_set_by_authorization(auth) for auth in mission.required_authorizations]
+                qualified += len(set.intersection(*holders)) if holders else platoon.get_soldier_count()
+                if platoon.can_fulfill_mission(mission)['can_fulfill']:
+                    capable.append(platoon.name)
+
+            slack = qualified - mission.daily_personnel
+            total_slack += min(slack, 0)
+            if slack < 0 or not capable:
+                uncovered.append(mission.name)
+            missions[mission.name] = {
+                'assigned_platoons': [platoon.name for platoon in assigned],
+                'capable_platoons': capable,
+                'qualified_soldiers': qualified,
+                'daily_personnel': mission.daily_personnel,
+                'slack': slack
+            }
+
+        return {
+            'scenario': self.name,
+            'changes': list(self.changes),
+            'missions': missions,
+            'uncovered_missions': uncovered,
+            'total_shortage': -total_slack
+        }
+
+    def build_weekly_roster(self, week: str = "current") -> Dict:
+        """Full shift-level roster of the scenario (see Company.build_weekly_roster)"""
+        return solve_weekly_roster(ScheduleProblem.from_company(self, week)).to_dict()
+
+    def __repr__(self):
+        return f"Scenario(name='{self.name}', changes={len(self.changes)}, copied_objects={len(self._owned)})"
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+
+def schedule_fingerprint(company, week: str = "current") -> str:
+    """
+    SHA-256 of everything the schedulers read: soldiers (serial, platoon, authorizations, preferred shift,
+    home time), platoon home days and mission assignments, missions (shifts, personnel, authorizations),
+    cumulative workload and the week.
+
+    The data is put in canonical form first - entities sorted by key, authorization lists sorted - so the same
+    content always gives the same hash regardless of load order or file layout.
+    """
+    platoons = []
+    soldiers = []
+    for platoon in company.platoons:
+        platoons.append([platoon.name, sorted(platoon.home_time_schedule.items()),
+                         sorted(mission.name for mission in platoon.weekly_missions)])
+        for soldier in platoon.soldiers:
+            soldiers.append([soldier.serial_number, platoon.name, sorted(soldier.authorizations),
+                             soldier.preferred_shift, sorted(soldier.home_time_constraints.items())])
+
+    missions = [[mission.name, sorted(mission.shift_hours.items()), sorted(mission.personnel_per_shift.items()),
+                 mission.daily_personnel, sorted(mission.required_authorizations)] for mission in company.missions]
+
+    ledger = company.workload_ledger
+    workload = sorted([serial, round(ledger.get_load(serial), 3)] for serial in ledger.totals)
+
+    canonical = {
+        'week': week,
+        'platoons': sorted(platoons),
+        'soldiers': sorted(soldiers),
+        'missions': sorted(missions),
+        'workload': workload
+    }
+    encoded = json.dumps(canonical, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ScheduleCache:
+    """
+    On-disk LRU cache of solver results: one JSON file per key in a directory.
+
+    Reading an entry refreshes its modification time; writing evicts the least recently used files once more
+    than max_entries (or max_bytes, if set) are stored. Writes go through a temporary file and os.replace, so
+    a crash never leaves a half-written entry.
+    """
+
+    SUFFIX = '.json'
+
+    def __init__(self, directory: str, max_entries: int = 64, max_bytes: Optional[int] = None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(fingerprint: str, solver: str, **parameters) -> str:
+        """Combine an input fingerprint with the solver and its parameters"""
+        encoded = json.dumps([fingerprint, solver, sorted(parameters.items())], separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a cached result (None on a miss)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict):
+        """Store a result and evict least recently used entries beyond the limits"""
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(result, f, separators=(',', ':'))
+        os.replace(temporary, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort(reverse=True)  # Most recently used first
+
+        total_bytes = 0
+        for index, (_, size, name) in enumerate(entries):
+            total_bytes += size
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes and index > 0
+            if index >= self.max_entries or over_bytes:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Delete every cached entry"""
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                os.remove(os.path.join(self.directory, name))
+
+    def __len__(self):
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(self.SUFFIX))
+
+    def __repr__(self):
+        return f"ScheduleCache(directory='{self.directory}', entries={len(self)}, max_entries={self.max_entries})"
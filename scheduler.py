@@ -0,0 +1,466 @@
+import heapq
+import random
+from typing import List, Dict, Optional, Tuple
+from soldier import WEEK_DAYS
+from flow_network import FlowNetwork
+from shift_intervals import MINUTES_PER_DAY, find_interval_conflicts
+
+# Cost weights of the staffing flow (integers - the flow solver works in whole units)
+PREFERENCE_PENALTY = 10  # Staffing a slot outside the soldier's preferred shift
+LOAD_PENALTY = 4  # Per shift the soldier already works this week (spreads load)
+HISTORY_PENALTY = 4  # Per shift's worth of hours worked in earlier weeks beyond the least loaded soldier
+DEFAULT_SHIFT_HOURS = 8.0  # Load charged for a shift whose hours cannot be parsed
+
+# Weights of the roster objective (lower is better)
+UNFILLED_WEIGHT = 1000
+PREFERENCE_WEIGHT = PREFERENCE_PENALTY
+FAIRNESS_WEIGHT = 1
+
+
+class ScheduleProblem:
+    """
+    Compact, picklable snapshot of one week's staffing problem.
+
+    Soldiers and missions are index-aligned lists of strings and ints (no model objects): authorization sets are
+    bitmasks, preferred shifts are shift codes and availability is a 7-bit weekday bitmap. A problem can be
+    copied cheaply, serialized with to_dict, or shipped to worker processes.
+    """
+
+    def __init__(self, week: str = "current"):
+        self.week = week
+        self.days = list(WEEK_DAYS)
+        self.shifts = []  # Shift code -> shift name
+        self.authorizations = []  # Bit -> authorization name
+        self.platoon_names = []  # Platoon id -> platoon name
+
+        # Soldier columns
+        self.serials = []
+        self.soldier_platoons = []  # Platoon id
+        self.soldier_masks = []  # Authorization bitmask
+        self.preferred_shifts = []  # Shift code (-1 if none)
+        self.availability = []  # Weekday bitmap, bit d set = not at home on days[d]
+        self.loads = []  # Cumulative load from earlier weeks (WorkloadLedger.get_load)
+
+        # Mission columns
+        self.mission_names = []
+        self.mission_masks = []  # Required authorization bitmask
+        self.mission_demand = []  # Mission -> personnel per shift code
+        self.mission_platoons = []  # Mission -> allowed platoon ids (None = any platoon)
+        self.mission_intervals = []  # Mission -> [start, end] minutes per shift code (None if unknown)
+
+    @classmethod
+    def from_company(cls, company, week: str = "current"):
+        """Build the problem from a company's column view and missions"""
+        problem = cls(week)
+        columns = company.get_roster_columns()
+        registry = columns.registry
+
+        platoon_ids = {}
+        for platoon_id, platoon in enumerate(columns.platoons):
+            platoon_ids[id(platoon)] = platoon_id
+            problem.platoon_names.append(platoon.name)
+
+        # Mission shifts first so their codes follow mission order, then any other preferred shift
+        for mission in company.missions:
+            for shift in mission.shift_hours:
+                problem.shift_code(shift)
+
+        for row, soldier in enumerate(columns.soldiers):
+            if soldier is None:
+                continue
+            problem.serials.append(soldier.serial_number)
+            problem.soldier_platoons.append(columns.platoon_ids[row])
+            problem.soldier_masks.append(columns.authorization_masks[row])
+            preferred = columns.shift_codes[row]
+            problem.preferred_shifts.append(
+                problem.shift_code(columns.shift_names[preferred]) if preferred >= 0 else -1)
+            problem.availability.append(columns.availability[row])
+
+        for mission in company.missions:
+            problem.mission_names.append(mission.name)
+            problem.mission_masks.append(registry.mask_for(mission.required_authorizations))
+            demand = [0] * len(problem.shifts)
+            for shift in mission.shift_hours:
+                demand[problem.shifts.index(shift)] = mission.personnel_per_shift.get(shift, 0)
+            problem.mission_demand.append(demand)
+            intervals = [None] * len(problem.shifts)
+            for shift in mission.shift_hours:
+                interval = mission.get_shift_interval(shift)
+                intervals[problem.shifts.index(shift)] = list(interval) if interval else None
+            problem.mission_intervals.append(intervals)
+
+            # Missions assigned to platoons for the week are staffed by those platoons only
+            allowed = [platoon_ids[id(platoon)] for platoon in company.platoons
+                       if any(assigned.name == mission.name for assigned in platoon.weekly_missions)]
+            problem.mission_platoons.append(allowed or None)
+
+        problem.authorizations = registry.get_authorizations()
+        problem.loads = company.workload_ledger.get_loads(problem.serials)
+        return problem
+
+    def shift_code(self, shift: str) -> int:
+        """Get the code of a shift name, registering it if it is new"""
+        if shift not in self.shifts:
+            self.shifts.append(shift)
+            for demand in self.mission_demand:
+                demand.append(0)
+            for intervals in self.mission_intervals:
+                intervals.append(None)
+        return self.shifts.index(shift)
+
+    @property
+    def soldier_count(self) -> int:
+        return len(self.serials)
+
+    @property
+    def mission_count(self) -> int:
+        return len(self.mission_names)
+
+    def get_demand(self, mission: int, shift: int) -> int:
+        """Personnel a mission needs on a shift"""
+        demand = self.mission_demand[mission]
+        return demand[shift] if shift < len(demand) else 0
+
+    def is_available(self, soldier: int, day: int) -> bool:
+        """Check if a soldier is not at home on a day"""
+        return bool(self.availability[soldier] >> day & 1)
+
+    def is_eligible(self, soldier: int, mission: int) -> bool:
+        """Check if a soldier holds every required authorization and belongs to an allowed platoon"""
+        required = self.mission_masks[mission]
+        if self.soldier_masks[soldier] & required != required:
+            return False
+        allowed = self.mission_platoons[mission]
+        return allowed is None or self.soldier_platoons[soldier] in allowed
+
+    def get_shift_hours(self, mission: int, shift: int) -> float:
+        """Length of a mission shift in hours"""
+        intervals = self.mission_intervals[mission]
+        interval = intervals[shift] if shift < len(intervals) else None
+        return (interval[1] - interval[0]) / 60 if interval else DEFAULT_SHIFT_HOURS
+
+    def get_loads(self) -> List[float]:
+        """Cumulative load per soldier (zeros when no history was recorded)"""
+        return list(self.loads) if len(self.loads) == self.soldier_count else [0.0] * self.soldier_count
+
+    def eligible_soldiers(self, mission: int) -> List[int]:
+        """Soldiers eligible for a mission (ignoring availability)"""
+        return [soldier for soldier in range(self.soldier_count) if self.is_eligible(soldier, mission)]
+
+    def slot_groups(self) -> List[Tuple[int, int, int]]:
+        """All (mission, shift, personnel) combinations with a positive demand"""
+        return [(mission, shift, count)
+                for mission in range(self.mission_count)
+                for shift, count in enumerate(self.mission_demand[mission]) if count > 0]
+
+    def to_dict(self) -> Dict:
+        """Convert problem to a plain dictionary (JSON/pickle friendly)"""
+        return {key: value for key, value in vars(self).items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """Create problem from dictionary"""
+        problem = cls(data.get('week', 'current'))
+        for key, value in data.items():
+            setattr(problem, key, value)
+        return problem
+
+    def __repr__(self):
+        return f"ScheduleProblem(week='{self.week}', soldiers={self.soldier_count}, missions={self.mission_count})"
+
+
+class WeeklyRoster:
+    """
+    Shift-level weekly roster: which soldiers (problem indexes) staff each (day, shift, mission) slot.
+    A soldier works at most one slot per day.
+    """
+
+    def __init__(self, problem: ScheduleProblem):
+        self.problem = problem
+        self.slots = {}  # (day, shift, mission) -> list of soldier indexes
+        self.working = [{} for _ in problem.days]  # Day -> {soldier: (shift, mission)}
+
+    def assign(self, day: int, shift: int, mission: int, soldier: int):
+        """Put a soldier on a slot (the soldier must be free that day)"""
+        self.slots.setdefault((day, shift, mission), []).append(soldier)
+        self.working[day][soldier] = (shift, mission)
+
+    def unassign(self, day: int, shift: int, mission: int, soldier: int):
+        """Take a soldier off a slot"""
+        members = self.slots.get((day, shift, mission))
+        if members and soldier in members:
+            members.remove(soldier)
+            del self.working[day][soldier]
+
+    def get_assigned(self, day: int, shift: int, mission: int) -> List[int]:
+        """Soldiers staffing a slot"""
+        return self.slots.get((day, shift, mission), [])
+
+    def is_free(self, day: int, soldier: int) -> bool:
+        """Check if a soldier has no slot on a day"""
+        return soldier not in self.working[day]
+
+    def get_assignment_counts(self) -> List[int]:
+        """Number of slots each soldier works this week"""
+        counts = [0] * self.problem.soldier_count
+        for day_working in self.working:
+            for soldier in day_working:
+                counts[soldier] += 1
+        return counts
+
+    def get_unfilled(self) -> List[Dict]:
+        """Slots with fewer soldiers than required"""
+        unfilled = []
+        for day in range(len(self.problem.days)):
+            for mission, shift, count in self.problem.slot_groups():
+                missing = count - len(self.get_assigned(day, shift, mission))
+                if missing > 0:
+                    unfilled.append({'day': day, 'shift': shift, 'mission': mission, 'missing': missing})
+        return unfilled
+
+    def find_conflicts(self, min_rest_hours: float = 0.0) -> Dict[str, List[Dict]]:
+        """
+        Find soldiers whose shift times overlap (e.g. an overnight shift running into the next day's morning)
+        or leave less than min_rest_hours between them, by a sweep over week-absolute minute intervals
+        """
+        problem = self.problem
+        assignments = []
+        for (day, shift, mission), members in self.slots.items():
+            interval = problem.mission_intervals[mission][shift] if shift < len(problem.mission_intervals[mission]) \
+                else None
+            if interval is None:
+                continue
+            start = day * MINUTES_PER_DAY + interval[0]
+            end = day * MINUTES_PER_DAY + interval[1]
+            label = (problem.days[day], problem.shifts[shift], problem.mission_names[mission])
+            for soldier in members:
+                assignments.append((problem.serials[soldier], start, end, label))
+        return find_interval_conflicts(assignments, int(min_rest_hours * 60))
+
+    def copy(self):
+        """Independent copy sharing the (read-only) problem"""
+        roster = WeeklyRoster(self.problem)
+        roster.slots = {slot: list(members) for slot, members in self.slots.items()}
+        roster.working = [dict(day_working) for day_working in self.working]
+        return roster
+
+    @classmethod
+    def from_slots(cls, problem: ScheduleProblem, slots: Dict[Tuple[int, int, int], List[int]]):
+        """Rebuild a roster from a slots mapping ((day, shift, mission) -> soldier indexes)"""
+        roster = cls(problem)
+        for (day, shift, mission), members in slots.items():
+            for soldier in members:
+                roster.assign(day, shift, mission, soldier)
+        return roster
+
+    def to_dict(self) -> Dict:
+        """Convert roster to dictionary: day -> shift -> mission -> serial numbers, plus unfilled slots"""
+        problem = self.problem
+        roster = {}
+        for (day, shift, mission), members in sorted(self.slots.items()):
+            if members:
+                day_roster = roster.setdefault(problem.days[day], {})
+                shift_roster = day_roster.setdefault(problem.shifts[shift], {})
+                shift_roster[problem.mission_names[mission]] = [problem.serials[soldier] for soldier in members]
+
+        evaluation = evaluate_roster(self)
+        return {
+            'week': problem.week,
+            'roster': roster,
+            'unfilled': [{'day': problem.days[slot['day']],
+                          'shift': problem.shifts[slot['shift']],
+                          'mission': problem.mission_names[slot['mission']],
+                          'missing': slot['missing']} for slot in self.get_unfilled()],
+            'summary': evaluation
+        }
+
+    @classmethod
+    def from_dict(cls, problem: ScheduleProblem, data: Dict, keep_double_bookings: bool = False):
+        """
+        Rebuild a roster for a problem from its to_dict() form (unknown names are skipped).
+        A soldier's second slot on a day is dropped, unless keep_double_bookings is set for checking the roster
+        (the slots then keep every entry, so find_conflicts sees the overlap).
+        """
+        roster = cls(problem)
+        soldier_index = {serial: index for index, serial in enumerate(problem.serials)}
+        for day_name, day_roster in data.get('roster', {}).items():
+            if day_name not in problem.days:
+                continue
+            day = problem.days.index(day_name)
+            for shift_name, shift_roster in day_roster.items():
+                if shift_name not in problem.shifts:
+                    continue
+                shift = problem.shifts.index(shift_name)
+                for mission_name, serials in shift_roster.items():
+                    if mission_name not in problem.mission_names:
+                        continue
+                    mission = problem.mission_names.index(mission_name)
+                    for serial in serials:
+                        soldier = soldier_index.get(serial)
+                        if soldier is not None and (keep_double_bookings or roster.is_free(day, soldier)):
+                            roster.assign(day, shift, mission, soldier)
+        return roster
+
+    def __repr__(self):
+        filled = sum(len(members) for members in self.slots.values())
+        return f"WeeklyRoster(week='{self.problem.week}', filled_slots={filled})"
+
+
+def evaluate_roster(roster: WeeklyRoster) -> Dict:
+    """Score a roster: coverage, preferred-shift satisfaction, load balance and the combined objective"""
+    problem = roster.problem
+    required = sum(count for _, _, count in problem.slot_groups()) * len(problem.days)
+    missing = sum(slot['missing'] for slot in roster.get_unfilled())
+
+    off_preference = 0
+    for day_working in roster.working:
+        for soldier, (shift, _) in day_working.items():
+            if problem.preferred_shifts[soldier] != shift:
+                off_preference += 1
+
+    counts = roster.get_assignment_counts()
+    filled = sum(counts)
+    load_squares = sum(count * count for count in counts)
+
+    return {
+        'slots_required': required,
+        'slots_filled': filled,
+        'slots_missing': missing,
+        'coverage': filled / required if required else 1.0,
+        'off_preference_assignments': off_preference,
+        'max_assignments_per_soldier': max(counts) if counts else 0,
+        'objective': UNFILLED_WEIGHT * missing + PREFERENCE_WEIGHT * off_preference + FAIRNESS_WEIGHT * load_squares
+    }
+
+
+def solve_weekly_roster(problem: ScheduleProblem) -> WeeklyRoster:
+    """
+    Build a full weekly roster, one min-cost flow per day.
+
+    Soldiers who are interchangeable for the day (same eligible slots, preferred shift, current load and
+    earlier-week backlog) are merged into one class node, so the network size depends on the variety of the
+    roster rather than its size: source -> class (capacity = class size, cost = load and backlog) -> (mission,
+    shift) slot group (cost = preference penalty) -> sink (capacity = personnel needed). The backlog is the
+    earlier weeks' hours beyond the least loaded soldier, in whole shifts, so work moves between classes as
+    load builds up over the weeks. The flow maximizes filled slots first and then minimizes off-preference
+    assignments and load imbalance. Within a class, a priority queue on cumulative load (earlier weeks plus
+    this week's hours) hands out the least-loaded members first.
+    """
+    roster = WeeklyRoster(problem)
+    load = [0] * problem.soldier_count  # Shifts this week
+    cumulative = problem.get_loads()
+    least = min(cumulative, default=0.0)
+    backlog = [round((hours - least) / DEFAULT_SHIFT_HOURS) for hours in cumulative]
+    groups = problem.slot_groups()
+    if not groups:
+        return roster
+
+    # Mission eligibility depends only on (authorization mask, platoon) - cache it per distinct pair
+    eligibility_cache = {}
+
+    def group_mask(soldier: int) -> int:
+        key = (problem.soldier_masks[soldier], problem.soldier_platoons[soldier])
+        mask = eligibility_cache.get(key)
+        if mask is None:
+            mask = 0
+            for group_index, (mission, _, _) in enumerate(groups):
+                if problem.is_eligible(soldier, mission):
+                    mask |= 1 << group_index
+            eligibility_cache[key] = mask
+        return mask
+
+    for day in range(len(problem.days)):
+        classes = {}  # (eligible groups, preferred shift, load, backlog) -> soldiers
+        for soldier in range(problem.soldier_count):
+            if not problem.is_available(soldier, day):
+                continue
+            eligible = group_mask(soldier)
+            if eligible:
+                key = (eligible, problem.preferred_shifts[soldier], load[soldier], backlog[soldier])
+                classes.setdefault(key, []).append(soldier)
+        if not classes:
+            continue
+
+        network = FlowNetwork(2)
+        source, sink = 0, 1
+        group_nodes = []
+        for _, _, count in groups:
+            node = network.add_node()
+            network.add_edge(node, sink, count)
+            group_nodes.append(node)
+
+        class_edges = []  # (members, [(group index, edge)])
+        for (eligible, preferred, class_load, class_backlog), members in classes.items():
+            node = network.add_node()
+            network.add_edge(source, node, len(members), LOAD_PENALTY * class_load + HISTORY_PENALTY * class_backlog)
+            edges = []
+            for group_index, (_, shift, _) in enumerate(groups):
+                if eligible >> group_index & 1:
+                    cost = 0 if shift == preferred else PREFERENCE_PENALTY
+                    edges.append((group_index, network.add_edge(node, group_nodes[group_index], len(members), cost)))
+            class_edges.append((members, edges))
+
+        network.min_cost_flow(source, sink)
+
+        for members, edges in class_edges:
+            queue = [(cumulative[soldier], soldier) for soldier in members]
+            heapq.heapify(queue)
+            for group_index, edge in edges:
+                mission, shift, _ = groups[group_index]
+                for _ in range(network.get_flow(edge)):
+                    _, soldier = heapq.heappop(queue)
+                    roster.assign(day, shift, mission, soldier)
+                    load[soldier] += 1
+                    cumulative[soldier] += problem.get_shift_hours(mission, shift)
+
+    return roster
+
+
+def greedy_weekly_roster(problem: ScheduleProblem, rng: Optional[random.Random] = None) -> WeeklyRoster:
+    """
+    Fast constructive roster: each day, the most constrained slot groups pick first and take the free soldiers
+    with the lowest cumulative load (earlier weeks plus hours already given this week), preferring those who
+    like the shift. Every slot group keeps a priority queue on that load, so a pick costs O(log n); entries
+    whose load went up since they were queued are re-queued lazily. An optional random generator breaks ties
+    differently (used for restarts).
+    """
+    roster = WeeklyRoster(problem)
+    load = problem.get_loads()
+    groups = problem.slot_groups()
+    eligible = {mission: problem.eligible_soldiers(mission) for mission in {group[0] for group in groups}}
+    order = sorted(range(len(groups)), key=lambda index: len(eligible[groups[index][0]]))
+
+    ties = [rng.random() for _ in range(problem.soldier_count)] if rng is not None else [0] * problem.soldier_count
+    queues = []  # Group index -> heap of (load, off preference, tie break, soldier)
+    for mission, shift, _ in groups:
+        queue = [(load[soldier], problem.preferred_shifts[soldier] != shift, ties[soldier], soldier)
+                 for soldier in eligible[mission]]
+        heapq.heapify(queue)
+        queues.append(queue)
+
+    for day in range(len(problem.days)):
+        for group_index in order:
+            mission, shift, count = groups[group_index]
+            queue = queues[group_index]
+            hours = problem.get_shift_hours(mission, shift)
+            taken = []
+            skipped = []
+            while queue and len(taken) < count:
+                entry = heapq.heappop(queue)
+                soldier = entry[3]
+                if entry[0] != load[soldier]:
+                    heapq.heappush(queue, (load[soldier],) + entry[1:])  # Stale load, re-queue
+                elif problem.availability[soldier] >> day & 1 and roster.is_free(day, soldier):
+                    taken.append(entry)
+                else:
+                    skipped.append(entry)
+
+            for entry in taken:
+                soldier = entry[3]
+                roster.assign(day, shift, mission, soldier)
+                load[soldier] += hours
+                heapq.heappush(queue, (load[soldier],) + entry[1:])
+            for entry in skipped:
+                heapq.heappush(queue, entry)
+
+    return roster
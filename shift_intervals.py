@@ -0,0 +1,53 @@
+from typing import List, Dict, Optional, Tuple, Iterable, Hashable
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def parse_shift_hours(hours: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse "HH:MM-HH:MM" into (start, end) minutes after midnight of the shift's day.
+    Overnight shifts wrap: "22:00-06:00" becomes (1320, 1800). Returns None for malformed hours.
+    """
+    try:
+        start_time, end_time = hours.split('-')
+        start_hour, start_min = map(int, start_time.split(':'))
+        end_hour, end_min = map(int, end_time.split(':'))
+    except (ValueError, AttributeError):
+        return None
+
+    start = start_hour * 60 + start_min
+    end = end_hour * 60 + end_min
+    if end < start:
+        end += MINUTES_PER_DAY
+    return start, end
+
+
+def find_interval_conflicts(assignments: Iterable[Tuple[Hashable, int, int, object]],
+                            min_rest_minutes: int = 0) -> Dict[str, List[Dict]]:
+    """
+    Sweep-line check of (owner, start, end, label) intervals in O(n log n).
+
+    Intervals are grouped by owner (e.g. a soldier) and scanned in start order while tracking the latest end
+    seen so far. An interval starting before that end is a double booking; one starting less than
+    min_rest_minutes after it is a rest violation.
+    """
+    by_owner = {}
+    for owner, start, end, label in assignments:
+        by_owner.setdefault(owner, []).append((start, end, label))
+
+    double_bookings = []
+    rest_violations = []
+    for owner, intervals in by_owner.items():
+        intervals.sort(key=lambda interval: (interval[0], interval[1]))
+        latest_end, latest_label = intervals[0][1], intervals[0][2]
+        for start, end, label in intervals[1:]:
+            if start < latest_end:
+                double_bookings.append({'owner': owner, 'first': latest_label, 'second': label,
+                                        'overlap_minutes': min(end, latest_end) - start})
+            elif start - latest_end < min_rest_minutes:
+                rest_violations.append({'owner': owner, 'first': latest_label, 'second': label,
+                                        'rest_minutes': start - latest_end})
+            if end > latest_end:
+                latest_end, latest_label = end, label
+
+    return {'double_bookings': double_bookings, 'rest_violations': rest_violations}
@@ -1,22 +1,93 @@
+import sys
 from typing import List, Dict
 
 
+WEEK_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def intern_string(value):
+    """Intern a string so repeated names (shifts, platoons, authorizations) share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_dict(data: Dict) -> Dict:
+    """Copy a dictionary of strings with interned keys and values"""
+    return {intern_string(key): intern_string(value) for key, value in data.items()}
+
+
 class Soldier:
     """
     Represents a soldier with personal information, preferences, and authorizations
     """
 
+    # No per-instance __dict__ - companies hold tens of thousands of soldiers
+    __slots__ = ('_platoon', '_registry', 'authorization_mask', 'name', '_serial_number', 'platoon',
+                 '_preferred_shift', '_authorizations', 'home_time_constraints')
+
     def __init__(self, name: str, serial_number: str, platoon: str, preferred_shift: str, authorizations: List[str]):
+        self._platoon = None  # Platoon object currently holding this soldier (kept by Platoon)
+        self._registry = None  # AuthorizationRegistry when compact authorization masks are enabled
+        self.authorization_mask = 0  # Bitmask of authorizations (only maintained with a registry)
         self.name = name
         self.serial_number = serial_number
-        self.platoon = platoon
+        self.platoon = intern_string(platoon)
+        self.home_time_constraints = {}  # Will store weekly home time preferences
         self.preferred_shift = preferred_shift  # "Morning", "Noon", "Night"
         self.authorizations = authorizations  # List of authorized duties
-        self.home_time_constraints = {}  # Will store weekly home time preferences
+
+    @property
+    def serial_number(self) -> str:
+        return self._serial_number
+
+    @serial_number.setter
+    def serial_number(self, value: str):
+        """Change the serial number, keeping the platoon/company serial indexes in sync"""
+        old_value = getattr(self, '_serial_number', None)
+        if self._platoon is not None and old_value != value:
+            # Raises ValueError if the new serial is already taken
+            self._platoon._on_soldier_serial_changed(self, old_value, value)
+        self._serial_number = value
+
+    @property
+    def preferred_shift(self) -> str:
+        return self._preferred_shift
+
+    @preferred_shift.setter
+    def preferred_shift(self, value: str):
+        self._preferred_shift = intern_string(value)
+        if self._platoon is not None:
+            self._platoon._on_soldier_changed(self)
 
     def add_home_time_constraint(self, day: str, constraint: str):
         """Add a home time constraint for a specific day"""
-        self.home_time_constraints[day] = constraint
+        self.home_time_constraints[intern_string(day)] = intern_string(constraint)
+        if self._platoon is not None:
+            self._platoon._on_soldier_changed(self)
+
+    @property
+    def authorizations(self) -> List[str]:
+        return self._authorizations
+
+    @authorizations.setter
+    def authorizations(self, value: List[str]):
+        """Replace the authorization list, keeping the authorization indexes in sync"""
+        old_value = getattr(self, '_authorizations', [])
+        value = [intern_string(auth) for auth in value]
+        self._authorizations = value
+        if self._registry is not None:
+            self.authorization_mask = self._registry.mask_for(value)
+        if self._platoon is not None:
+            old_set, new_set = set(old_value), set(value)
+            for auth in old_set - new_set:
+                self._platoon._on_soldier_authorization_changed(self, auth, False)
+            for auth in new_set - old_set:
+                self._platoon._on_soldier_authorization_changed(self, auth, True)
+
+    def set_home_time_constraints(self, constraints: Dict[str, str]):
+        """Replace all home time constraints at once"""
+        self.home_time_constraints = intern_dict(constraints)
+        if self._platoon is not None:
+            self._platoon._on_soldier_changed(self)
 
     def has_authorization(self, required_auth: str) -> bool:
         """Check if soldier has a specific authorization"""
@@ -25,12 +96,41 @@ class Soldier:
     def add_authorization(self, authorization: str):
         """Add a new authorization to the soldier"""
         if authorization not in self.authorizations:
+            authorization = intern_string(authorization)
             self.authorizations.append(authorization)
+            if self._registry is not None:
+                self.authorization_mask |= 1 << self._registry.register(authorization)
+            if self._platoon is not None:
+                self._platoon._on_soldier_authorization_changed(self, authorization, True)
 
     def remove_authorization(self, authorization: str):
         """Remove an authorization from the soldier"""
         if authorization in self.authorizations:
             self.authorizations.remove(authorization)
+            if authorization not in self.authorizations:
+                if self._registry is not None:
+                    self.authorization_mask &= ~(1 << self._registry.register(authorization))
+                if self._platoon is not None:
+                    self._platoon._on_soldier_authorization_changed(self, authorization, False)
+
+    def attach_registry(self, registry):
+        """Enable compact mode: keep authorization_mask in sync against an AuthorizationRegistry"""
+        self._registry = registry
+        self.authorization_mask = registry.mask_for(self.authorizations) if registry is not None else 0
+
+    def clone(self):
+        """Detached copy (no platoon or registry) with its own authorization and home time containers"""
+        soldier = Soldier.__new__(Soldier)
+        soldier._platoon = None
+        soldier._registry = None
+        soldier.authorization_mask = 0
+        soldier.name = self.name
+        soldier._serial_number = self._serial_number
+        soldier.platoon = self.platoon
+        soldier._preferred_shift = self._preferred_shift
+        soldier._authorizations = list(self._authorizations)
+        soldier.home_time_constraints = dict(self.home_time_constraints)
+        return soldier
 
     def to_dict(self) -> Dict:
         """Convert soldier object to dictionary for serialization"""
@@ -53,7 +153,7 @@ class Soldier:
             data['preferred_shift'],
             data['authorizations']
         )
-        soldier.home_time_constraints = data.get('home_time_constraints', {})
+        soldier.set_home_time_constraints(data.get('home_time_constraints', {}))
         return soldier
 
     def __str__(self):
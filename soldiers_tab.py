@@ -168,6 +168,13 @@ class SoldiersTab:
                                [p.name for p in self.company.platoons], self.colors)
         if dialog.result:
             soldier_data = dialog.result
+
+            existing = self.company.get_soldier_by_serial(soldier_data['serial_number'])
+            if existing:
+                messagebox.showerror("Error", f"Serial number {soldier_data['serial_number']} "
+                                              f"is already assigned to {existing.name}!")
+                return
+
             soldier = Soldier(
                 soldier_data['name'],
                 soldier_data['serial_number'],
@@ -200,15 +207,8 @@ class SoldiersTab:
             messagebox.showwarning("Warning", "Please select a soldier to edit!")
             return
 
-        # Get soldier name from selection
-        soldier_name = self.soldiers_tree.item(selection[0])['text']
-        soldier = None
-
-        # Find the soldier
-        for s in self.company.get_all_soldiers():
-            if s.name == soldier_name:
-                soldier = s
-                break
+        # Rows are keyed by serial number
+        soldier = self.company.get_soldier_by_serial(selection[0])
 
         if soldier:
             dialog = SoldierDialog(self.parent_frame, self.authorizations, self.shifts,
@@ -218,8 +218,14 @@ class SoldiersTab:
                 soldier_data = dialog.result
                 old_platoon_name = soldier.platoon
 
+                # Serial number goes first - the company index rejects duplicates
+                try:
+                    soldier.serial_number = soldier_data['serial_number']
+                except ValueError as e:
+                    messagebox.showerror("Error", str(e))
+                    return
+
                 soldier.name = soldier_data['name']
-                soldier.serial_number = soldier_data['serial_number']
                 soldier.preferred_shift = soldier_data['preferred_shift']
                 soldier.authorizations = soldier_data['authorizations']
 
@@ -241,6 +247,8 @@ class SoldiersTab:
                         self.company.add_platoon(new_platoon)
 
                 self.refresh_soldiers_list()
+                if self.soldiers_tree.exists(soldier.serial_number):
+                    self.soldiers_tree.selection_set(soldier.serial_number)
                 messagebox.showinfo("Success", "Soldier updated successfully!")
 
     def delete_selected_soldier(self):
@@ -250,19 +258,16 @@ class SoldiersTab:
             messagebox.showwarning("Warning", "Please select a soldier to delete!")
             return
 
-        soldier_name = self.soldiers_tree.item(selection[0])['text']
+        # Rows are keyed by serial number
+        soldier = self.company.get_soldier_by_serial(selection[0])
+        if not soldier:
+            return
 
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete soldier {soldier_name}?"):
-            # Find and remove soldier
-            for platoon in self.company.platoons:
-                for soldier in platoon.soldiers:
-                    if soldier.name == soldier_name:
-                        platoon.remove_soldier(soldier)
-                        self.filtered_soldiers = self.company.get_all_soldiers()
-                        self.refresh_soldiers_list()
-                        self.perform_search()  # Update search results
-                        messagebox.showinfo("Success", "Soldier deleted successfully!")
-                        return
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete soldier {soldier.name}?"):
+            if self.company.remove_soldier(soldier):
+                self.filtered_soldiers = None
+                self.refresh_soldiers_list()
+                messagebox.showinfo("Success", "Soldier deleted successfully!")
 
     def refresh_soldiers_list(self):
         """Refresh the soldiers list display"""
@@ -284,7 +289,7 @@ class SoldiersTab:
 
         for soldier in soldiers_to_show:
             authorizations_str = ", ".join(soldier.authorizations)
-            self.soldiers_tree.insert('', 'end', text=soldier.name,
+            self.soldiers_tree.insert('', 'end', iid=soldier.serial_number, text=soldier.name,
                                       values=(soldier.serial_number, soldier.platoon,
                                               soldier.preferred_shift, authorizations_str))
 
@@ -0,0 +1,71 @@
+from collections import Counter
+from typing import List
+from roster_columns import RosterColumns
+from flow_network import FlowNetwork
+
+
+class StaffingNetwork:
+    """
+    Day-by-day staffing flow networks over soldier classes.
+
+    A class is a platoon and an exact authorization combination, so the networks stay small however large the
+    company is. For a day the network is: source -> mission (capacity: its shift personnel summed) -> every
+    class that qualifies for it and belongs to an assigned platoon (uncapacitated) -> sink (capacity: class
+    members not at home that day). The day can be fully staffed iff the maximum flow equals the total demand.
+    """
+
+    SOURCE = 0
+    SINK = 1
+
+    def __init__(self, columns: RosterColumns, missions: List):
+        self.columns = columns
+        registry = columns.registry
+        index_of = {id(platoon): platoon_id for platoon_id, platoon in enumerate(columns.platoons)}
+        allowed = {}  # Mission name -> platoon ids it is assigned to (absent = any platoon)
+        for platoon in columns.platoons:
+            for mission in platoon.weekly_missions:
+                allowed.setdefault(mission.name, set()).add(index_of[id(platoon)])
+
+        self.missions = [(mission, registry.mask_for(mission.required_authorizations)) for mission in missions
+                         if mission.get_shift_personnel_total() > 0]
+        self.members = Counter(key for key in zip(columns.platoon_ids, columns.authorization_masks,
+                                                  columns.availability) if key[0] >= 0)
+        self.classes = sorted({(platoon_id, mask) for platoon_id, mask, _ in self.members})  # (platoon id, mask)
+        self.eligible = [[position for position, (platoon_id, mask) in enumerate(self.classes)
+                          if mask & required == required and platoon_id in allowed.get(mission.name, (platoon_id,))]
+                         for mission, required in self.missions]
+        self.demand = sum(mission.get_shift_personnel_total() for mission, _ in self.missions)
+
+    def mission_node(self, position: int) -> int:
+        return 2 + position
+
+    def class_node(self, position: int) -> int:
+        return 2 + len(self.missions) + position
+
+    def present(self, day_index: int) -> Counter:
+        """Class -> members not at home on a day"""
+        present = Counter()
+        for (platoon_id, mask, availability), count in self.members.items():
+            if availability >> day_index & 1:
+                present[platoon_id, mask] += count
+        return present
+
+    def build(self, present: Counter):
+        """
+        Build the network for a day's present counts.
+        Returns (network, assignment edges per mission as (class position, edge), sink edge per class).
+        """
+        network = FlowNetwork(2 + len(self.missions) + len(self.classes))
+        assignment_edges = []
+        for position, (mission, _) in enumerate(self.missions):
+            network.add_edge(self.SOURCE, self.mission_node(position), mission.get_shift_personnel_total())
+            assignment_edges.append([(class_position, network.add_edge(self.mission_node(position),
+                                                                       self.class_node(class_position),
+                                                                       FlowNetwork.INFINITE_CAPACITY))
+                                     for class_position in self.eligible[position]])
+        class_edges = [network.add_edge(self.class_node(position), self.SINK, present[key])
+                       for position, key in enumerate(self.classes)]
+        return network, assignment_edges, class_edges
+
+    def __repr__(self):
+        return f"StaffingNetwork(missions={len(self.missions)}, classes={len(self.classes)})"
@@ -0,0 +1,104 @@
+import itertools
+import random
+from assignment import capacitated_assignment
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from soldier import Soldier
+
+
+def brute_force_assignment(costs, capacities):
+    """Cheapest total cost over every way to place the rows (None = unassigned)"""
+    best = 0
+    for choice in itertools.product([None] + list(range(len(capacities))), repeat=len(costs)):
+        if any(column is not None and column not in row_costs for row_costs, column in zip(costs, choice)):
+            continue
+        if any(choice.count(column) > capacity for column, capacity in enumerate(capacities)):
+            continue
+        best = min(best, sum(row_costs[column] for row_costs, column in zip(costs, choice) if column is not None))
+    return best
+
+
+def test_capacitated_assignment_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(200):
+        capacities = [rng.randint(0, 2) for _ in range(rng.randint(1, 3))]
+        costs = [{column: rng.randint(-9, 9) for column in range(len(capacities)) if rng.random() < 0.7}
+                 for _ in range(rng.randint(1, 5))]
+        columns = capacitated_assignment(costs, capacities)
+        assert all(columns.count(column) <= capacity for column, capacity in enumerate(capacities))
+        assert all(column is None or column in row_costs for row_costs, column in zip(costs, columns))
+        total = sum(row_costs[column] for row_costs, column in zip(costs, columns) if column is not None)
+        assert total == brute_force_assignment(costs, capacities)
+
+
+def make_company(rng):
+    company = Company("Random")
+    for index in range(rng.randint(1, 3)):
+        platoon = Platoon(f"P{index}")
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{index}{i}", f"{index}-{i}", platoon.name, "Morning",
+                                      [auth for auth in ("driver", "medic") if rng.random() < 0.3])
+                              for i in range(rng.randint(1, 10))])
+    for index in range(rng.randint(1, 5)):
+        company.add_mission(Mission(f"M{index}", {"Morning": "06:00-14:00"},
+                                    [auth for auth in ("driver", "medic") if rng.random() < 0.3], rng.randint(1, 5)))
+    return company
+
+
+def assignment_value(company, assignments):
+    """(missions covered, total score) with the score of optimize_weekly_schedule"""
+    score = 0
+    for mission_name, platoon_name in assignments.items():
+        mission = next(mission for mission in company.missions if mission.name == mission_name)
+        platoon = company.get_platoon_by_name(platoon_name)
+        capability = company.get_mission_capability(mission, platoon)
+        score += platoon.get_soldier_count() + 2 * sum(capability['details'].values())
+    return len(assignments), score
+
+
+def is_valid(company, assignments, limit):
+    for platoon in company.platoons:
+        held = [mission for mission in company.missions if assignments.get(mission.name) == platoon.name]
+        if sum(mission.daily_personnel for mission in held) > platoon.get_soldier_count():
+            return False
+        if limit is not None and len(held) > limit:
+            return False
+        if not all(company.get_mission_capability(mission, platoon)['can_fulfill'] for mission in held):
+            return False
+    return True
+
+
+def brute_force_value(company, limit):
+    best = (0, 0)
+    names = [None] + [platoon.name for platoon in company.platoons]
+    for choice in itertools.product(names, repeat=len(company.missions)):
+        assignments = {mission.name: name for mission, name in zip(company.missions, choice) if name is not None}
+        if is_valid(company, assignments, limit):
+            best = max(best, assignment_value(company, assignments))
+    return best
+
+
+def test_hungarian_assignment_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(150):
+        company = make_company(rng)
+        limit = rng.choice([None, None, 1, 2])
+        result = company.optimize_weekly_schedule(method="hungarian", max_missions_per_platoon=limit)
+        assert is_valid(company, result['assignments'], limit)
+        assert len(result['assignments']) + len(result['conflicts']) == len(company.missions)
+        assert assignment_value(company, result['assignments']) == brute_force_value(company, limit)
+
+
+def test_personnel_budget_is_shared_between_missions():
+    """p1 takes the two large missions and the small one, leaving the four-soldier mission to p0"""
+    company = Company("Test")
+    for name, size in (("p0", 4), ("p1", 12)):
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}-{i}", name, "Morning", []) for i in range(size)])
+    for name, size in (("m0", 5), ("m1", 4), ("m2", 5), ("m3", 1)):
+        company.add_mission(Mission(name, {"Morning": "06:00-14:00"}, [], size))
+    result = company.optimize_weekly_schedule(method="hungarian")
+    assert result['conflicts'] == []
+    assert result['assignments'] == {'m0': 'p1', 'm1': 'p0', 'm2': 'p1', 'm3': 'p1'}
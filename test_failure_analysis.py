@@ -0,0 +1,65 @@
+import random
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from soldier import Soldier, WEEK_DAYS
+
+
+def make_company():
+    """Two platoons of two guards; the gate mission (2 a day) is assigned to platoon '1'"""
+    company = Company("Test")
+    for name in "12":
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard"]) for i in range(2)])
+    company.add_mission(Mission("Gate", {"Morning": "06:00-14:00"}, ["guard"], 2))
+    company.assign_mission_to_platoon("Gate", "1")
+    return company
+
+
+def test_assigned_platoon_at_strength_is_critical():
+    result = make_company().find_single_points_of_failure()['company']
+    assert result['unstaffable_days'] == []
+    assert sorted(entry['serial_number'] for entry in result['critical_soldiers']) == ["10", "11"]
+
+
+def test_removed_platoon_leaves_no_unstaffable_days():
+    company = make_company()
+    company.get_roster_columns()
+    company.remove_platoon(company.get_platoon_by_name("1"))
+    result = company.find_single_points_of_failure()['company']
+    assert result['unstaffable_days'] == []
+    assert sorted(entry['serial_number'] for entry in result['critical_soldiers']) == ["20", "21"]
+
+
+def test_critical_soldiers_match_removing_each_soldier():
+    """A soldier is critical on a day iff the day is staffable with them and short without them"""
+    rng = random.Random(7)
+    for _ in range(40):
+        company = Company("Random")
+        for name in "123":
+            platoon = Platoon(name)
+            company.add_platoon(platoon)
+            for i in range(rng.randint(1, 3)):
+                soldier = Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning",
+                                  [auth for auth in ("guard", "medic") if rng.random() < 0.6])
+                soldier.set_home_time_constraints({day: 'home' for day in WEEK_DAYS if rng.random() < 0.2})
+                platoon.add_soldier(soldier)
+        company.add_mission(Mission("Gate", {"Morning": "06:00-14:00"}, ["guard"], rng.randint(1, 2)))
+        company.add_mission(Mission("Aid", {"Morning": "06:00-14:00"}, ["medic"], 1))
+        if rng.random() < 0.5:
+            company.assign_mission_to_platoon("Gate", rng.choice("123"))
+
+        result = company.find_single_points_of_failure()['company']
+        short = {explanation['day'] for explanation in company.explain_staffing_failure()['explanations']}
+        assert set(result['unstaffable_days']) == short
+
+        found = {(entry['serial_number'], day) for entry in result['critical_soldiers'] for day in entry['days']}
+        expected = set()
+        for soldier in [soldier for platoon in company.platoons for soldier in platoon.soldiers]:
+            constraints = dict(soldier.home_time_constraints)
+            soldier.set_home_time_constraints({day: 'home' for day in WEEK_DAYS})
+            without = {explanation['day'] for explanation in company.explain_staffing_failure()['explanations']}
+            soldier.set_home_time_constraints(constraints)
+            expected.update((soldier.serial_number, day) for day in without - short if day not in constraints)
+        assert found == expected
@@ -0,0 +1,46 @@
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from soldier import Soldier
+
+
+def make_company():
+    """Two platoons of two guards; the gate mission (one morning guard) is assigned to platoon '1'"""
+    company = Company("Test")
+    for name in "12":
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard"]) for i in range(2)])
+    company.add_mission(Mission("Gate", {"Morning": "06:00-14:00"}, ["guard"], 1))
+    company.assign_mission_to_platoon("Gate", "1")
+    return company
+
+
+def test_shift_shortfall_is_reported():
+    company = make_company()
+    company.missions[0].set_shift_personnel("Morning", 3)
+    result = company.check_week_feasibility()
+    assert not result['feasible']
+    assert {(shortfall['day'], shortfall['shift'], shortfall['shortage']) for shortfall in result['shortfalls']} \
+        == {(day, "Morning", 1) for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday",
+                                            "Sunday"]}
+
+
+def test_removed_platoon_is_not_an_assignment():
+    """Once the assigned platoon is gone the mission may use any platoon again"""
+    company = make_company()
+    company.get_roster_columns()
+    company.remove_platoon(company.get_platoon_by_name("1"))
+    assert company.check_week_feasibility()['feasible']
+
+
+def test_checks_agree_on_the_shift_demand():
+    """Both checks count the personnel the shifts need, even when daily_personnel was edited on its own"""
+    company = make_company()
+    company.missions[0].daily_personnel = 5
+    assert company.check_week_feasibility()['feasible']
+    assert company.explain_staffing_failure()['feasible']
+
+    company.missions[0].set_shift_personnel("Morning", 3)
+    assert not company.check_week_feasibility()['feasible']
+    assert not company.explain_staffing_failure()['feasible']
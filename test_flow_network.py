@@ -0,0 +1,120 @@
+import itertools
+import random
+from flow_network import FlowNetwork
+
+
+def random_edges(rng, node_count, edge_count, max_capacity=3, max_cost=4):
+    edges = []
+    for _ in range(edge_count):
+        source, target = rng.sample(range(node_count), 2)
+        edges.append((source, target, rng.randint(0, max_capacity), rng.randint(0, max_cost)))
+    return edges
+
+
+def build(node_count, edges):
+    network = FlowNetwork(node_count)
+    for source, target, capacity, cost in edges:
+        network.add_edge(source, target, capacity, cost)
+    return network
+
+
+def brute_force_min_cut(node_count, edges, source, sink):
+    """Smallest capacity over every cut separating source from sink"""
+    others = [node for node in range(node_count) if node not in (source, sink)]
+    best = None
+    for size in range(len(others) + 1):
+        for chosen in itertools.combinations(others, size):
+            side = {source, *chosen}
+            cut = sum(capacity for tail, head, capacity, _ in edges if tail in side and head not in side)
+            best = cut if best is None else min(best, cut)
+    return best
+
+
+def brute_force_min_cost_flow(node_count, edges, source, sink):
+    """(maximum flow, cheapest cost at that flow) over every integer flow within the capacities"""
+    best = (0, 0)
+    for flows in itertools.product(*(range(capacity + 1) for _, _, capacity, _ in edges)):
+        balance = [0] * node_count
+        for (tail, head, _, _), flow in zip(edges, flows):
+            balance[tail] -= flow
+            balance[head] += flow
+        if any(balance[node] for node in range(node_count) if node not in (source, sink)):
+            continue
+        cost = sum(flow * cost for (_, _, _, cost), flow in zip(edges, flows))
+        if (balance[sink], -cost) > (best[0], -best[1]):
+            best = (balance[sink], cost)
+    return best
+
+
+def check_flow(network, source, sink, value):
+    """Capacities and conservation hold, and the flow leaving the source is the reported value"""
+    balance = [0] * len(network.graph)
+    for edge in range(0, len(network.edge_to), 2):
+        flow = network.get_flow(edge)
+        assert 0 <= flow <= network.edge_capacity[edge]
+        balance[network.edge_to[edge ^ 1]] -= flow
+        balance[network.edge_to[edge]] += flow
+    assert all(balance[node] == 0 for node in range(len(balance)) if node not in (source, sink))
+    assert balance[sink] == value == -balance[source]
+
+
+def test_max_flow_matches_brute_force_min_cut():
+    rng = random.Random(1)
+    for _ in range(300):
+        node_count = rng.randint(2, 6)
+        edges = random_edges(rng, node_count, rng.randint(0, 10), max_capacity=5)
+        network = build(node_count, edges)
+        value = network.max_flow(0, 1)
+        assert value == brute_force_min_cut(node_count, edges, 0, 1)
+        check_flow(network, 0, 1, value)
+        assert sum(network.edge_capacity[edge] for edge in network.min_cut_edges(0)) == value
+
+
+def test_min_cost_flow_matches_brute_force():
+    rng = random.Random(2)
+    for _ in range(200):
+        node_count = rng.randint(2, 5)
+        edges = random_edges(rng, node_count, rng.randint(0, 6), max_capacity=2)
+        network = build(node_count, edges)
+        flow, cost = network.min_cost_flow(0, 1)
+        assert (flow, cost) == brute_force_min_cost_flow(node_count, edges, 0, 1)
+        check_flow(network, 0, 1, flow)
+
+
+def test_min_cost_flow_respects_the_flow_limit():
+    network = FlowNetwork(3)
+    network.add_edge(0, 2, 2, 1)
+    network.add_edge(2, 1, 2, 1)
+    network.add_edge(0, 1, 2, 5)
+    assert network.min_cost_flow(0, 1, flow_limit=3) == (3, 2 * 2 + 5)
+
+
+def test_reaching_is_the_reverse_of_reachable_from():
+    rng = random.Random(3)
+    for _ in range(100):
+        node_count = rng.randint(2, 6)
+        network = build(node_count, random_edges(rng, node_count, rng.randint(0, 10)))
+        network.max_flow(0, 1)
+        for node in range(node_count):
+            assert network.reaching(node) == {other for other in range(node_count)
+                                              if node in network.reachable_from(other)}
+
+
+def test_lower_capacity_keeps_the_maximum_flow():
+    """Lowering an edge succeeds exactly when the maximum flow survives it, and keeps a valid flow"""
+    rng = random.Random(4)
+    for _ in range(300):
+        node_count = rng.randint(2, 6)
+        edges = random_edges(rng, node_count, rng.randint(1, 10))
+        network = build(node_count, edges)
+        value = network.max_flow(0, 1)
+        position = rng.randrange(len(edges))
+        lowered = list(edges)
+        source, target, capacity, cost = edges[position]
+        lowered[position] = (source, target, max(capacity - 1, 0), cost)
+        survives = capacity > 0 and build(node_count, lowered).max_flow(0, 1) == value
+
+        assert network.lower_capacity(2 * position) == survives
+        if survives:
+            assert network.edge_capacity[2 * position] == capacity - 1
+        check_flow(network, 0, 1, value)
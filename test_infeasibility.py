@@ -0,0 +1,40 @@
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from soldier import Soldier
+
+
+def make_company():
+    """Two platoons of two guards; the guard mission (2 a day) is assigned to platoon '1'"""
+    company = Company("Test")
+    for name in "12":
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard"]) for i in range(2)])
+    company.add_mission(Mission("Gate", {"Morning": "06:00-14:00"}, ["guard"], 2))
+    company.assign_mission_to_platoon("Gate", "1")
+    return company
+
+
+def test_feasible_week_has_no_explanations():
+    result = make_company().explain_staffing_failure()
+    assert result['feasible'] and result['explanations'] == []
+
+
+def test_short_days_name_the_cut_missions():
+    company = make_company()
+    company.get_platoon_by_name("1").soldiers[0].add_home_time_constraint("Monday", "home")
+    result = company.explain_staffing_failure()
+    assert [explanation['day'] for explanation in result['explanations']] == ["Monday"]
+    explanation = result['explanations'][0]
+    assert explanation['shortage'] == 1
+    assert [entry['mission'] for entry in explanation['missions']] == ["Gate"]
+    assert explanation['qualified_present'] == 1
+
+
+def test_removed_platoon_is_not_an_assignment():
+    """Once the assigned platoon is gone the mission may use any platoon again"""
+    company = make_company()
+    company.get_roster_columns()
+    company.remove_platoon(company.get_platoon_by_name("1"))
+    assert company.explain_staffing_failure()['feasible']
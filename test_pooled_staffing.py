@@ -0,0 +1,66 @@
+import random
+from company import Company
+from flow_network import FlowNetwork
+from mission import Mission
+from platoon import Platoon
+from soldier import Soldier
+
+
+def make_company(rng):
+    company = Company("Random")
+    for index in range(rng.randint(1, 3)):
+        platoon = Platoon(f"P{index}")
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{index}{i}", f"{index}-{i}", platoon.name, "Morning",
+                                      [auth for auth in ("driver", "medic") if rng.random() < 0.5])
+                              for i in range(rng.randint(1, 8))])
+    for index in range(rng.randint(1, 4)):
+        company.add_mission(Mission(f"M{index}", {"Morning": "06:00-14:00"},
+                                    [auth for auth in ("driver", "medic") if rng.random() < 0.3], rng.randint(1, 6)))
+    return company
+
+
+def staffable(platoon, draws):
+    """Whether distinct soldiers of the platoon, each qualified for their mission, can make up the draws"""
+    soldiers = platoon.soldiers
+    network = FlowNetwork(2 + len(draws) + len(soldiers))
+    for position, (mission, count) in enumerate(draws):
+        network.add_edge(0, 2 + position, count)
+        for index, soldier in enumerate(soldiers):
+            if set(mission.required_authorizations) <= set(soldier.authorizations):
+                network.add_edge(2 + position, 2 + len(draws) + index, 1)
+    for index in range(len(soldiers)):
+        network.add_edge(2 + len(draws) + index, 1, 1)
+    return network.max_flow(0, 1) == sum(count for _, count in draws)
+
+
+def test_draws_are_staffable_by_distinct_qualified_soldiers():
+    rng = random.Random(12)
+    for _ in range(100):
+        company = make_company(rng)
+        result = company.plan_pooled_staffing()
+        for mission in company.missions:
+            entry = result['missions'][mission.name]
+            assert entry['staffed'] == sum(entry['platoons'].values()) <= mission.daily_personnel
+            assert entry['shortage'] == mission.daily_personnel - entry['staffed']
+            assert (mission.name in result['unstaffed_missions']) == bool(entry['shortage'])
+            assert (mission.name in result['pooled_missions']) == (len(entry['platoons']) > 1)
+        for platoon in company.platoons:
+            draws = [(mission, result['missions'][mission.name]['platoons'].get(platoon.name, 0))
+                     for mission in company.missions]
+            assert staffable(platoon, draws)
+            assert result['remaining'][platoon.name] == platoon.get_soldier_count() - sum(count for _, count in draws)
+
+
+def test_mission_too_large_for_one_platoon_is_pooled():
+    company = Company("Test")
+    for name in "12":
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard"]) for i in range(3)])
+    company.add_mission(Mission("Gate", {"Morning": "06:00-14:00"}, ["guard"], 5))
+    company.add_mission(Mission("Tower", {"Morning": "06:00-14:00"}, ["guard"], 2))
+    result = company.plan_pooled_staffing()
+    assert result['pooled_missions'] == ["Gate"]
+    assert result['unstaffed_missions'] == ["Tower"]
+    assert result['missions']['Tower']['staffed'] == 1
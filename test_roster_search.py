@@ -0,0 +1,26 @@
+import random
+from roster_search import AnytimeRosterSearch, parallel_roster_search
+from scheduler import ScheduleProblem, WeeklyRoster, evaluate_roster
+from test_scheduler import make_company, check_roster
+
+
+def test_search_keeps_the_hard_rules_and_never_gets_worse():
+    rng = random.Random(8)
+    for seed in range(10):
+        company = make_company(rng)
+        search = AnytimeRosterSearch(ScheduleProblem.from_company(company), seed=seed)
+        best = search.run(0.05)
+        check_roster(company, best)
+        assert search.best_objective <= search.start_objective
+        assert search.best_objective == evaluate_roster(best)['objective']
+
+
+def test_parallel_search_returns_the_best_restart():
+    company = make_company(random.Random(9))
+    problem = ScheduleProblem.from_company(company)
+    result = parallel_roster_search(problem, time_budget=0.1, restarts=2, workers=1)
+    roster = WeeklyRoster.from_dict(problem, result)
+    check_roster(company, roster)
+    assert result['search']['best_objective'] == min(restart['best_objective']
+                                                     for restart in result['search']['restarts'])
+    assert result['summary']['objective'] == result['search']['best_objective']
@@ -0,0 +1,41 @@
+import random
+from rotation_planner import RotationPlanner
+from scheduler import ScheduleProblem, solve_weekly_roster
+from test_scheduler import make_company, filled_per_day
+
+
+def week_problem(problem, leave, week):
+    """The problem of one rotation week with the planned leave taken as home time"""
+    copy = ScheduleProblem.from_dict(problem.to_dict())
+    copy.availability = list(problem.availability)
+    for soldier, serial in enumerate(problem.serials):
+        for day in leave.get(serial, {}).get(f"Week {week + 1}", []):
+            copy.availability[soldier] &= ~(1 << problem.days.index(day))
+    return copy
+
+
+def test_leave_keeps_every_day_manned():
+    rng = random.Random(10)
+    for _ in range(25):
+        company = make_company(rng)
+        problem = ScheduleProblem.from_company(company)
+        weeks = rng.randint(1, 3)
+        cap = rng.choice([None, 2, 3])
+        plan = RotationPlanner(problem, weeks, cap).plan()
+        leave = plan['calendar']
+
+        baseline = filled_per_day(solve_weekly_roster(problem))
+        for week in range(weeks):
+            assert filled_per_day(solve_weekly_roster(week_problem(problem, leave, week))) == baseline
+
+        for soldier, serial in enumerate(problem.serials):
+            fixed = [day for index, day in enumerate(problem.days) if not problem.availability[soldier] >> index & 1]
+            planned = leave[serial]
+            for week in range(weeks):
+                days = planned.get(f"Week {week + 1}", [])
+                assert not set(days) & set(fixed)  # Leave only on days the soldier would be on duty
+                if cap is not None:
+                    assert len(days) + len(fixed) <= max(cap, len(fixed))
+            assert plan['home_days'][serial] == len(fixed) * weeks + sum(len(days) for days in planned.values())
+        assert plan['planned_leave_days'] == sum(len(days) for weeks_off in leave.values()
+                                                 for days in weeks_off.values())
@@ -0,0 +1,60 @@
+from company import Company
+from platoon import Platoon
+from soldier import Soldier
+
+
+def make_company():
+    """Three platoons of two soldiers each (serials '10', '11', '20', ...)"""
+    company = Company("Test")
+    for name in "123":
+        platoon = Platoon(name)
+        company.add_platoon(platoon)
+        platoon.add_soldiers([Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard"]) for i in range(2)])
+    return company
+
+
+def serials_by_platoon(owner):
+    return {platoon.name: [soldier.serial_number for soldier in platoon.soldiers] for platoon in owner.platoons}
+
+
+def test_move_inside_scenario_leaves_company_untouched():
+    """Moving a soldier between scenario platoons never moves the live soldier"""
+    company = make_company()
+    before = serials_by_platoon(company)
+    scenario = company.fork_scenario()
+
+    live = company.get_soldier_by_serial("30")
+    scenario.get_platoon("2").add_soldier(live)
+    shared = scenario.platoons[0].soldiers[0]
+    scenario.get_platoon("3").add_soldier(shared)
+    scenario.move_soldier("21", "1")
+
+    assert serials_by_platoon(company) == before
+    assert live._platoon is company.get_platoon_by_name("3")
+    assert shared._platoon is company.get_platoon_by_name("1")
+    assert serials_by_platoon(scenario) == {'1': ['11', '21'], '2': ['20', '30'], '3': ['31', '10']}
+
+
+def test_duplicate_serial_in_scenario_is_rejected():
+    company = make_company()
+    scenario = company.fork_scenario()
+    try:
+        scenario.get_platoon("1").add_soldier(Soldier("Other", "21", "1", "Morning", []))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("duplicate serial number accepted")
+    assert "21" not in serials_by_platoon(scenario)["1"]
+
+
+def test_parent_edits_after_fork_do_not_reach_child():
+    company = make_company()
+    scenario = company.fork_scenario()
+    scenario.set_home_time("10", "Monday")
+    child = scenario.fork()
+    scenario.set_home_time("10", "Tuesday")
+    child.set_home_time("10", "Friday")
+
+    assert scenario.get_soldier_by_serial("10").home_time_constraints == {'Monday': 'home', 'Tuesday': 'home'}
+    assert child.get_soldier_by_serial("10").home_time_constraints == {'Monday': 'home', 'Friday': 'home'}
+    assert company.get_soldier_by_serial("10").home_time_constraints == {}
@@ -0,0 +1,57 @@
+import os
+import time
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from schedule_cache import ScheduleCache, schedule_fingerprint
+from soldier import Soldier
+
+
+def make_company(order):
+    """The same company, with platoons, soldiers and missions added in the given order"""
+    company = Company("Test")
+    for name in order:
+        company.add_platoon(Platoon(name))
+    for name in order:
+        platoon = company.get_platoon_by_name(name)
+        for i in order:
+            platoon.add_soldier(Soldier(f"S{name}{i}", f"{name}{i}", name, "Morning", ["guard", "driver"][::-1]
+                                        if i == order[0] else ["driver", "guard"]))
+    for name in order:
+        company.add_mission(Mission(f"M{name}", {"Morning": "06:00-14:00"}, ["guard"], 1))
+    return company
+
+
+def test_fingerprint_ignores_load_order_and_follows_content():
+    first = make_company("12")
+    assert schedule_fingerprint(first) == schedule_fingerprint(make_company("21"))
+    before = first.get_schedule_fingerprint()
+    first.get_platoon_by_name("1").soldiers[0].add_home_time_constraint("Monday", "home")
+    assert first.get_schedule_fingerprint() != before
+    assert schedule_fingerprint(first, "next") != schedule_fingerprint(first, "current")
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ScheduleCache(str(tmp_path), max_entries=2)
+    cache.put("a", {'value': 1})
+    cache.put("b", {'value': 2})
+    old = time.time() - 60
+    os.utime(cache._path("a"), (old, old))
+    os.utime(cache._path("b"), (old + 1, old + 1))
+    assert cache.get("a") == {'value': 1}  # Refreshes "a", so "b" is now the oldest
+    cache.put("c", {'value': 3})
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_solver_results_are_reused_until_the_company_changes(tmp_path):
+    company = make_company("12")
+    cache = company.enable_schedule_cache(str(tmp_path))
+    first = company.build_weekly_roster()
+    assert company.build_weekly_roster() == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    company.missions[0].set_shift_personnel("Morning", 2)
+    company.build_weekly_roster()
+    assert (cache.hits, cache.misses) == (1, 2)
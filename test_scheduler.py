@@ -0,0 +1,90 @@
+import random
+from company import Company
+from mission import Mission
+from platoon import Platoon
+from scheduler import ScheduleProblem, WeeklyRoster, solve_weekly_roster, greedy_weekly_roster
+from soldier import Soldier, WEEK_DAYS
+from staffing_network import StaffingNetwork
+
+SHIFTS = {"Morning": "06:00-14:00", "Noon": "14:00-22:00", "Night": "22:00-06:00"}
+
+
+def make_company(rng):
+    """Random company: authorizations, preferred shifts, home time and platoon-assigned missions"""
+    company = Company("Random")
+    for index in range(rng.randint(1, 3)):
+        platoon = Platoon(f"P{index}")
+        company.add_platoon(platoon)
+        for i in range(rng.randint(2, 8)):
+            soldier = Soldier(f"S{index}{i}", f"{index}-{i}", platoon.name, rng.choice(list(SHIFTS)),
+                              [auth for auth in ("driver", "medic", "radio") if rng.random() < 0.4])
+            soldier.set_home_time_constraints({day: 'home' for day in WEEK_DAYS if rng.random() < 0.2})
+            platoon.add_soldier(soldier)
+        if rng.random() < 0.3:
+            platoon.set_home_time_schedule(rng.choice(WEEK_DAYS), 'home')
+    for index in range(rng.randint(1, 4)):
+        shifts = dict(rng.sample(list(SHIFTS.items()), rng.randint(1, 3)))
+        company.add_mission(Mission(f"M{index}", shifts, [auth for auth in ("driver", "medic", "radio")
+                                                           if rng.random() < 0.3], rng.randint(1, 6)))
+        if rng.random() < 0.3:
+            company.assign_mission_to_platoon(f"M{index}", rng.choice(company.platoons).name)
+    return company
+
+
+def check_roster(company, roster: WeeklyRoster):
+    """Hard rules, checked on the model objects: eligibility, availability, one slot a day, no overstaffing"""
+    problem = roster.problem
+    soldiers = {soldier.serial_number: (soldier, platoon) for platoon in company.platoons
+                for soldier in platoon.soldiers}
+    missions = {mission.name: mission for mission in company.missions}
+    for day, day_name in enumerate(problem.days):
+        working = []
+        for mission_index, mission_name in enumerate(problem.mission_names):
+            mission = missions[mission_name]
+            assigned_to = [platoon.name for platoon in company.platoons if mission in platoon.weekly_missions]
+            for shift, shift_name in enumerate(problem.shifts):
+                members = roster.get_assigned(day, shift, mission_index)
+                assert len(members) <= mission.personnel_per_shift.get(shift_name, 0)
+                for member in members:
+                    soldier, platoon = soldiers[problem.serials[member]]
+                    assert set(mission.required_authorizations) <= set(soldier.authorizations)
+                    assert not assigned_to or platoon.name in assigned_to
+                    assert soldier.home_time_constraints.get(day_name) != 'home'
+                    assert platoon.home_time_schedule.get(day_name) != 'home'
+                    working.append(member)
+        assert len(working) == len(set(working))
+
+
+def filled_per_day(roster: WeeklyRoster):
+    return [sum(len(members) for (day, _, _), members in roster.slots.items() if day == index)
+            for index in range(len(roster.problem.days))]
+
+
+def test_rosters_follow_the_hard_rules():
+    rng = random.Random(5)
+    for _ in range(60):
+        company = make_company(rng)
+        problem = ScheduleProblem.from_company(company)
+        check_roster(company, solve_weekly_roster(problem))
+        check_roster(company, greedy_weekly_roster(problem, random.Random(1)))
+
+
+def test_min_cost_flow_roster_fills_every_staffable_slot():
+    """Each day fills as many slots as the staffing network's maximum flow allows"""
+    rng = random.Random(6)
+    for _ in range(60):
+        company = make_company(rng)
+        roster = solve_weekly_roster(ScheduleProblem.from_company(company))
+        staffing = StaffingNetwork(company.get_roster_columns(), company.missions)
+        for day, filled in enumerate(filled_per_day(roster)):
+            network, _, _ = staffing.build(staffing.present(day))
+            assert filled == network.max_flow(staffing.SOURCE, staffing.SINK)
+
+
+def test_roster_round_trips_through_to_dict():
+    company = make_company(random.Random(7))
+    problem = ScheduleProblem.from_company(company)
+    roster = solve_weekly_roster(problem)
+    rebuilt = WeeklyRoster.from_dict(ScheduleProblem.from_dict(problem.to_dict()), roster.to_dict())
+    assert {slot: sorted(members) for slot, members in rebuilt.slots.items() if members} == \
+        {slot: sorted(members) for slot, members in roster.slots.items() if members}
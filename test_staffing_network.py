@@ -0,0 +1,34 @@
+import random
+from flow_network import FlowNetwork
+from soldier import WEEK_DAYS
+from staffing_network import StaffingNetwork
+from test_scheduler import make_company
+
+
+def soldier_level_flow(company, day):
+    """Maximum staffing of a day with one node per soldier (no classes)"""
+    soldiers = [(soldier, platoon) for platoon in company.platoons for soldier in platoon.soldiers
+                if soldier.home_time_constraints.get(day) != 'home' and platoon.home_time_schedule.get(day) != 'home']
+    missions = company.missions
+    network = FlowNetwork(2 + len(missions) + len(soldiers))
+    for position, mission in enumerate(missions):
+        network.add_edge(0, 2 + position, sum(mission.personnel_per_shift.values()))
+        assigned = [platoon for platoon in company.platoons if mission in platoon.weekly_missions]
+        for index, (soldier, platoon) in enumerate(soldiers):
+            if set(mission.required_authorizations) <= set(soldier.authorizations) and \
+                    (not assigned or platoon in assigned):
+                network.add_edge(2 + position, 2 + len(missions) + index, 1)
+    for index in range(len(soldiers)):
+        network.add_edge(2 + len(missions) + index, 1, 1)
+    return network.max_flow(0, 1)
+
+
+def test_class_network_matches_soldier_network():
+    rng = random.Random(13)
+    for _ in range(60):
+        company = make_company(rng)
+        staffing = StaffingNetwork(company.get_roster_columns(), company.missions)
+        assert staffing.demand == sum(sum(mission.personnel_per_shift.values()) for mission in company.missions)
+        for day_index, day in enumerate(WEEK_DAYS):
+            network, _, _ = staffing.build(staffing.present(day_index))
+            assert network.max_flow(staffing.SOURCE, staffing.SINK) == soldier_level_flow(company, day)
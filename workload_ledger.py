@@ -0,0 +1,94 @@
+from typing import List, Dict
+from shift_intervals import MINUTES_PER_DAY
+
+NIGHT_END_MINUTE = 6 * 60  # Shifts running past midnight or starting before 06:00 count as night shifts
+NIGHT_SHIFT_WEIGHT = 4.0  # Extra load hours charged per night shift
+
+
+class WorkloadLedger:
+    """
+    Cumulative workload per soldier across weeks: hours worked, shifts and night shifts.
+
+    Each recorded week is kept separately, so recording a week again replaces its earlier figures instead of
+    counting them twice. Totals are maintained incrementally for the scheduler's load lookups.
+    """
+
+    def __init__(self):
+        self.weeks = {}  # Week -> {serial number: [hours, shifts, night shifts]}
+        self.totals = {}  # Serial number -> [hours, shifts, night shifts] over all recorded weeks
+
+    @staticmethod
+    def is_night_shift(start: int, end: int) -> bool:
+        """Check if a (start, end) minute interval is a night shift"""
+        return end > MINUTES_PER_DAY or start < NIGHT_END_MINUTE
+
+    def record_week(self, week: str, workload: Dict[str, List[float]]):
+        """Record (or replace) one week of serial number -> [hours, shifts, night shifts]"""
+        self.remove_week(week)
+        self.weeks[week] = workload
+        for serial, entry in workload.items():
+            total = self.totals.setdefault(serial, [0.0, 0, 0])
+            for index, value in enumerate(entry):
+                total[index] += value
+
+    def remove_week(self, week: str):
+        """Drop a recorded week from the totals"""
+        workload = self.weeks.pop(week, None)
+        for serial, entry in (workload or {}).items():
+            total = self.totals[serial]
+            for index, value in enumerate(entry):
+                total[index] -= value
+            if not total[1]:
+                del self.totals[serial]
+
+    def record_roster(self, roster):
+        """Record a scheduler.WeeklyRoster under its problem's week"""
+        problem = roster.problem
+        workload = {}
+        for (_, shift, mission), members in roster.slots.items():
+            intervals = problem.mission_intervals[mission]
+            interval = intervals[shift] if shift < len(intervals) else None
+            hours = (interval[1] - interval[0]) / 60 if interval else 0.0
+            night = 1 if interval and self.is_night_shift(*interval) else 0
+            for soldier in members:
+                entry = workload.setdefault(problem.serials[soldier], [0.0, 0, 0])
+                entry[0] += hours
+                entry[1] += 1
+                entry[2] += night
+        self.record_week(problem.week, workload)
+
+    def get_hours(self, serial_number: str) -> float:
+        return self.totals.get(serial_number, (0.0, 0, 0))[0]
+
+    def get_night_shifts(self, serial_number: str) -> int:
+        return self.totals.get(serial_number, (0.0, 0, 0))[2]
+
+    def get_load(self, serial_number: str) -> float:
+        """Cumulative load: hours worked plus a surcharge per night shift"""
+        hours, _, nights = self.totals.get(serial_number, (0.0, 0, 0))
+        return hours + NIGHT_SHIFT_WEIGHT * nights
+
+    def get_loads(self, serial_numbers: List[str]) -> List[float]:
+        """Loads for a list of serial numbers (e.g. ScheduleProblem.serials)"""
+        return [self.get_load(serial) for serial in serial_numbers]
+
+    def rename_soldier(self, old_serial: str, new_serial: str):
+        """Carry a soldier's history over to a new serial number"""
+        for workload in [*self.weeks.values(), self.totals]:
+            if old_serial in workload:
+                workload[new_serial] = workload.pop(old_serial)
+
+    def to_dict(self) -> Dict:
+        """Convert ledger to dictionary for serialization (totals are rebuilt on load)"""
+        return {'weeks': self.weeks}
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """Create ledger from dictionary"""
+        ledger = cls()
+        for week, workload in data.get('weeks', {}).items():
+            ledger.record_week(week, {serial: list(entry) for serial, entry in workload.items()})
+        return ledger
+
+    def __repr__(self):
+        return f"WorkloadLedger(weeks={len(self.weeks)}, soldiers={len(self.totals)})"